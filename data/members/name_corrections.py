@@ -28,3 +28,4 @@ NAME_CORRECTIONS = {
 
 # 2025.9월 삭제 처리 -> ['뭉이완댜', '차닝', '다곰', '타기는 야옹', '일산슈퍼스타']
 # 2025.10월 삭제 처리 -> ['핑퐁당', '고양이랑', '꿀꿀한 롱롱', '바라기아들', '동동']
+# (탈퇴 시점은 helpers/members_history.json의 활동 구간으로 관리)
@@ -1,5 +1,8 @@
 # decorators/__init__.py
-from .plugin_decorator import register_plugin_method, PLUGIN_METHODS
+from .plugin_decorator import register_plugin_method, PLUGIN_METHODS, PluginRegistry, use_registry
+from .plugin_cache import clear_plugin_caches
+from .plugin_stats import PLUGIN_STATS, is_tracing_enabled
 
 # 해당 모듈에서 사용할 수 있는 모든 요소를 정의
-__all__ = ['register_plugin_method', 'PLUGIN_METHODS']
+__all__ = ['register_plugin_method', 'PLUGIN_METHODS', 'PluginRegistry', 'use_registry',
+           'clear_plugin_caches', 'PLUGIN_STATS', 'is_tracing_enabled']
@@ -0,0 +1,160 @@
+# decorators/plugin_cache.py
+
+import functools
+import inspect
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional, Tuple, Union
+
+from decorators.plugin_stats import resolve_plugin_path
+
+DEFAULT_CACHE_SIZE = 128
+
+# 의존 파일 목록: 고정 경로 목록 또는 메서드 인자를 받아 경로 목록을 반환하는 함수
+DependsOn = Union[Iterable[str], Callable[..., Iterable[str]]]
+
+_MISSING = object()
+
+
+class PluginMethodCache:
+    """
+    LRU cache of a single plugin method's results with optional TTL and file dependencies.
+
+    An entry is dropped when it is older than the TTL or when any file it depends on has a
+    different mtime or size than when the entry was stored.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Any, Tuple[Any, float, Tuple]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, dependencies: Tuple[str, ...]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at, signature = entry
+                expired = self.ttl is not None and time.monotonic() - stored_at >= self.ttl
+                if not expired and signature == _file_signature(dependencies):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return _MISSING
+
+    def put(self, key: Any, value: Any, signature: Tuple) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic(), signature)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# clear_plugin_caches()로 한 번에 비우기 위해 생성된 캐시를 추적
+_CACHES: "weakref.WeakSet[PluginMethodCache]" = weakref.WeakSet()
+
+
+def clear_plugin_caches() -> None:
+    """Clears every memoized plugin method result in the process."""
+    for cache in list(_CACHES):
+        cache.clear()
+
+
+def memoize_plugin_method(func: Callable, cache_size: Optional[int] = None, ttl: Optional[float] = None,
+                          depends_on: Optional[DependsOn] = None) -> Callable:
+    """
+    Wraps a plugin method so its results are memoized per process.
+
+    Args:
+        func (Callable): The plugin method, sync or async. Its arguments must be hashable to be
+            cached; calls with unhashable arguments bypass the cache.
+        cache_size (Optional[int]): Maximum number of cached results (LRU eviction).
+        ttl (Optional[float]): Seconds after which a cached result expires.
+        depends_on (Optional[DependsOn]): Files whose mtime/size invalidate the cache, either as
+            a list of paths or a callable receiving the method arguments. Relative paths are
+            resolved against the directory of the module defining the method.
+
+    Returns:
+        Callable: The memoizing wrapper. `wrapper.cache` exposes the PluginMethodCache.
+
+    Note:
+        The cached object itself is returned to every caller (no copy). A dependency change only
+        produces fresh results if `func` reads the dependency again rather than an in-memory cache.
+    """
+    cache = PluginMethodCache(cache_size or DEFAULT_CACHE_SIZE, ttl)
+    _CACHES.add(cache)
+    static_dependencies = None if callable(depends_on) else tuple(
+        resolve_plugin_path(func, path) for path in (depends_on or ())
+    )
+
+    def lookup(args, kwargs):
+        """캐시 키와 의존 파일 목록을 계산. 인자를 해시할 수 없으면 키는 None"""
+        try:
+            key = (args, frozenset(kwargs.items())) if kwargs else args
+            hash(key)
+        except TypeError:
+            return None, ()
+
+        if static_dependencies is not None:
+            return key, static_dependencies
+        return key, tuple(resolve_plugin_path(func, path) for path in depends_on(*args, **kwargs))
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            key, dependencies = lookup(args, kwargs)
+            if key is None:
+                return await func(*args, **kwargs)
+
+            value = cache.get(key, dependencies)
+            if value is _MISSING:
+                signature = _file_signature(dependencies)
+                value = await func(*args, **kwargs)
+                cache.put(key, value, signature)
+            return value
+
+        async_wrapper.cache = cache
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key, dependencies = lookup(args, kwargs)
+        if key is None:
+            return func(*args, **kwargs)
+
+        value = cache.get(key, dependencies)
+        if value is _MISSING:
+            # 파일 서명은 계산 전에 읽어야 계산 도중 변경된 파일을 놓치지 않음
+            signature = _file_signature(dependencies)
+            value = func(*args, **kwargs)
+            cache.put(key, value, signature)
+        return value
+
+    wrapper.cache = cache
+    return wrapper
+
+
+def _file_signature(paths: Tuple[str, ...]) -> Tuple:
+    """의존 파일들의 (mtime_ns, size) 목록. 없는 파일은 None으로 표시"""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
@@ -1,35 +1,129 @@
 # decorators/plugin_decorator.py
 
+import inspect
 import logging
-from typing import Callable, Dict, List
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Optional
+
+from decorators.plugin_cache import DependsOn, memoize_plugin_method
+from decorators.plugin_stats import is_tracing_enabled, trace_plugin_method
 
 logger = logging.getLogger(__name__)
 
-PLUGIN_METHODS: Dict[str, List[str]] = {}
 
+class PluginRegistry(Dict[str, List[str]]):
+    """
+    Plugin name -> registered method names.
 
-def register_plugin_method(plugin_name: str) -> Callable:
+    Each PluginLoader owns one; the decorator writes into whichever registry is active in the
+    current context (see use_registry), and PLUGIN_METHODS is the process-wide default.
     """
-    Decorator to register a plugin's method.
+
+    def register(self, plugin_name: str, method_name: str) -> None:
+        if plugin_name not in self:
+            self[plugin_name] = []
+            logger.debug(f"Plugin '{plugin_name}' registered in plugin registry.")
+
+        if method_name not in self[plugin_name]:
+            self[plugin_name].append(method_name)
+            logger.debug(f"Method '{method_name}' registered for plugin '{plugin_name}'.")
+
+    def merge(self, plugins: Dict[str, List[str]]) -> None:
+        for plugin_name, methods in plugins.items():
+            for method_name in methods:
+                self.register(plugin_name, method_name)
+
+
+PLUGIN_METHODS = PluginRegistry()
+
+_ACTIVE_REGISTRY: ContextVar[PluginRegistry] = ContextVar("active_plugin_registry", default=PLUGIN_METHODS)
+
+
+def get_active_registry() -> PluginRegistry:
+    """Returns the registry the decorator currently writes into."""
+    return _ACTIVE_REGISTRY.get()
+
+
+@contextmanager
+def use_registry(registry: PluginRegistry) -> Iterator[PluginRegistry]:
+    """
+    Makes registry the target of register_plugin_method within the block (per thread/task).
+    """
+    token = _ACTIVE_REGISTRY.set(registry)
+    try:
+        yield registry
+    finally:
+        _ACTIVE_REGISTRY.reset(token)
+
+# 데코레이터가 등록한 함수에 남기는 플러그인 이름 표시
+PLUGIN_NAME_ATTR = "__plugin_name__"
+
+
+def register_plugin_method(plugin_name: str, trace_io: Optional[str] = None, cache_size: Optional[int] = None,
+                           cache_ttl: Optional[float] = None, depends_on: Optional[DependsOn] = None) -> Callable:
+    """
+    Decorator to register a plugin's method into the active plugin registry.
+
+    When tracing is enabled (PLUGIN_TRACE=1 at process start) the method is wrapped to record
+    call statistics; otherwise it is returned unchanged, so the hot path costs nothing.
+    Giving any of the cache options memoizes the method's results per process. Memoized results
+    are shared by every caller, so methods returning mutable objects must be treated as read-only,
+    and depends_on only helps when the method itself re-reads those files on a miss (not when it
+    reads a class-level cache filled from them).
 
     Args:
         plugin_name (str): The name of the plugin.
+        trace_io (Optional[str]): 'read' or 'write' to also count the bytes of the file
+            passed as the first argument while tracing.
+        cache_size (Optional[int]): Maximum number of memoized results (LRU eviction).
+        cache_ttl (Optional[float]): Seconds after which a memoized result expires.
+        depends_on (Optional[DependsOn]): Files whose mtime/size change invalidates memoized
+            results, or a callable mapping the method arguments to such files.
 
     Returns:
         Callable: The decorator function.
     """
 
     def decorator(func: Callable) -> Callable:
-        if plugin_name not in PLUGIN_METHODS:
-            PLUGIN_METHODS[plugin_name] = []
-            logger.debug(f"Plugin '{plugin_name}' registered in PLUGIN_METHODS.")
+        get_active_registry().register(plugin_name, func.__name__)
 
-        if func.__name__ not in PLUGIN_METHODS[plugin_name]:
-            PLUGIN_METHODS[plugin_name].append(func.__name__)
-            logger.debug(f"Method '{func.__name__}' registered for plugin '{plugin_name}'.")
-        # else:
-        #     logger.warning(f"Method '{func.__name__}' is already registered for plugin '{plugin_name}'.")
+        if cache_size is not None or cache_ttl is not None or depends_on is not None:
+            func = memoize_plugin_method(func, cache_size, cache_ttl, depends_on)
 
+        if is_tracing_enabled():
+            func = trace_plugin_method(func, plugin_name, trace_io)
+
+        setattr(func, PLUGIN_NAME_ATTR, plugin_name)
         return func
 
     return decorator
+
+
+def collect_plugin_methods(module: ModuleType) -> Dict[str, List[str]]:
+    """
+    Collects the plugin methods declared in an already imported module.
+
+    The decorator only runs when a module is executed, so a module that is reused
+    from sys.modules has to be scanned for the marked functions instead.
+
+    Args:
+        module (ModuleType): The plugin module.
+
+    Returns:
+        Dict[str, List[str]]: Plugin names mapped to their method names.
+    """
+    collected: Dict[str, List[str]] = {}
+    for _, cls in inspect.getmembers(module, inspect.isclass):
+        if cls.__module__ != module.__name__:
+            continue
+        for attr_name, attr in vars(cls).items():
+            func = getattr(attr, "__func__", attr)
+            plugin_name = getattr(func, PLUGIN_NAME_ATTR, None)
+            if plugin_name is None:
+                continue
+            methods = collected.setdefault(plugin_name, [])
+            if attr_name not in methods:
+                methods.append(attr_name)
+    return collected
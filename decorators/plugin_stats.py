@@ -0,0 +1,176 @@
+# decorators/plugin_stats.py
+
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+# 프로세스 시작 전에 PLUGIN_TRACE=1 로 설정해야 데코레이터가 메서드를 감쌉니다.
+TRACE_ENV_VAR = "PLUGIN_TRACE"
+# p50/p99 계산에 사용하는 최근 호출 시간 샘플 수
+STATS_SAMPLE_LIMIT = 10000
+
+TRACE_IO_READ = "read"
+TRACE_IO_WRITE = "write"
+
+
+def is_tracing_enabled() -> bool:
+    """Returns True if plugin call tracing is enabled through the environment."""
+    return os.environ.get(TRACE_ENV_VAR, "").lower() not in ("", "0", "false", "no")
+
+
+class MethodStats:
+    """
+    Call statistics of a single plugin method.
+    """
+
+    __slots__ = ("calls", "errors", "total_time", "bytes_read", "bytes_written", "samples", "_lock")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.samples: Deque[float] = deque(maxlen=STATS_SAMPLE_LIMIT)
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float, failed: bool = False, bytes_read: int = 0, bytes_written: int = 0) -> None:
+        with self._lock:
+            self.calls += 1
+            self.errors += int(failed)
+            self.total_time += elapsed
+            self.bytes_read += bytes_read
+            self.bytes_written += bytes_written
+            self.samples.append(elapsed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = sorted(self.samples)
+            result = {
+                "calls": self.calls,
+                "errors": self.errors,
+                "total_time": self.total_time,
+                "p50": self._percentile(samples, 0.50),
+                "p99": self._percentile(samples, 0.99),
+                "bytes_read": self.bytes_read,
+                "bytes_written": self.bytes_written,
+            }
+        return result
+
+    @staticmethod
+    def _percentile(samples, fraction: float) -> float:
+        if not samples:
+            return 0.0
+        index = min(len(samples) - 1, int(round(fraction * (len(samples) - 1))))
+        return samples[index]
+
+
+class PluginStatsCollector:
+    """
+    Process-wide collection of MethodStats keyed by '<plugin_name>.<method_name>'.
+    """
+
+    def __init__(self):
+        self._stats: Dict[str, MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> MethodStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(key, MethodStats())
+        return stats
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {key: stats.to_dict() for key, stats in sorted(self._stats.items())}
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=4)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+PLUGIN_STATS = PluginStatsCollector()
+
+
+def trace_plugin_method(func: Callable, plugin_name: str, trace_io: Optional[str] = None) -> Callable:
+    """
+    Wraps a plugin method to record call count, wall time and optionally file I/O bytes.
+
+    Args:
+        func (Callable): The plugin method.
+        plugin_name (str): The name of the plugin.
+        trace_io (Optional[str]): 'read' or 'write' to count the size of the file or folder
+            passed as the first argument. Relative paths are resolved against the directory
+            of the module defining the method, as FileUtils does.
+
+    Returns:
+        Callable: The wrapped method.
+    """
+    stats = PLUGIN_STATS.get(f"{plugin_name}.{func.__name__}")
+    perf_counter = time.perf_counter
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            bytes_read = _path_size(func, args) if trace_io == TRACE_IO_READ else 0
+            failed = True
+            start = perf_counter()
+            try:
+                result = await func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                elapsed = perf_counter() - start
+                bytes_written = _path_size(func, args) if trace_io == TRACE_IO_WRITE and not failed else 0
+                stats.record(elapsed, failed, bytes_read, bytes_written)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bytes_read = _path_size(func, args) if trace_io == TRACE_IO_READ else 0
+        failed = True
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = perf_counter() - start
+            bytes_written = _path_size(func, args) if trace_io == TRACE_IO_WRITE and not failed else 0
+            stats.record(elapsed, failed, bytes_read, bytes_written)
+
+    return wrapper
+
+
+def resolve_plugin_path(func: Callable, path: Any) -> str:
+    """상대 경로를 플러그인 메서드가 정의된 모듈의 디렉토리 기준 절대 경로로 변환"""
+    path = os.fspath(path)
+    if os.path.isabs(path):
+        return path
+    module = sys.modules.get(func.__module__)
+    base_dir = os.path.dirname(getattr(module, "__file__", "") or "")
+    return os.path.abspath(os.path.join(base_dir, path))
+
+
+def _path_size(func: Callable, args: tuple) -> int:
+    """첫 번째 인자로 전달된 파일(또는 폴더 내 JSON 파일)의 크기를 반환"""
+    if not args or not isinstance(args[0], (str, os.PathLike)):
+        return 0
+    path = resolve_plugin_path(func, args[0])
+    try:
+        if os.path.isdir(path):
+            with os.scandir(path) as entries:
+                return sum(entry.stat().st_size for entry in entries if entry.name.endswith('.json'))
+        return os.path.getsize(path)
+    except OSError:
+        return 0
@@ -1,5 +1,21 @@
 # helpers/__init__.py
-from .file_utils import FileUtils
-from .members_utils import MembersUtils
+import importlib
 
-__all__ = ['FileUtils', 'MembersUtils']
+# 패키지 임포트 시 모든 플러그인 모듈(polars 등 의존성 포함)을 실행하지 않도록 지연 임포트
+_LAZY_EXPORTS = {
+    'BatchWriter': '.batch_writer',
+    'FileUtils': '.file_utils',
+    'MembersUtils': '.members_utils',
+    'NameCorrector': '.name_corrector',
+}
+
+__all__ = ['BatchWriter', 'FileUtils', 'MembersUtils', 'NameCorrector']
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
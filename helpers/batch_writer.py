@@ -0,0 +1,152 @@
+# helpers/batch_writer.py
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from decorators.plugin_decorator import register_plugin_method
+from helpers.file_utils import FileUtils
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class BatchWriter:
+    """여러 DataFrame 결과 파일을 백그라운드 스레드 풀에서 저장하는 플러그인."""
+
+    # 파일 저장과 다음 게임 계산이 겹칠 수 있을 만큼의 기본 스레드 수
+    DEFAULT_MAX_WORKERS = 4
+    DEPENDS_ON = ['file_utils']
+
+    @staticmethod
+    def initialize():
+        logger.debug("batch_writer 플러그인이 초기화되었습니다.")
+
+    @staticmethod
+    @register_plugin_method('batch_writer')
+    def open_batch(max_workers=None, formats=None, skip_unchanged=False):
+        """
+        결과 파일을 모아서 저장하는 ResultBatch를 생성
+
+        Args:
+            max_workers (Optional[int]): 저장에 사용할 스레드 수 (기본값: DEFAULT_MAX_WORKERS)
+            formats (Optional[Union[str, list]]): 저장 형식. 지정하지 않으면 FILE_UTILS_RESULT_FORMAT 설정을 따름
+            skip_unchanged (bool): True이면 JSON 결과가 기존 파일과 같을 때 쓰지 않음
+
+        Returns:
+            ResultBatch: with 블록이 끝날 때 모든 파일을 저장하고, 실패가 있으면 BatchWriteError를 발생
+        """
+        return ResultBatch(max_workers or BatchWriter.DEFAULT_MAX_WORKERS, formats, skip_unchanged)
+
+    @staticmethod
+    @register_plugin_method('batch_writer')
+    def write_all(items, max_workers=None, formats=None, skip_unchanged=False):
+        """
+        (파일 경로, DataFrame) 목록을 동시에 저장
+
+        Args:
+            items (Iterable[Tuple[str, pl.DataFrame]]): 저장할 파일 경로와 DataFrame
+            max_workers (Optional[int]): 저장에 사용할 스레드 수
+            formats (Optional[Union[str, list]]): 저장 형식
+            skip_unchanged (bool): True이면 JSON 결과가 기존 파일과 같을 때 쓰지 않음
+
+        Returns:
+            list: 저장된 파일 경로 목록 (입력 순서)
+        """
+        with BatchWriter.open_batch(max_workers, formats, skip_unchanged) as batch:
+            for output_file_path, data_frame in items:
+                batch.submit(output_file_path, data_frame)
+        return batch.saved_paths
+
+
+class BatchWriteError(Exception):
+    """배치 저장 중 실패한 파일들을 모은 오류. errors는 {파일 경로: 예외}."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        details = "; ".join(f"{path}: {error}" for path, error in errors.items())
+        super().__init__(f"{len(errors)}개 파일 저장 실패: {details}")
+
+
+class ResultBatch:
+    """
+    submit()한 DataFrame을 스레드 풀에서 임시 파일에 쓴 뒤 이름을 바꿔 저장합니다.
+
+    저장 도중 중단되어도 기존 결과 파일이 반쯤 쓰인 상태로 남지 않습니다. flush()는 모든 저장이
+    끝날 때까지 기다리고, 실패한 파일이 있으면 하나의 BatchWriteError로 알립니다.
+    """
+
+    def __init__(self, max_workers, formats=None, skip_unchanged=False):
+        self.formats = formats
+        self.skip_unchanged = skip_unchanged
+        self.saved_paths = []
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch-writer")
+        self._futures = []
+
+    def submit(self, output_file_path, data_frame):
+        """DataFrame 저장을 예약하고 바로 반환 (설정된 형식마다 파일 하나)"""
+        for data_format, path in FileUtils.get_output_paths(output_file_path, self.formats):
+            future = self._executor.submit(self._write_atomic, data_format, path, data_frame, self.skip_unchanged)
+            self._futures.append((path, future))
+
+    def flush(self):
+        """
+        예약된 저장이 모두 끝날 때까지 기다림
+
+        Raises:
+            BatchWriteError: 하나 이상의 파일 저장에 실패한 경우
+        """
+        futures, self._futures = self._futures, []
+        errors = {}
+        for path, future in futures:
+            try:
+                future.result()
+                self.saved_paths.append(path)
+            except Exception as e:
+                errors[path] = e
+        if errors:
+            logger.error(f"{len(futures)}개 중 {len(errors)}개 파일을 저장하지 못했습니다.")
+            raise BatchWriteError(errors)
+        logger.info(f"{len(futures)}개 결과 파일 저장 완료")
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.flush()
+            else:
+                # with 블록에서 이미 예외가 발생했다면 저장은 마치되 원래 예외를 그대로 전달
+                try:
+                    self.flush()
+                except BatchWriteError as e:
+                    logger.error(f"배치 저장 오류: {e}")
+        finally:
+            self.close()
+        return False
+
+    @staticmethod
+    def _write_atomic(data_format, path, data_frame, skip_unchanged=False):
+        """같은 폴더의 임시 파일에 저장한 뒤 os.replace로 교체"""
+        if data_format == 'json':
+            # JSON은 기존 파일과 비교한 뒤 바뀐 경우에만 교체
+            FileUtils.save_to_json(path, data_frame, skip_unchanged=skip_unchanged, atomic=True)
+            return
+
+        folder, file_name = os.path.split(FileUtils.get_absolute_path(path))
+        os.makedirs(folder, exist_ok=True)
+        final_path = os.path.join(folder, file_name)
+        tmp_path = os.path.join(folder, f".{file_name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            FileUtils.get_data_frame_writer(data_format)(tmp_path, data_frame)
+            os.replace(tmp_path, final_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
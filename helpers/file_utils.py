@@ -1,21 +1,71 @@
 import os
 import json
+import functools
+import hashlib
 import logging
+import multiprocessing
+import threading
+import time
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, groupby
 from decorators.plugin_decorator import register_plugin_method
 
+try:
+    import orjson  # 선택 의존성: 설치되어 있으면 JSON 인코딩/디코딩에 사용
+except ImportError:
+    orjson = None
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 사용할 JSON 백엔드를 강제로 지정 (예: FILE_UTILS_JSON_BACKEND=json)
+JSON_BACKEND_ENV_VAR = "FILE_UTILS_JSON_BACKEND"
+
+# DataFrame 저장/로드 형식과 확장자
+DATA_FORMAT_EXTENSIONS = {'json': '.json', 'ndjson': '.ndjson', 'parquet': '.parquet', 'ipc': '.arrow'}
+# 입력 파일 형식 (예: FILE_UTILS_INPUT_FORMAT=parquet)
+INPUT_FORMAT_ENV_VAR = "FILE_UTILS_INPUT_FORMAT"
+# 결과 파일 형식, 쉼표로 여러 개 지정 가능 (예: FILE_UTILS_RESULT_FORMAT=parquet,json)
+RESULT_FORMAT_ENV_VAR = "FILE_UTILS_RESULT_FORMAT"
+DEFAULT_DATA_FORMAT = 'json'
+
+# 파싱 결과를 Arrow IPC로 저장하는 디스크 캐시 위치와 최대 크기.
+# 둘 중 하나라도 설정해야 사용하며 (기본값: 사용 안 함), 최대 크기가 0이면 사용하지 않음
+PARSE_CACHE_DIR_ENV_VAR = "FILE_UTILS_PARSE_CACHE_DIR"
+PARSE_CACHE_MAX_BYTES_ENV_VAR = "FILE_UTILS_PARSE_CACHE_MAX_BYTES"
+DEFAULT_PARSE_CACHE_DIR = os.path.join(os.path.dirname(__file__), '__pycache__', 'json_parse_cache')
+DEFAULT_PARSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# 월별 백업 아카이브 (zip: 파일마다 압축되고 중앙 디렉토리가 색인 역할을 하므로 파일 하나만 바로 읽을 수 있음)
+ARCHIVE_EXTENSION = '.zip'
+ARCHIVE_COMPRESSIONS = {'lzma': zipfile.ZIP_LZMA, 'deflate': zipfile.ZIP_DEFLATED}
+
+
+class ArchiveMember(namedtuple('ArchiveMember', ['archive_path', 'name'])):
+    """아카이브 안의 JSON 파일 하나. 폴더의 파일 경로와 같은 자리에 사용"""
+
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{self.archive_path}:{self.name}"
+
 
 class FileUtils:
+    # use_processes=True 일 때 이 크기 이상의 파일만 프로세스 풀에서 파싱 (작은 파일은 전송 비용이 더 큼)
+    PROCESS_PARSE_MIN_BYTES = 1024 * 1024
+    # iter_json_records가 파일에서 한 번에 읽는 문자 수
+    STREAM_CHUNK_SIZE = 64 * 1024
+
     @staticmethod
     def initialize():
         """플러그인 초기화"""
         logger.info("file_utils 플러그인이 초기화되었습니다.")
 
     @staticmethod
-    @register_plugin_method('file_utils')
+    @register_plugin_method('file_utils', trace_io='read')
     def load_single_json(file_path):
         """단일 JSON 파일을 읽어 데이터를 반환하는 함수"""
         try:
@@ -32,51 +82,664 @@ class FileUtils:
             raise
 
     @staticmethod
-    @register_plugin_method('file_utils')
-    def save_single_json(output_file_path, data):
-        """단일 JSON 파일을 저장하는 함수"""
+    @register_plugin_method('file_utils', trace_io='write')
+    def save_single_json(output_file_path, data, pretty=True, skip_unchanged=False):
+        """
+        단일 JSON 파일을 저장하는 함수
+
+        Args:
+            output_file_path (str): 저장할 파일 경로
+            data: 저장할 데이터
+            pretty (bool): True이면 기존과 같은 indent=4 형식, False이면 공백 없는 compact 형식으로 저장
+            skip_unchanged (bool): True이면 기존 파일과 내용이 같을 때 쓰지 않음 (mtime 유지)
+
+        Returns:
+            bool: 파일을 썼으면 True, 내용이 같아 건너뛰었으면 False
+        """
         try:
             output_file_path = FileUtils._prepare_output_path(output_file_path)
-            with open(output_file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-            logger.info(f"JSON 데이터가 {output_file_path}에 저장되었습니다.")
+            written = FileUtils._write_output(output_file_path, get_json_codec().dumps(data, pretty=pretty), skip_unchanged)
+            if written:
+                logger.info(f"JSON 데이터가 {output_file_path}에 저장되었습니다.")
+            return written
         except Exception as e:
             logger.error(f"JSON 파일 저장 중 오류 발생: {e}", exc_info=True)
             raise
 
     @staticmethod
-    @register_plugin_method('file_utils')
-    def save_to_json(output_file_path, data_frame):
-        """DataFrame을 JSON 파일로 저장하는 함수"""
+    @register_plugin_method('file_utils', trace_io='write')
+    def save_to_json(output_file_path, data_frame, skip_unchanged=False, atomic=False):
+        """
+        DataFrame을 JSON 파일로 저장하는 함수
+
+        Args:
+            output_file_path (str): 저장할 파일 경로
+            data_frame (pl.DataFrame): 저장할 DataFrame
+            skip_unchanged (bool): True이면 기존 파일과 내용이 같을 때 쓰지 않음 (mtime 유지)
+            atomic (bool): True이면 임시 파일에 쓴 뒤 이름을 바꿔 교체
+
+        Returns:
+            bool: 파일을 썼으면 True, 내용이 같아 건너뛰었으면 False
+        """
         try:
             output_file_path = FileUtils._prepare_output_path(output_file_path)
-            data_frame.write_json(output_file_path)  # 데이터프레임을 JSON으로 저장
-            logger.info(f"JSON 결과가 {output_file_path}에 저장되었습니다.")
+            # 데이터프레임을 JSON으로 직렬화한 뒤 저장
+            payload = data_frame.write_json().encode('utf-8')
+            written = FileUtils._write_output(output_file_path, payload, skip_unchanged, atomic)
+            if written:
+                logger.info(f"JSON 결과가 {output_file_path}에 저장되었습니다.")
+            return written
         except Exception as e:
             logger.error(f"JSON 파일 저장 중 오류 발생: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    @register_plugin_method('file_utils', trace_io='write')
+    def save_to_ndjson(output_file_path, data_frame):
+        """DataFrame을 한 줄에 레코드 하나인 NDJSON 파일로 저장하는 함수"""
+        try:
+            output_file_path = FileUtils._prepare_output_path(output_file_path)
+            data_frame.write_ndjson(output_file_path)
+            logger.info(f"NDJSON 결과가 {output_file_path}에 저장되었습니다.")
+        except Exception as e:
+            logger.error(f"NDJSON 파일 저장 중 오류 발생: {e}", exc_info=True)
+            raise
+
+    @staticmethod
+    @register_plugin_method('file_utils')
+    def convert_to_ndjson(path_or_folder, output_folder=None):
+        """
+        배열 형식의 JSON 파일(또는 폴더 내 모든 JSON 파일)을 NDJSON 파일로 변환하는 함수
+
+        iter_json_records로 레코드를 하나씩 읽어 바로 쓰므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+
+        Args:
+            path_or_folder (str): 변환할 JSON 파일 또는 폴더 경로
+            output_folder (Optional[str]): 저장할 폴더 (기본값: 원본 파일과 같은 폴더)
+
+        Returns:
+            list: 저장된 NDJSON 파일 경로 목록
+        """
+        path = FileUtils.get_absolute_path(path_or_folder)
+        json_files = FileUtils._get_json_files(path) if os.path.isdir(path) else [path]
+        codec = get_json_codec()
+
+        saved_paths = []
+        for json_file in json_files:
+            folder = FileUtils.get_absolute_path(output_folder) if output_folder else os.path.dirname(json_file)
+            output_path = os.path.join(folder, os.path.splitext(os.path.basename(json_file))[0] + '.ndjson')
+            os.makedirs(folder, exist_ok=True)
+            tmp_path = f"{output_path}.tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    for record in FileUtils.iter_json_records(json_file):
+                        f.write(codec.dumps(record, pretty=False))
+                        f.write(b'\n')
+                os.replace(tmp_path, output_path)
+            except Exception as e:
+                logger.error(f"NDJSON 변환 중 오류 발생 {json_file}: {e}", exc_info=True)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            logger.info(f"{json_file} -> {output_path} 변환 완료")
+            saved_paths.append(output_path)
+        return saved_paths
+
     @staticmethod
     @register_plugin_method('file_utils')
-    def load_json_files_from_folder(folder_path):
-        """지정된 폴더 내의 모든 JSON 파일을 읽어 데이터로 반환"""
+    def scan_battles(path_or_folder='../data/battles_rank', include_file_paths=None):
+        """
+        NDJSON 배틀 파일을 polars LazyFrame으로 스캔하는 함수
+
+        filter/select는 collect() 시점에 리더로 전달되므로 필요한 행과 열만 읽고, 행마다 파이썬 객체를 만들지 않습니다.
+
+        Args:
+            path_or_folder (str): NDJSON 파일 또는 폴더 경로 (폴더는 파일 이름 순서로 스캔)
+            include_file_paths (Optional[str]): 지정하면 각 행의 원본 파일 경로를 이 이름의 열로 추가
+
+        Returns:
+            pl.LazyFrame: 배틀 레코드 (rank, name, score, member_id)
+        """
+        import polars as pl
+
+        path = FileUtils.get_absolute_path(path_or_folder)
+        if os.path.isdir(path):
+            ndjson_files = [os.path.join(path, f) for f in sorted(os.listdir(path)) if f.endswith('.ndjson')]
+        elif os.path.exists(path):
+            ndjson_files = [path]
+        else:
+            raise FileNotFoundError(f"파일 또는 폴더를 찾을 수 없습니다: {path}")
+        if not ndjson_files:
+            raise FileNotFoundError(f"{path}에 NDJSON 파일이 없습니다. convert_to_ndjson으로 먼저 변환하세요.")
+
+        # 파일마다 추론한 타입이 달라지지 않도록 주요 열의 타입을 고정
+        schema_overrides = {'rank': pl.Int64, 'score': pl.Int64, 'member_id': pl.Int64}
+        options = {'include_file_paths': include_file_paths} if include_file_paths else {}
+        return pl.scan_ndjson(ndjson_files, schema_overrides=schema_overrides, **options)
+
+    @staticmethod
+    @register_plugin_method('file_utils', trace_io='read')
+    def load_battles(folder_path, max_workers=None):
+        """
+        FILE_UTILS_INPUT_FORMAT에 맞는 방식으로 배틀 데이터를 LazyFrame으로 읽는 함수
+
+        ndjson이면 scan_battles로 스캔하여 필터와 열 선택이 리더에서 처리되고, parquet/ipc면 해당 확장자 파일을
+        load_data_frame으로 읽고, json이면 load_json_files_from_folder로 읽습니다 (월별 아카이브 포함).
+
+        Args:
+            folder_path (str): 배틀 파일 폴더 경로
+            max_workers (Optional[int]): JSON 파일을 동시에 읽을 스레드 수
+
+        Returns:
+            Optional[pl.LazyFrame]: 배틀 레코드. 데이터가 없으면 None
+        """
+        import polars as pl
+
+        extension = FileUtils.get_input_extension()
+        if extension == '.ndjson':
+            return FileUtils.scan_battles(folder_path)
+        if extension != '.json':
+            battles_df = FileUtils.load_data_frames_from_folder(folder_path, extension)
+            return battles_df.lazy() if battles_df is not None else None
+
+        all_data = FileUtils.load_json_files_from_folder(folder_path, max_workers=max_workers)
+        return pl.DataFrame(all_data).lazy() if all_data else None
+
+    @staticmethod
+    @register_plugin_method('file_utils', trace_io='write')
+    def save_to_parquet(output_file_path, data_frame, compression='zstd'):
+        """DataFrame을 Parquet 파일로 저장하는 함수 (열 단위 압축, 필요한 열만 읽기 가능)"""
         try:
-            folder_path = FileUtils.get_absolute_path(folder_path)
-            if not os.path.exists(folder_path):
-                raise FileNotFoundError(f"폴더를 찾을 수 없습니다: {folder_path}")
+            output_file_path = FileUtils._prepare_output_path(output_file_path)
+            data_frame.write_parquet(output_file_path, compression=compression)
+            logger.info(f"Parquet 결과가 {output_file_path}에 저장되었습니다.")
+        except Exception as e:
+            logger.error(f"Parquet 파일 저장 중 오류 발생: {e}", exc_info=True)
+            raise
 
-            json_files = FileUtils._get_json_files(folder_path)
-            if not json_files:
-                logger.warning(f"{folder_path}에 JSON 파일이 없습니다.")
+    @staticmethod
+    @register_plugin_method('file_utils', trace_io='write')
+    def save_to_ipc(output_file_path, data_frame, compression='uncompressed'):
+        """DataFrame을 Arrow IPC 파일로 저장하는 함수 (압축하지 않으면 읽을 때 메모리 매핑 가능)"""
+        try:
+            output_file_path = FileUtils._prepare_output_path(output_file_path)
+            data_frame.write_ipc(output_file_path, compression=compression)
+            logger.info(f"Arrow IPC 결과가 {output_file_path}에 저장되었습니다.")
+        except Exception as e:
+            logger.error(f"Arrow IPC 파일 저장 중 오류 발생: {e}", exc_info=True)
+            raise
 
-            all_data = FileUtils._load_all_json_files(json_files)
+    @staticmethod
+    @register_plugin_method('file_utils', trace_io='read')
+    def load_parquet(file_path, columns=None):
+        """Parquet 파일을 DataFrame으로 읽는 함수. columns를 지정하면 해당 열만 읽음"""
+        import polars as pl
+
+        file_path = FileUtils.get_absolute_path(file_path)
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+        return pl.read_parquet(file_path, columns=columns)
+
+    @staticmethod
+    @register_plugin_method('file_utils', trace_io='read')
+    def load_ipc(file_path, columns=None):
+        """Arrow IPC 파일을 DataFrame으로 읽는 함수. 압축하지 않은 파일은 polars가 메모리 매핑하여 필요한 열만 읽음"""
+        import polars as pl
+
+        file_path = FileUtils.get_absolute_path(file_path)
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+        return pl.read_ipc(file_path, columns=columns)
+
+    @staticmethod
+    @register_plugin_method('file_utils')
+    def save_data_frame(output_file_path, data_frame, formats=None, skip_unchanged=False):
+        """
+        DataFrame을 설정된 형식으로 저장하는 함수
+
+        Args:
+            output_file_path (str): 저장할 파일 경로. 확장자는 각 형식에 맞게 바뀜
+            data_frame (pl.DataFrame): 저장할 DataFrame
+            formats (Optional[Union[str, list]]): 'json', 'ndjson', 'parquet', 'ipc' 중 하나 이상 (쉼표 구분 문자열 가능).
+                지정하지 않으면 FILE_UTILS_RESULT_FORMAT 환경 변수, 그것도 없으면 'json'
+            skip_unchanged (bool): True이면 JSON 결과가 기존 파일과 같을 때 쓰지 않음
+
+        Returns:
+            list: 저장된 파일 경로 목록
+        """
+        saved_paths = []
+        for data_format, path in FileUtils.get_output_paths(output_file_path, formats):
+            FileUtils.get_data_frame_writer(data_format, skip_unchanged)(path, data_frame)
+            saved_paths.append(path)
+        return saved_paths
+
+    @staticmethod
+    @register_plugin_method('file_utils', trace_io='read')
+    def load_data_frame(file_path, columns=None):
+        """
+        확장자(.json, .ndjson, .parquet, .arrow)에 맞는 방식으로 파일을 DataFrame으로 읽는 함수
+
+        Args:
+            file_path (str): 읽을 파일 경로
+            columns (Optional[list]): 읽을 열 목록. 열 단위 형식은 해당 열만 디스크에서 읽음
+
+        Returns:
+            pl.DataFrame: 읽은 데이터
+        """
+        import polars as pl
+
+        data_format = FileUtils._format_from_path(file_path)
+        if data_format == 'parquet':
+            return FileUtils.load_parquet(file_path, columns)
+        if data_format == 'ipc':
+            return FileUtils.load_ipc(file_path, columns)
+        if data_format == 'ndjson':
+            data_frame = pl.scan_ndjson(FileUtils.get_absolute_path(file_path))
+            return (data_frame.select(columns) if columns else data_frame).collect()
+
+        parse_cache = get_parse_cache()
+        if parse_cache is None:
+            data_frame = pl.DataFrame(FileUtils.load_single_json(file_path))
+            return data_frame.select(columns) if columns else data_frame
+
+        # 같은 파일을 다시 읽으면 JSON 파싱 대신 캐시된 Arrow IPC 파일을 메모리 매핑하여 읽음
+        return parse_cache.load_or_parse(
+            FileUtils.get_absolute_path(file_path),
+            lambda: pl.DataFrame(FileUtils.load_single_json(file_path)),
+            columns
+        )
+
+    @staticmethod
+    @register_plugin_method('file_utils', trace_io='read')
+    def load_data_frames_from_folder(folder_path, extension=None, columns=None):
+        """
+        폴더 안에서 확장자가 같은 파일을 파일 이름 순서로 load_data_frame으로 읽어 하나의 DataFrame으로 합치는 함수
+
+        Args:
+            folder_path (str): 파일이 있는 폴더 경로
+            extension (Optional[str]): 읽을 파일 확장자 (기본값: get_input_extension())
+            columns (Optional[list]): 읽을 열 목록
+
+        Returns:
+            Optional[pl.DataFrame]: 합친 데이터. 파일이 없으면 None
+        """
+        import polars as pl
+
+        folder_path = FileUtils.get_absolute_path(folder_path)
+        if not os.path.isdir(folder_path):
+            raise FileNotFoundError(f"폴더를 찾을 수 없습니다: {folder_path}")
+        extension = extension or FileUtils.get_input_extension()
+        file_names = sorted(f for f in os.listdir(folder_path) if f.endswith(extension))
+        if not file_names:
+            logger.warning(f"{folder_path}에 {extension} 파일이 없습니다.")
+            return None
+
+        data_frames = [FileUtils.load_data_frame(os.path.join(folder_path, f), columns) for f in file_names]
+        # 파일마다 열 구성이나 타입이 조금씩 달라도 합칠 수 있도록 diagonal_relaxed 사용
+        return pl.concat(data_frames, how='diagonal_relaxed')
+
+    @staticmethod
+    @register_plugin_method('file_utils')
+    def get_input_extension():
+        """FILE_UTILS_INPUT_FORMAT 환경 변수에 설정된 입력 형식의 확장자를 반환 (기본값: .json)"""
+        data_format = os.environ.get(INPUT_FORMAT_ENV_VAR) or DEFAULT_DATA_FORMAT
+        if data_format not in DATA_FORMAT_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {data_format}")
+        return DATA_FORMAT_EXTENSIONS[data_format]
+
+    @staticmethod
+    def get_output_paths(output_file_path, formats=None):
+        """결과 형식별 (형식, 확장자를 바꾼 파일 경로) 목록을 반환"""
+        base_path = os.path.splitext(output_file_path)[0]
+        return [(data_format, base_path + DATA_FORMAT_EXTENSIONS[data_format])
+                for data_format in FileUtils.get_result_formats(formats)]
+
+    @staticmethod
+    def get_data_frame_writer(data_format, skip_unchanged=False):
+        """형식에 맞는 DataFrame 저장 함수 (output_file_path, data_frame)를 반환. skip_unchanged는 JSON에만 적용"""
+        writers = {
+            'json': functools.partial(FileUtils.save_to_json, skip_unchanged=skip_unchanged),
+            'ndjson': FileUtils.save_to_ndjson,
+            'parquet': FileUtils.save_to_parquet,
+            'ipc': FileUtils.save_to_ipc,
+        }
+        return writers[data_format]
+
+    @staticmethod
+    def get_result_formats(formats=None):
+        """저장할 결과 형식 목록을 반환. 지정하지 않으면 FILE_UTILS_RESULT_FORMAT 환경 변수 사용"""
+        formats = formats or os.environ.get(RESULT_FORMAT_ENV_VAR) or DEFAULT_DATA_FORMAT
+        if isinstance(formats, str):
+            formats = [data_format.strip() for data_format in formats.split(',') if data_format.strip()]
+        unknown = [data_format for data_format in formats if data_format not in DATA_FORMAT_EXTENSIONS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {', '.join(unknown)}")
+        return list(dict.fromkeys(formats))
+
+    @staticmethod
+    def _format_from_path(file_path):
+        extension = os.path.splitext(file_path)[1].lower()
+        for data_format, format_extension in DATA_FORMAT_EXTENSIONS.items():
+            if extension == format_extension:
+                return data_format
+        raise ValueError(f"확장자로 파일 형식을 알 수 없습니다: {file_path}")
+
+    @staticmethod
+    @register_plugin_method('file_utils', trace_io='read')
+    def load_json_files_from_folder(folder_path, max_workers=None, use_processes=False, errors=None):
+        """
+        지정된 폴더 내의 모든 JSON 파일을 읽어 데이터로 반환
+
+        Args:
+            folder_path (str): JSON 파일이 있는 폴더 경로
+            max_workers (Optional[int]): 2 이상이면 스레드 풀로 파일을 동시에 읽음 (기본값: 순차 처리)
+            use_processes (bool): True이면 PROCESS_PARSE_MIN_BYTES 이상의 큰 파일은 프로세스 풀에서 파싱
+            errors (Optional[dict]): 전달하면 읽지 못한 파일의 {파일 경로: 오류 메시지}를 기록
+
+        Returns:
+            list: 파일 이름 순서대로 이어 붙인 데이터
+        """
+        return FileUtils.load_json_files_from_folders([folder_path], max_workers, use_processes, errors)
+
+    @staticmethod
+    @register_plugin_method('file_utils', trace_io='read')
+    def load_json_files_from_folders(folder_paths, max_workers=None, use_processes=False, errors=None):
+        """
+        여러 폴더의 JSON 파일을 한 번에 읽어 데이터로 반환 (예: 한 시즌의 월별 백업 폴더 전체)
+
+        Args:
+            folder_paths (list): 폴더 또는 월별 아카이브(.zip) 경로 목록. 결과는 폴더 순서, 폴더 안에서는 파일 이름 순서를 따름.
+                폴더가 없고 같은 이름의 .zip이 있으면 아카이브에서 읽음
+            max_workers (Optional[int]): 2 이상이면 스레드 풀로 파일을 동시에 읽음 (기본값: 순차 처리)
+            use_processes (bool): True이면 PROCESS_PARSE_MIN_BYTES 이상의 큰 파일은 프로세스 풀에서 파싱
+            errors (Optional[dict]): 전달하면 읽지 못한 파일의 {파일 경로: 오류 메시지}를 기록
+
+        Returns:
+            list: 모든 파일의 데이터를 이어 붙인 리스트
+        """
+        try:
+            json_files = []
+            for folder_path in folder_paths:
+                folder_path = FileUtils.get_absolute_path(folder_path)
+                # 폴더가 아카이브로 옮겨졌으면 같은 이름의 .zip에서 읽음
+                if not os.path.exists(folder_path) and os.path.exists(folder_path + ARCHIVE_EXTENSION):
+                    folder_path += ARCHIVE_EXTENSION
+                if not os.path.exists(folder_path):
+                    raise FileNotFoundError(f"폴더를 찾을 수 없습니다: {folder_path}")
+
+                if folder_path.endswith(ARCHIVE_EXTENSION):
+                    folder_files = [ArchiveMember(folder_path, name) for name in FileUtils.list_archive(folder_path)]
+                else:
+                    folder_files = FileUtils._get_json_files(folder_path)
+                if not folder_files:
+                    logger.warning(f"{folder_path}에 JSON 파일이 없습니다.")
+                json_files.extend(folder_files)
+
+            all_data = FileUtils._load_all_json_files(json_files, max_workers, use_processes, errors)
             if not all_data:
-                logger.warning(f"{folder_path}에서 유효한 데이터가 없습니다.")
+                logger.warning(f"{', '.join(map(str, folder_paths))}에서 유효한 데이터가 없습니다.")
             return all_data
         except Exception as e:
             logger.error(f"JSON 파일을 불러오는 중 오류 발생: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    @register_plugin_method('file_utils')
+    def archive_folder(folder_path, archive_path=None, compression='lzma', remove_source=False):
+        """
+        폴더의 JSON 파일들을 압축 아카이브 하나로 묶는 함수 (예: battles_2410/ -> battles_2410.zip)
+
+        임시 파일에 쓴 뒤 모든 파일의 CRC와 내용을 확인하고 이름을 바꾸므로, 실패해도 기존 아카이브와 폴더는 그대로입니다.
+
+        Args:
+            folder_path (str): 묶을 폴더 경로
+            archive_path (Optional[str]): 아카이브 경로 (기본값: 폴더 경로 + .zip)
+            compression (str): 'lzma' (작은 크기) 또는 'deflate' (zlib, 빠른 압축/해제)
+            remove_source (bool): True이면 확인이 끝난 뒤 원본 JSON 파일과 빈 폴더를 삭제
+
+        Returns:
+            str: 아카이브 경로
+        """
+        if compression not in ARCHIVE_COMPRESSIONS:
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression} (사용 가능: {', '.join(ARCHIVE_COMPRESSIONS)})")
+        folder_path = FileUtils.get_absolute_path(folder_path)
+        if not os.path.isdir(folder_path):
+            raise FileNotFoundError(f"폴더를 찾을 수 없습니다: {folder_path}")
+        archive_path = FileUtils.get_absolute_path(archive_path) if archive_path else folder_path + ARCHIVE_EXTENSION
+
+        json_files = FileUtils._get_json_files(folder_path)
+        tmp_path = f"{archive_path}.{os.getpid()}.tmp"
+        try:
+            with zipfile.ZipFile(tmp_path, 'w', compression=ARCHIVE_COMPRESSIONS[compression]) as archive:
+                for json_file in json_files:
+                    archive.write(json_file, arcname=os.path.basename(json_file))
+            with zipfile.ZipFile(tmp_path) as archive:
+                bad_member = archive.testzip()
+                if bad_member is not None:
+                    raise IOError(f"아카이브 검증 실패: {bad_member}")
+                for json_file in json_files:
+                    with open(json_file, 'rb') as f:
+                        if archive.read(os.path.basename(json_file)) != f.read():
+                            raise IOError(f"아카이브 내용이 원본과 다릅니다: {json_file}")
+            os.replace(tmp_path, archive_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        original_size = sum(os.path.getsize(json_file) for json_file in json_files)
+        logger.info(f"{folder_path}의 JSON 파일 {len(json_files)}개를 {archive_path}에 저장했습니다 "
+                    f"({original_size} -> {os.path.getsize(archive_path)} bytes)")
+
+        if remove_source:
+            for json_file in json_files:
+                os.remove(json_file)
+            if not os.listdir(folder_path):
+                os.rmdir(folder_path)
+        return archive_path
+
+    @staticmethod
+    @register_plugin_method('file_utils')
+    def list_archive(archive_path):
+        """아카이브 안의 JSON 파일 이름 목록을 이름 순서로 반환 (압축 해제 없이 색인만 읽음)"""
+        with zipfile.ZipFile(FileUtils.get_absolute_path(archive_path)) as archive:
+            return sorted(name for name in archive.namelist() if name.endswith('.json'))
+
+    @staticmethod
+    @register_plugin_method('file_utils', trace_io='read')
+    def load_json_from_archive(archive_path, file_name):
+        """
+        아카이브에서 JSON 파일 하나만 압축 해제하여 읽는 함수
+
+        Args:
+            archive_path (str): 월별 아카이브 경로
+            file_name (str): 아카이브 안의 파일 이름 (예: battle_20241006.json)
+
+        Returns:
+            파싱된 JSON 데이터
+        """
+        data, error = FileUtils._read_json_file(ArchiveMember(FileUtils.get_absolute_path(archive_path), file_name))
+        if error is not None:
+            raise IOError(f"아카이브 파일 읽기 오류 {archive_path}:{file_name}: {error}")
+        return data
+
+    @staticmethod
+    @register_plugin_method('file_utils')
+    def iter_json_records(path_or_folder, batch_size=None, errors=None):
+        """
+        JSON 파일(또는 폴더 내 모든 JSON 파일)의 레코드를 하나씩 읽어 내보내는 제너레이터
+
+        파일 전체를 파싱하지 않고 최상위 배열의 원소를 순서대로 디코딩하므로, 여러 해의 기록을
+        훑어도 메모리 사용량은 배치 하나 크기로 유지됩니다. 최상위 값이 배열이 아니면 그 값 하나를 내보냅니다.
+
+        Args:
+            path_or_folder (str): JSON 파일 또는 폴더 경로. 폴더는 파일 이름 순서로 읽음
+            batch_size (Optional[int]): 지정하면 레코드를 이 크기의 리스트로 묶어 내보냄 (pl.DataFrame(batch)에 바로 사용 가능)
+            errors (Optional[dict]): 전달하면 읽다가 실패한 파일의 {파일 경로: 오류 메시지}를 기록하고 다음 파일로 진행.
+                실패한 파일에서 이미 내보낸 레코드는 취소되지 않음
+
+        Yields:
+            dict 또는 list: 레코드 하나, 또는 batch_size개 이하의 레코드 리스트
+        """
+        path = FileUtils.get_absolute_path(path_or_folder)
+        if os.path.isdir(path):
+            json_files = FileUtils._get_json_files(path)
+        elif os.path.exists(path):
+            json_files = [path]
+        else:
+            raise FileNotFoundError(f"파일 또는 폴더를 찾을 수 없습니다: {path}")
+
+        records = FileUtils._iter_files_records(json_files, errors)
+        if not batch_size:
+            yield from records
+            return
+
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _iter_files_records(json_files, errors=None):
+        """여러 파일의 레코드를 차례로 내보냄. errors가 없으면 첫 오류에서 예외를 그대로 전달"""
+        for json_file in json_files:
+            try:
+                yield from FileUtils._iter_json_array(json_file)
+            except (OSError, ValueError) as e:
+                logger.error(f"JSON 파일 읽기 오류 {json_file}: {e}")
+                if errors is None:
+                    raise
+                errors[json_file] = f"{type(e).__name__}: {e}"
+
+    @staticmethod
+    def _iter_json_array(file_path):
+        """최상위 JSON 배열의 원소를 청크 단위로 읽으면서 하나씩 디코딩"""
+        decoder = json.JSONDecoder()
+        chunk_size = FileUtils.STREAM_CHUNK_SIZE
+        with open(file_path, 'r', encoding='utf-8') as f:
+            buffer = f.read(chunk_size)
+            eof = not buffer
+            pos = FileUtils._skip_whitespace(buffer, 0)
+            while pos == len(buffer) and not eof:
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                pos = FileUtils._skip_whitespace(buffer, pos)
+
+            if not buffer.startswith('[', pos):
+                # 배열이 아닌 JSON(예: members.json)은 통째로 읽어 한 번에 반환
+                yield json.loads(buffer + f.read())
+                return
+
+            pos += 1
+            first = True
+            expect_value = True  # '[' 또는 ',' 직후에는 값이 와야 함
+            while True:
+                pos = FileUtils._skip_whitespace(buffer, pos)
+                if pos == len(buffer):
+                    if eof:
+                        raise json.JSONDecodeError("JSON 배열이 완결되지 않았습니다", buffer, pos)
+                    chunk = f.read(chunk_size)
+                    eof = not chunk
+                    buffer += chunk
+                    continue
+
+                char = buffer[pos]
+                if char == ']' and (first or not expect_value):
+                    return
+                if not expect_value:
+                    if char != ',':
+                        raise json.JSONDecodeError("',' 또는 ']'가 필요합니다", buffer, pos)
+                    expect_value = True
+                    pos += 1
+                    continue
+
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    end = None
+                # 청크 끝에서 끝난 값(예: 잘린 숫자)은 다음 청크를 읽은 뒤 다시 디코딩
+                if end is not None and (end < len(buffer) or eof):
+                    yield value
+                    first = expect_value = False
+                    pos = end
+                    if pos > chunk_size:
+                        buffer, pos = buffer[pos:], 0
+                    continue
+
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+
+    @staticmethod
+    def _skip_whitespace(buffer, pos):
+        while pos < len(buffer) and buffer[pos] in ' \t\n\r':
+            pos += 1
+        return pos
+
+    @staticmethod
+    @register_plugin_method('file_utils')
+    def get_write_stats():
+        """JSON 저장 결과 집계를 반환 ({'written': 쓴 파일 수, 'skipped': 내용이 같아 건너뛴 파일 수})"""
+        return WRITE_STATS.snapshot()
+
+    @staticmethod
+    @register_plugin_method('file_utils')
+    def reset_write_stats():
+        WRITE_STATS.reset()
+
+    @staticmethod
+    def file_sha256(file_path):
+        """파일 내용의 sha256. 파일이 없거나 읽을 수 없으면 None"""
+        digest = hashlib.sha256()
+        try:
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    @staticmethod
+    def _write_output(output_file_path, payload, skip_unchanged=False, atomic=False):
+        """payload(bytes)를 파일에 씀. skip_unchanged이면 기존 파일과 크기와 내용 해시가 같을 때 건너뜀"""
+        if skip_unchanged and FileUtils._has_content(output_file_path, payload):
+            WRITE_STATS.record(skipped=True)
+            logger.info(f"{output_file_path}의 내용이 같아 저장을 건너뜁니다.")
+            return False
+
+        if atomic:
+            folder, file_name = os.path.split(output_file_path)
+            tmp_path = os.path.join(folder, f".{file_name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, output_file_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        else:
+            with open(output_file_path, 'wb') as f:
+                f.write(payload)
+        WRITE_STATS.record(skipped=False)
+        return True
+
+    @staticmethod
+    def _has_content(file_path, payload):
+        try:
+            if os.path.getsize(file_path) != len(payload):
+                return False
+        except OSError:
+            return False
+        return FileUtils.file_sha256(file_path) == hashlib.sha256(payload).hexdigest()
+
     @staticmethod
     def get_absolute_path(relative_path):
         """주어진 상대 경로를 절대 경로로 변환"""
@@ -95,31 +758,417 @@ class FileUtils:
 
     @staticmethod
     def _get_json_files(folder_path):
-        """지정된 폴더에서 JSON 파일 목록을 반환"""
-        json_files = [os.path.join(folder_path, f) for f in os.listdir(folder_path) if f.endswith('.json')]
+        """지정된 폴더에서 JSON 파일 목록을 파일 이름 순서로 반환"""
+        json_files = [os.path.join(folder_path, f) for f in sorted(os.listdir(folder_path)) if f.endswith('.json')]
         logger.debug(f"폴더 {folder_path}에서 {len(json_files)}개의 JSON 파일을 발견했습니다.")
         return json_files
 
     @staticmethod
-    def _load_all_json_files(json_files):
-        """모든 JSON 파일을 읽어 데이터를 반환"""
-        all_data = []
-        for json_file in json_files:
-            data = FileUtils._load_json_file(json_file)
-            if data:
-                all_data.extend(data)
-        return all_data
+    def _load_all_json_files(json_files, max_workers=None, use_processes=False, errors=None):
+        """모든 JSON 파일을 읽어 입력 순서대로 데이터를 반환. 실패한 파일은 errors에 기록"""
+        batches = FileUtils._group_by_archive(json_files)
+        if max_workers and max_workers > 1 and len(batches) > 1:
+            results = FileUtils._read_json_files_concurrently(batches, max_workers, use_processes)
+        else:
+            results = list(chain.from_iterable(FileUtils._read_json_batch(batch) for batch in batches))
+
+        failed = {}
+        for json_file, (_, error) in zip(json_files, results):
+            if error is not None:
+                logger.error(f"JSON 파일 읽기 오류 {json_file}: {error}")
+                failed[str(json_file)] = error
+        if failed:
+            logger.warning(f"{len(json_files)}개 중 {len(failed)}개의 JSON 파일을 읽지 못했습니다.")
+            if errors is not None:
+                errors.update(failed)
+
+        # 파일별 결과를 모은 뒤 한 번에 이어 붙여 큰 리스트의 반복 확장을 피함
+        return list(chain.from_iterable(data for data, _ in results if data))
+
+    @staticmethod
+    def _group_by_archive(json_files):
+        """
+        같은 아카이브의 연속된 ArchiveMember를 하나의 묶음으로 모음 (아카이브를 한 번만 열고 읽기 위함).
+        일반 파일은 하나씩 묶음이 되며, 묶음을 이어 붙이면 입력 순서와 같음
+        """
+        batches = []
+        for archive_path, files in groupby(
+                json_files, key=lambda f: f.archive_path if isinstance(f, ArchiveMember) else None):
+            if archive_path is None:
+                batches.extend([json_file] for json_file in files)
+            else:
+                batches.append(list(files))
+        return batches
+
+    @staticmethod
+    def _read_json_batch(batch):
+        """_group_by_archive의 묶음 하나를 읽어 파일별 (데이터, 오류 메시지) 목록을 반환"""
+        if not isinstance(batch[0], ArchiveMember):
+            return [FileUtils._read_json_file(batch[0])]
+        try:
+            with zipfile.ZipFile(batch[0].archive_path) as archive:
+                return [FileUtils._read_json_file(member, archive) for member in batch]
+        except Exception as e:
+            return [(None, f"{type(e).__name__}: {e}")] * len(batch)
+
+    @staticmethod
+    def _read_json_files_concurrently(batches, max_workers, use_processes):
+        """스레드 풀로 묶음별로 읽고, use_processes이면 큰 파일은 프로세스 풀에서 파싱. 결과는 입력 순서 유지"""
+        large_files = set()
+        if use_processes:
+            large_files = {batch[0] for batch in batches
+                           if FileUtils._file_size(batch[0]) >= FileUtils.PROCESS_PARSE_MIN_BYTES}
+
+        process_pool = None
+        if large_files:
+            # 스레드가 있는 프로세스에서 fork는 교착될 수 있으므로 플러그인 워커와 같이 spawn 사용
+            process_pool = ProcessPoolExecutor(
+                max_workers=min(max_workers, len(large_files)), mp_context=multiprocessing.get_context("spawn")
+            )
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="json-load") as thread_pool:
+                futures = [
+                    (batch, (process_pool if batch[0] in large_files else thread_pool).submit(
+                        FileUtils._read_json_batch, batch
+                    ))
+                    for batch in batches
+                ]
+                return list(chain.from_iterable(FileUtils._future_result(future, len(batch))
+                                                for batch, future in futures))
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown(wait=True)
+
+    @staticmethod
+    def _future_result(future, file_count):
+        """워커 프로세스 충돌 등 풀 자체의 오류도 묶음 안의 파일별 오류로 변환"""
+        try:
+            return future.result()
+        except Exception as e:
+            return [(None, f"{type(e).__name__}: {e}")] * file_count
+
+    @staticmethod
+    def _file_size(file_path):
+        if isinstance(file_path, ArchiveMember):
+            return 0  # 아카이브 안의 작은 파일은 스레드에서 읽음
+        try:
+            return os.path.getsize(file_path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _read_json_file(file_path, archive=None):
+        """
+        JSON 파일(또는 ArchiveMember)을 읽어 (데이터, 오류 메시지)를 반환. 로깅 없이 오류를 값으로 돌려주므로 워커에서도 사용 가능.
+        archive에 이미 연 ZipFile을 주면 ArchiveMember를 그 아카이브에서 읽음
+        """
+        try:
+            if isinstance(file_path, ArchiveMember):
+                if archive is not None:
+                    return get_json_codec().loads(archive.read(file_path.name)), None
+                with zipfile.ZipFile(file_path.archive_path) as archive:
+                    return get_json_codec().loads(archive.read(file_path.name)), None
+            with open(file_path, 'rb') as f:
+                return get_json_codec().loads(f.read()), None
+        except json.JSONDecodeError as e:
+            return None, f"JSON 디코딩 오류: {e}"
+        except Exception as e:
+            return None, f"{type(e).__name__}: {e}"
 
     @staticmethod
     def _load_json_file(file_path):
         """JSON 파일을 읽어 데이터를 반환"""
+        data, error = FileUtils._read_json_file(file_path)
+        if error is not None:
+            logger.error(f"JSON 파일 읽기 오류 {file_path}: {error}")
+            return []
+        logger.debug(f"JSON 데이터 {file_path}에서 로드됨")
+        return data
+
+
+class WriteStats:
+    """JSON 저장에서 실제로 쓴 파일과 skip_unchanged로 건너뛴 파일 수 (스레드 안전)"""
+
+    def __init__(self):
+        self.written = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    def record(self, skipped):
+        with self._lock:
+            if skipped:
+                self.skipped += 1
+            else:
+                self.written += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {'written': self.written, 'skipped': self.skipped}
+
+    def reset(self):
+        with self._lock:
+            self.written = 0
+            self.skipped = 0
+
+
+WRITE_STATS = WriteStats()
+
+
+class JsonCodec:
+    """
+    표준 라이브러리 json 기반 코덱. 다른 백엔드는 이 클래스를 상속해 loads/dumps를 교체합니다.
+
+    pretty 출력은 저장소의 기존 파일과 같은 indent=4, ensure_ascii=False 형식입니다.
+    """
+
+    name = "json"
+
+    def loads(self, data):
+        """bytes 또는 str을 파이썬 객체로 디코딩"""
+        return json.loads(data)
+
+    def dumps(self, obj, pretty=True):
+        """파이썬 객체를 UTF-8 bytes로 인코딩"""
+        if pretty:
+            return json.dumps(obj, ensure_ascii=False, indent=4).encode('utf-8')
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    orjson 기반 코덱. orjson은 2칸 들여쓰기만 지원하므로 pretty 출력은 기존 파일 형식을 유지하기 위해
+    표준 라이브러리로 처리하고, 디코딩과 compact 출력만 orjson을 사용합니다.
+    """
+
+    name = "orjson"
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, obj, pretty=True):
+        if pretty:
+            return super().dumps(obj, pretty=True)
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+# 빠른 순서대로 나열한 사용 가능한 백엔드
+JSON_CODECS = {codec.name: codec for codec in (
+    [OrjsonCodec()] if orjson is not None else []
+) + [JsonCodec()]}
+
+
+def get_json_codec(name=None):
+    """
+    JSON 코덱을 반환
+
+    Args:
+        name (Optional[str]): 'orjson' 또는 'json'. 지정하지 않으면 FILE_UTILS_JSON_BACKEND 환경 변수,
+            그것도 없으면 설치된 가장 빠른 백엔드를 사용
+
+    Returns:
+        JsonCodec: 선택된 코덱
+    """
+    name = name or os.environ.get(JSON_BACKEND_ENV_VAR)
+    if not name:
+        return next(iter(JSON_CODECS.values()))
+    if name not in JSON_CODECS:
+        raise ValueError(f"사용할 수 없는 JSON 백엔드입니다: {name} (사용 가능: {', '.join(JSON_CODECS)})")
+    return JSON_CODECS[name]
+
+
+class JsonParseCache:
+    """
+    JSON 파일을 DataFrame으로 파싱한 결과를 Arrow IPC 파일로 저장하는 디스크 캐시.
+
+    원본 파일의 절대 경로, 크기, mtime, 내용 해시로 캐시 항목을 확인합니다. 크기와 mtime이 같으면
+    해시 계산 없이 사용하고, mtime만 바뀐 경우에는 내용 해시가 같을 때 재사용합니다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    """
+
+    INDEX_FILE = "index.json"
+    BLOB_EXTENSION = ".arrow"
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_PARSE_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._index = None
+
+    def load_or_parse(self, file_path, parse, columns=None):
+        """
+        캐시된 DataFrame을 반환하고, 없으면 parse()로 만든 결과를 캐시에 저장한 뒤 반환
+
+        Args:
+            file_path (str): 원본 JSON 파일의 절대 경로
+            parse (Callable[[], pl.DataFrame]): 캐시가 없을 때 파일을 파싱하는 함수
+            columns (Optional[list]): 읽을 열 목록
+
+        Returns:
+            pl.DataFrame: 파싱 결과
+        """
+        import polars as pl
+
+        blob_name = self._blob_name(file_path)
+        blob_path = os.path.join(self.cache_dir, blob_name)
+        # 파싱 전에 서명을 읽어야 파싱 도중 변경된 파일을 캐시하지 않음
+        signature = self._file_signature(file_path)
+
+        if signature is not None and self._is_valid(blob_name, file_path, signature):
+            try:
+                data_frame = pl.read_ipc(blob_path, columns=columns)
+                self._touch(blob_path)
+                with self._lock:
+                    self.hits += 1
+                return data_frame
+            except Exception as e:
+                logger.warning(f"파싱 캐시를 읽지 못해 다시 파싱합니다 {file_path}: {e}")
+
+        with self._lock:
+            self.misses += 1
+        content_hash = self._content_hash(file_path) if signature is not None else None
+        data_frame = parse()
+        if content_hash is not None:
+            self._store(blob_name, blob_path, file_path, signature, content_hash, data_frame)
+        return data_frame.select(columns) if columns else data_frame
+
+    def clear(self):
+        """캐시 파일을 모두 삭제"""
+        with self._lock:
+            for blob_name in list(self._load_index()):
+                self._remove_blob(blob_name)
+            self._save_index()
+
+    def _is_valid(self, blob_name, file_path, signature):
+        with self._lock:
+            entry = self._load_index().get(blob_name)
+            if entry is None or entry['path'] != file_path or entry['size'] != signature[0]:
+                return False
+            if entry['mtime_ns'] == signature[1]:
+                return True
+            # 크기는 같고 mtime만 바뀐 경우(복사, touch 등) 내용이 같으면 재사용
+            if entry['sha256'] != self._content_hash(file_path):
+                return False
+            entry['mtime_ns'] = signature[1]
+            self._save_index()
+            return True
+
+    def _store(self, blob_name, blob_path, file_path, signature, content_hash, data_frame):
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.debug(f"JSON 데이터 {file_path}에서 로드됨")
-                return data
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 파일 디코딩 오류 {file_path}: {e}", exc_info=True)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{blob_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            # 압축하지 않아야 다음 읽기에서 메모리 매핑 가능
+            data_frame.write_ipc(tmp_path, compression='uncompressed')
+            os.replace(tmp_path, blob_path)
+            with self._lock:
+                index = self._load_index()
+                index[blob_name] = {
+                    'path': file_path,
+                    'size': signature[0],
+                    'mtime_ns': signature[1],
+                    'sha256': content_hash,
+                }
+                self._evict(index)
+                self._save_index()
         except Exception as e:
-            logger.error(f"JSON 파일 읽기 오류 {file_path}: {e}", exc_info=True)
-        return []
+            # 캐시 저장 실패는 결과에 영향을 주지 않음 (예: 열 타입이 섞인 JSON, 읽기 전용 디렉토리)
+            logger.warning(f"파싱 결과를 캐시에 저장하지 못했습니다 {file_path}: {e}")
+
+    def _evict(self, index):
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목을 삭제"""
+        blobs = []
+        total_bytes = 0
+        for blob_name in list(index):
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, blob_name))
+            except OSError:
+                del index[blob_name]
+                continue
+            blobs.append((stat.st_mtime_ns, blob_name, stat.st_size))
+            total_bytes += stat.st_size
+
+        for _, blob_name, size in sorted(blobs):
+            if total_bytes <= self.max_bytes:
+                break
+            self._remove_blob(blob_name)
+            total_bytes -= size
+
+    def _remove_blob(self, blob_name):
+        self._index.pop(blob_name, None)
+        try:
+            os.remove(os.path.join(self.cache_dir, blob_name))
+        except OSError:
+            pass
+
+    def _load_index(self):
+        if self._index is None:
+            try:
+                with open(os.path.join(self.cache_dir, self.INDEX_FILE), 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        tmp_path = f"{index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, ensure_ascii=False)
+        os.replace(tmp_path, index_path)
+
+    @staticmethod
+    def _touch(blob_path):
+        """LRU 순서를 위해 캐시 파일의 mtime을 사용 시각으로 갱신"""
+        try:
+            os.utime(blob_path, ns=(time.time_ns(), time.time_ns()))
+        except OSError:
+            pass
+
+    @classmethod
+    def _blob_name(cls, file_path):
+        return hashlib.sha256(file_path.encode('utf-8')).hexdigest()[:32] + cls.BLOB_EXTENSION
+
+    @staticmethod
+    def _file_signature(file_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def _content_hash(file_path):
+        """파일 내용의 sha256. 읽을 수 없으면 None"""
+        return FileUtils.file_sha256(file_path)
+
+
+_parse_caches = {}
+_parse_caches_lock = threading.Lock()
+
+
+def get_parse_cache():
+    """
+    환경 변수 설정에 맞는 JsonParseCache를 반환.
+
+    FILE_UTILS_PARSE_CACHE_DIR과 FILE_UTILS_PARSE_CACHE_MAX_BYTES가 모두 없거나
+    FILE_UTILS_PARSE_CACHE_MAX_BYTES=0이면 None (캐시를 사용하지 않음)
+
+    Returns:
+        Optional[JsonParseCache]: 프로세스에서 공유하는 파싱 캐시
+    """
+    cache_dir = os.environ.get(PARSE_CACHE_DIR_ENV_VAR)
+    max_bytes = os.environ.get(PARSE_CACHE_MAX_BYTES_ENV_VAR)
+    if not cache_dir and not max_bytes:
+        return None
+    max_bytes = int(max_bytes or DEFAULT_PARSE_CACHE_MAX_BYTES)
+    if max_bytes <= 0:
+        return None
+    cache_dir = os.path.abspath(cache_dir or DEFAULT_PARSE_CACHE_DIR)
+    with _parse_caches_lock:
+        cache = _parse_caches.get(cache_dir)
+        if cache is None:
+            cache = _parse_caches[cache_dir] = JsonParseCache(cache_dir, max_bytes)
+        cache.max_bytes = max_bytes
+        return cache
@@ -1,6 +1,13 @@
 import os
 import json
 import logging
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, FrozenSet, Tuple
+
 import polars as pl
 from decorators.plugin_decorator import register_plugin_method
 
@@ -10,26 +17,239 @@ logger = logging.getLogger(__name__)
 
 # JSON 파일 경로 설정
 JSON_FILE_PATH = os.path.join(os.path.dirname(__file__), 'members.json')
+# 멤버별 활동 구간 [시작일, 종료일) 목록. null 시작일은 처음부터, null 종료일은 현재까지 활동 중을 의미
+# 예: {"71": [[null, "2025-09-01"]]} -> 71번 멤버는 2025-08-31까지 활성. 이력이 없는 멤버는 현재 status를 따름
+HISTORY_FILE_PATH = os.path.join(os.path.dirname(__file__), 'members_history.json')
+
+# members.json 변경 여부(mtime, size)를 다시 확인하기까지의 최소 간격, 초 (예: MEMBERS_UTILS_CHECK_INTERVAL=0)
+CHECK_INTERVAL_ENV_VAR = "MEMBERS_UTILS_CHECK_INTERVAL"
+DEFAULT_CHECK_INTERVAL = 1.0
+
+
+@dataclass(frozen=True, eq=False)
+class MemberStore:
+    """
+    members.json 한 버전에서 미리 계산한 조회용 색인 (생성 후 변경하지 않음).
+
+    by_id, name_to_id, active_members의 dict와 DataFrame들은 여러 호출자가 공유하므로 읽기 전용으로
+    사용해야 합니다. members.json이 바뀌면 기존 객체를 고치지 않고 새 MemberStore로 교체합니다.
+    """
+
+    by_id: Dict[int, dict] = field(default_factory=dict)
+    name_to_id: Dict[str, int] = field(default_factory=dict)
+    active_members: Dict[int, dict] = field(default_factory=dict)
+    active_ids: FrozenSet[int] = frozenset()
+    active_ids_sorted: Tuple[int, ...] = ()
+    active_names: FrozenSet[str] = frozenset()
+    active_members_df: pl.DataFrame = field(default_factory=pl.DataFrame)
+    name_lookup_df: pl.DataFrame = field(default_factory=pl.DataFrame)  # name -> member_id (join용)
+    membership: "MembershipIndex" = None  # 날짜 기준 활성 멤버 조회용 구간 색인
+
+    @classmethod
+    def from_members(cls, members, history=None):
+        """
+        {member_id: {'name', 'status'}} 데이터와 활동 이력 {member_id: [[시작일, 종료일], ...]}으로 색인을 생성.
+        같은 이름이 여러 번 있으면 활성 멤버의 ID를 우선.
+        """
+        active_members = {member_id: info for member_id, info in members.items() if info.get('status') == 1}
+        name_to_id = {info['name']: member_id for member_id, info in members.items() if 'name' in info}
+        name_to_id.update({info['name']: member_id for member_id, info in active_members.items() if 'name' in info})
+        return cls(
+            by_id=members,
+            name_to_id=name_to_id,
+            active_members=active_members,
+            active_ids=frozenset(active_members),
+            active_ids_sorted=tuple(sorted(active_members)),
+            active_names=frozenset(info['name'] for info in active_members.values() if 'name' in info),
+            active_members_df=pl.DataFrame({
+                'member_id': list(active_members.keys()),
+                'name': [info.get('name') for info in active_members.values()]
+            }),
+            name_lookup_df=pl.DataFrame(
+                {'name': list(name_to_id.keys()), 'member_id': list(name_to_id.values())},
+                schema={'name': pl.String, 'member_id': pl.Int64},
+            ),
+            membership=MembershipIndex(members, history or {}),
+        )
+
+    def get_id(self, name):
+        """이름에 해당하는 멤버 ID (없으면 None)"""
+        return self.name_to_id.get(name)
+
+    def is_active(self, member_id):
+        return member_id in self.active_ids
+
+    def active_members_df_as_of(self, as_of):
+        """as_of 날짜에 활성이던 멤버의 member_id, name DataFrame (member_id 오름차순)"""
+        member_ids = self.membership.active_ids_as_of(as_of)
+        return pl.DataFrame(
+            {'member_id': list(member_ids), 'name': [self.by_id[member_id].get('name') for member_id in member_ids]},
+            schema={'member_id': pl.Int64, 'name': pl.String},
+        )
+
+
+class MembershipIndex:
+    """
+    멤버별 활동 구간의 경계 날짜로 시간을 나누고, 구간마다 활성 멤버 ID를 미리 계산한 색인.
+
+    경계 날짜 목록에서 bisect로 구간을 찾으므로 날짜 하나의 조회는 O(log 경계 수)이며, 여러 달을 다시 계산해도
+    members.json이나 이력 파일을 다시 읽지 않습니다.
+    """
+
+    def __init__(self, members, history):
+        intervals = {
+            int(member_id): [(to_date_str(start), to_date_str(end)) for start, end in member_intervals]
+            for member_id, member_intervals in history.items()
+        }
+        # 이력이 없는 멤버는 현재 status를 항상 유지한 것으로 간주
+        always_active = {
+            member_id for member_id, info in members.items() if member_id not in intervals and info.get('status') == 1
+        }
+
+        self.boundaries = sorted({day for spans in intervals.values() for span in spans for day in span if day})
+        # i번째 구간은 [boundaries[i - 1], boundaries[i]) (첫 구간은 처음부터, 마지막 구간은 현재까지)
+        segment_starts = [None] + self.boundaries
+        self.segments = tuple(
+            tuple(sorted(always_active | {
+                member_id for member_id, spans in intervals.items()
+                if any(_covers(span, segment_start) for span in spans)
+            }))
+            for segment_start in segment_starts
+        )
+
+    def active_ids_as_of(self, as_of):
+        """as_of 날짜(date, datetime 또는 'YYYY-MM-DD')에 활성이던 멤버 ID (오름차순 tuple)"""
+        return self.segments[bisect_right(self.boundaries, to_date_str(as_of))]
+
+
+def _covers(span, segment_start):
+    """구간 [start, end)가 segment_start에서 시작하는 구간을 포함하는지 (None은 가장 이른 시점)"""
+    start, end = span
+    if segment_start is None:
+        return start is None
+    return (start is None or start <= segment_start) and (end is None or segment_start < end)
+
+
+def to_date_str(value):
+    """date, datetime, 'YYYY-MM-DD' 문자열을 비교 가능한 'YYYY-MM-DD' 문자열로 변환 (None은 그대로)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.isoformat()
+    return date.fromisoformat(value).isoformat()
 
 
 class MembersUtils:
     """멤버 정보를 관리하는 유틸리티 클래스."""
 
-    _members_cache = None  # 캐시 변수: 멤버 데이터를 저장
+    _members_cache = None  # 캐시 변수: members.json으로 만든 MemberStore를 저장
+    _members_signature = None  # _members_cache를 만들 때의 members.json (mtime_ns, size)
+    _members_checked_at = 0.0  # 마지막으로 members.json을 확인한 time.monotonic() 값
+    _members_lock = threading.Lock()
 
     @staticmethod
     def initialize():
         logger.debug("members_utils 플러그인이 초기화되었습니다.")
 
+    @classmethod
+    def warm_up(cls):
+        """
+        플러그인 초기화 시 members.json을 미리 읽어 캐싱.
+        """
+        members = cls.load_members()
+        logger.debug(f"members_utils 워밍업 완료: 멤버 {len(members)}명")
+
     @classmethod
     def load_members(cls):
         """
         JSON 파일에서 멤버 데이터를 읽어와 캐싱 후 반환.
         """
-        if cls._members_cache is None:
-            cls._members_cache = cls._load_members_from_file()
+        return cls.load_member_store().by_id
+
+    @classmethod
+    def load_member_store(cls):
+        """
+        members.json으로 만든 MemberStore를 캐싱 후 반환.
+
+        확인 간격(MEMBERS_UTILS_CHECK_INTERVAL)이 지났으면 파일의 mtime과 크기를 비교하여, 바뀐 경우 새
+        MemberStore를 완성한 뒤 한 번에 교체합니다. 다른 스레드는 이전 또는 새 MemberStore 중 하나만 봅니다.
+        """
+        store = cls._members_cache
+        if store is not None and time.monotonic() - cls._members_checked_at < cls._check_interval():
+            return store
+
+        with cls._members_lock:
+            store = cls._members_cache
+            now = time.monotonic()
+            if store is not None and now - cls._members_checked_at < cls._check_interval():
+                return store
+
+            # 서명은 읽기 전에 구해야 읽는 도중 바뀐 파일을 다음 확인에서 다시 읽음
+            signature = cls._file_signature()
+            if store is None:
+                store = MemberStore.from_members(cls._load_members_from_file(), cls._load_history_from_file())
+            elif signature != cls._members_signature:
+                try:
+                    store = MemberStore.from_members(cls._read_members_file(), cls._read_history_file())
+                    logger.info(f"members.json 변경 감지: 멤버 {len(store.by_id)}명으로 다시 로드했습니다.")
+                except (OSError, ValueError) as e:
+                    # 저장 도중이거나 잘못된 파일이면 기존 데이터를 유지하고 다음 확인에서 다시 시도
+                    logger.warning(f"members.json 다시 로드 실패, 기존 멤버 데이터를 유지합니다: {e}")
+                    signature = cls._members_signature
+
+            cls._members_signature = signature
+            cls._members_checked_at = now
+            cls._members_cache = store
+            return store
+
+    @staticmethod
+    def _check_interval():
+        return float(os.environ.get(CHECK_INTERVAL_ENV_VAR) or DEFAULT_CHECK_INTERVAL)
 
-        return cls._members_cache
+    @staticmethod
+    def _file_signature():
+        """members.json과 활동 이력 파일의 (mtime_ns, size). 없는 파일은 None"""
+        signature = []
+        for path in (JSON_FILE_PATH, HISTORY_FILE_PATH):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    @staticmethod
+    def _read_members_file():
+        """
+        JSON 파일을 읽어 {정수 ID: 멤버 정보}를 반환. 읽기나 파싱에 실패하면 예외를 그대로 발생.
+        """
+        with open(JSON_FILE_PATH, 'r', encoding='utf-8') as file:
+            members = json.load(file)
+        return {int(key): value for key, value in members.items()}  # key를 정수로 변환
+
+    @staticmethod
+    def _read_history_file():
+        """
+        활동 이력 파일을 읽어 반환. 파일이 없으면 빈 dict, 파싱에 실패하면 예외를 그대로 발생.
+        """
+        try:
+            with open(HISTORY_FILE_PATH, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    @staticmethod
+    def _load_history_from_file():
+        """
+        활동 이력 파일을 읽어 반환하는 헬퍼 함수. 잘못된 파일이면 이력 없이 현재 status만 사용.
+        """
+        try:
+            return MembersUtils._read_history_file()
+        except (OSError, ValueError) as e:
+            logger.error(f"멤버 이력 파일을 읽을 수 없습니다 ({HISTORY_FILE_PATH}): {e}")
+            return {}
 
     @staticmethod
     def _load_members_from_file():
@@ -37,9 +257,7 @@ class MembersUtils:
         JSON 파일을 읽어 멤버 데이터를 반환하는 헬퍼 함수.
         """
         try:
-            with open(JSON_FILE_PATH, 'r', encoding='utf-8') as file:
-                members = json.load(file)
-            return {int(key): value for key, value in members.items()}  # key를 정수로 변환
+            return MembersUtils._read_members_file()
         except FileNotFoundError:
             logger.error(f"JSON 파일을 찾을 수 없습니다: {JSON_FILE_PATH}")
             return {}
@@ -51,11 +269,37 @@ class MembersUtils:
     @register_plugin_method('members_utils')
     def get_active_member_ids():
         """
-        상태가 1인 멤버의 ID 목록을 반환.
+        상태가 1인 멤버의 ID 목록을 오름차순으로 반환.
         """
-        active_members = MembersUtils.get_active_members()
-        active_ids = list(active_members.keys())
-        return active_ids
+        return list(MembersUtils.load_member_store().active_ids_sorted)
+
+    @staticmethod
+    @register_plugin_method('members_utils')
+    def get_active_member_ids_as_of(as_of):
+        """
+        지정한 날짜에 활성이던 멤버의 ID 목록을 오름차순으로 반환.
+
+        Args:
+            as_of (Union[date, datetime, str]): 기준 날짜 ('YYYY-MM-DD' 문자열 가능)
+
+        Returns:
+            list: 멤버 ID 목록
+        """
+        return list(MembersUtils.load_member_store().membership.active_ids_as_of(as_of))
+
+    @staticmethod
+    @register_plugin_method('members_utils')
+    def load_active_members_as_df_as_of(as_of):
+        """
+        지정한 날짜에 활성이던 멤버 정보를 Polars DataFrame(member_id, name)으로 반환.
+
+        Args:
+            as_of (Union[date, datetime, str]): 기준 날짜 ('YYYY-MM-DD' 문자열 가능)
+
+        Returns:
+            pl.DataFrame: 활성 멤버 DataFrame
+        """
+        return MembersUtils.load_member_store().active_members_df_as_of(as_of)
 
     @staticmethod
     @register_plugin_method('members_utils')
@@ -63,27 +307,17 @@ class MembersUtils:
         """
         상태가 1인 활성 멤버 정보를 반환.
         """
-        members = MembersUtils.load_members()
-        active_members = {member_id: info for member_id, info in members.items() if info.get('status') == 1}
-        return active_members
+        return MembersUtils.load_member_store().active_members
 
     @staticmethod
     @register_plugin_method('members_utils')
     def load_active_members_as_df():
         """
-        상태가 1인 활성 멤버 정보를 Polars DataFrame으로 반환.
+        상태가 1인 활성 멤버 정보를 Polars DataFrame으로 반환 (MemberStore에서 미리 생성).
         """
-        active_members = MembersUtils.get_active_members()
-        if not active_members:
+        active_members_df = MembersUtils.load_member_store().active_members_df
+        if active_members_df.is_empty():
             logger.warning("활성 멤버가 없습니다.")
-        else:
-            logger.debug(f"활성 멤버 데이터프레임 생성 중...")
-
-        active_members_df = pl.DataFrame({
-            'member_id': list(active_members.keys()),
-            'name': [info.get('name') for info in active_members.values()]
-        })
-        logger.debug(f"활성 멤버 DataFrame 생성 완료: {active_members_df}")
         return active_members_df
 
     @staticmethod
@@ -99,6 +333,22 @@ class MembersUtils:
             logger.warning(f"멤버 {member_id}을(를) 찾을 수 없습니다.")
         return member
 
+    @staticmethod
+    @register_plugin_method('members_utils')
+    def get_member_store():
+        """
+        ID, 이름, 활성 멤버 색인이 담긴 MemberStore를 반환.
+        """
+        return MembersUtils.load_member_store()
+
+    @staticmethod
+    @register_plugin_method('members_utils')
+    def get_member_id(name):
+        """
+        멤버 이름에 해당하는 ID를 반환 (없으면 None).
+        """
+        return MembersUtils.load_member_store().get_id(name)
+
     @staticmethod
     @register_plugin_method('members_utils')
     def get_member_name(member_id):
@@ -123,18 +373,22 @@ class MembersUtils:
 
     @staticmethod
     @register_plugin_method('members_utils')
-    def assign_ids(data, members):
+    def assign_ids(data, members=None):
         """
         주어진 데이터에 멤버 이름을 기준으로 ID를 부여.
 
         Parameters:
         - data (list of dict): 플레이 정보가 담긴 데이터 리스트
-        - members (dict): 멤버 이름과 ID가 포함된 기준 데이터
+        - members (dict): 멤버 이름과 ID가 포함된 기준 데이터 (생략하면 members.json의 색인 사용)
 
         Returns:
         - list of dict: ID가 부여된 데이터 리스트
         """
-        id_map = {value['name']: key for key, value in members.items()}
+        store = MembersUtils.load_member_store()
+        if members is None or members is store.by_id:
+            id_map = store.name_to_id
+        else:
+            id_map = {value['name']: key for key, value in members.items()}
         missing_members = []
 
         for member in data:
@@ -149,3 +403,46 @@ class MembersUtils:
             logger.warning(f"ID가 부여되지 않은 멤버들: {missing_members}")
 
         return data
+
+    @staticmethod
+    @register_plugin_method('members_utils')
+    def assign_ids_df(df, name_column='name'):
+        """
+        DataFrame의 멤버 이름에 ID를 한 번의 join으로 부여 (assign_ids의 DataFrame 버전).
+
+        Args:
+            df (pl.DataFrame): 이름 열이 있는 플레이 데이터
+            name_column (str): 이름 열 (기본값: 'name')
+
+        Returns:
+            Tuple[pl.DataFrame, pl.DataFrame]: (member_id가 부여된 행, 멤버 데이터에 없는 이름의 행)
+        """
+        lookup_df = MembersUtils.load_member_store().name_lookup_df
+        assigned_df, unmatched_df = join_ids_by_name(df, lookup_df, 'member_id', name_column)
+        if not unmatched_df.is_empty():
+            logger.warning(f"ID가 부여되지 않은 멤버들: {unmatched_df[name_column].unique(maintain_order=True).to_list()}")
+        return assigned_df, unmatched_df
+
+
+def join_ids_by_name(df, lookup_df, id_column, name_column='name'):
+    """
+    이름 -> ID 조회용 DataFrame과 left join하여 ID를 부여하고, 매칭된 행과 매칭되지 않은 행으로 나눔.
+
+    Args:
+        df (pl.DataFrame): 이름 열이 있는 데이터 (기존 id_column이 있으면 새로 부여한 값으로 교체)
+        lookup_df (pl.DataFrame): 'name'과 id_column 열을 가진 조회용 DataFrame (이름은 중복 없음)
+        id_column (str): 부여할 ID 열 이름
+        name_column (str): df의 이름 열
+
+    Returns:
+        Tuple[pl.DataFrame, pl.DataFrame]: (ID가 부여된 행, ID가 없는 행), 두 결과 모두 입력 행 순서를 유지
+    """
+    joined_df = (
+        df.drop(id_column, strict=False)
+        .with_row_index('__row_index')
+        .join(lookup_df.rename({'name': name_column}), on=name_column, how='left')
+        .sort('__row_index')
+        .drop('__row_index')
+    )
+    is_matched = pl.col(id_column).is_not_null()
+    return joined_df.filter(is_matched), joined_df.filter(~is_matched).drop(id_column)
@@ -0,0 +1,365 @@
+# helpers/name_corrector.py
+
+import ast
+import json
+import logging
+import os
+import threading
+
+from decorators.plugin_decorator import register_plugin_method
+from helpers.members_utils import MembersUtils
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 수동으로 관리하는 OCR 오타 정정표 (data/members/name_corrections.py의 NAME_CORRECTIONS)
+NAME_CORRECTIONS_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', 'data', 'members', 'name_corrections.py')
+)
+# 자동 정정으로 학습한 (잘못된 이름 -> 멤버 이름) 저장 위치 (예: NAME_CORRECTOR_LEARNED_PATH=/tmp/learned.json)
+LEARNED_PATH_ENV_VAR = "NAME_CORRECTOR_LEARNED_PATH"
+DEFAULT_LEARNED_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', 'data', 'members', 'learned_name_corrections.json')
+)
+# 자모 단위 최대 편집 거리 (예: NAME_CORRECTOR_MAX_DISTANCE=1)
+MAX_DISTANCE_ENV_VAR = "NAME_CORRECTOR_MAX_DISTANCE"
+DEFAULT_MAX_DISTANCE = 2
+# 두 글자 이하의 짧은 이름은 자모 2개만 달라도 다른 멤버일 수 있으므로 기본 거리를 더 좁게 적용
+SHORT_NAME_LENGTH = 2
+SHORT_NAME_MAX_DISTANCE = 1
+
+# 한글 음절 분해 상수 (유니코드 가-힣)
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+
+class NameCorrector:
+    """OCR로 읽은 배틀 데이터의 멤버 이름을 정정표와 자모 단위 근사 검색으로 바로잡는 플러그인."""
+
+    DEPENDS_ON = ['members_utils']
+
+    _index = None  # 활성 멤버 이름으로 만든 NameIndex (MemberStore가 바뀌면 다시 생성)
+    _index_lock = threading.Lock()
+    _learned_lock = threading.Lock()
+
+    @staticmethod
+    def initialize():
+        logger.debug("name_corrector 플러그인이 초기화되었습니다.")
+
+    @classmethod
+    def warm_up(cls):
+        """
+        플러그인 초기화 시 활성 멤버 이름 색인을 미리 생성.
+        """
+        index = cls._get_index()
+        logger.debug(f"name_corrector 워밍업 완료: 이름 {len(index)}개")
+
+    @staticmethod
+    @register_plugin_method('name_corrector')
+    def correct_name(name, max_distance=None, learn=False):
+        """
+        이름 하나를 활성 멤버 이름으로 정정
+
+        Args:
+            name (str): OCR로 읽은 이름
+            max_distance (Optional[int]): 허용할 자모 단위 편집 거리
+                (기본값: NAME_CORRECTOR_MAX_DISTANCE 또는 2, 두 글자 이하 이름은 최대 1)
+            learn (bool): True이면 근사 검색으로 찾은 결과를 학습 정정표에 저장 (기본값: False).
+                학습 정정표는 이후 근사 검색보다 먼저 적용되므로 결과를 검토한 경우에만 사용
+
+        Returns:
+            Optional[str]: 정정된 이름. 찾지 못했거나 후보가 여러 개면 None
+        """
+        return NameCorrector.correct_names([name], max_distance, learn)[name]
+
+    @staticmethod
+    @register_plugin_method('name_corrector')
+    def correct_names(names, max_distance=None, learn=False):
+        """
+        여러 이름을 한 번에 정정 (같은 이름은 한 번만 검색하고, 학습 결과는 마지막에 한 번만 저장)
+
+        비활성 멤버를 포함해 members.json에 있는 이름은 그대로 두고, 어떤 멤버와도 일치하지 않는 이름만
+        활성 멤버 이름에서 근사 검색합니다.
+
+        Args:
+            names (Iterable[str]): OCR로 읽은 이름 목록
+            max_distance (Optional[int]): 허용할 자모 단위 편집 거리
+            learn (bool): True이면 근사 검색으로 찾은 결과를 학습 정정표에 저장 (기본값: False).
+                학습 정정표는 이후 근사 검색보다 먼저 적용되므로 결과를 검토한 경우에만 사용
+
+        Returns:
+            dict: {입력 이름: 정정된 이름 또는 None}
+        """
+        use_default_distance = max_distance is None
+        if use_default_distance:
+            max_distance = int(os.environ.get(MAX_DISTANCE_ENV_VAR) or DEFAULT_MAX_DISTANCE)
+
+        index = NameCorrector._get_index()
+        known_names = index.store.name_to_id
+        # 경로를 인자로 넘겨 학습 정정표 위치가 바뀌면 다른 캐시 항목을 사용
+        corrections = NameCorrector.get_corrections(NameCorrector._learned_path())
+        results = {}
+        learned = {}
+        for name in names:
+            if name in results:
+                continue
+            if name in known_names:
+                results[name] = name
+            elif name in corrections:
+                results[name] = corrections[name]
+            else:
+                distance = max_distance
+                if use_default_distance and len(name) <= SHORT_NAME_LENGTH:
+                    distance = min(distance, SHORT_NAME_MAX_DISTANCE)
+                matched = index.find(name, distance)
+                results[name] = matched
+                if matched is not None:
+                    logger.info(f"이름 자동 정정: '{name}' -> '{matched}'")
+                    learned[name] = matched
+                else:
+                    logger.warning(f"'{name}'에 가까운 멤버 이름을 찾지 못했습니다.")
+
+        if learn and learned:
+            NameCorrector.learn_corrections(learned)
+        return results
+
+    @staticmethod
+    @register_plugin_method('name_corrector')
+    def correct_records(data, max_distance=None, learn=False):
+        """
+        플레이 데이터의 'name' 값을 정정 (assign_ids 전에 사용)
+
+        Args:
+            data (list of dict): 'name' 키가 있는 플레이 데이터 (제자리에서 수정)
+            max_distance (Optional[int]): 허용할 자모 단위 편집 거리
+            learn (bool): True이면 근사 검색으로 찾은 결과를 학습 정정표에 저장 (기본값: False).
+                학습 정정표는 이후 근사 검색보다 먼저 적용되므로 결과를 검토한 경우에만 사용
+
+        Returns:
+            Tuple[list, list]: (정정된 데이터, 정정하지 못한 이름 목록)
+        """
+        results = NameCorrector.correct_names([record['name'] for record in data], max_distance, learn)
+        unresolved = []
+        for record in data:
+            corrected = results[record['name']]
+            if corrected is None:
+                unresolved.append(record['name'])
+            else:
+                record['name'] = corrected
+        return data, unresolved
+
+    @staticmethod
+    @register_plugin_method('name_corrector', cache_size=4, depends_on=lambda learned_path=None: [
+        NAME_CORRECTIONS_PATH, learned_path or NameCorrector._learned_path()
+    ])
+    def get_corrections(learned_path=None):
+        """
+        수동 정정표(NAME_CORRECTIONS)와 학습 정정표를 합친 {잘못된 이름: 멤버 이름}을 반환 (수동 정정표 우선).
+
+        correct_names가 호출될 때마다 사용하므로 결과를 메모이즈하고, 두 정정표 파일 중 하나라도 바뀌면 다시 읽습니다.
+        반환된 dict는 호출한 곳끼리 공유하므로 수정하지 않아야 합니다.
+
+        Args:
+            learned_path (Optional[str]): 학습 정정표 경로 (기본값: NAME_CORRECTOR_LEARNED_PATH 또는 DEFAULT_LEARNED_PATH)
+        """
+        corrections = NameCorrector._load_learned_corrections(learned_path)
+        corrections.update(NameCorrector._load_manual_corrections())
+        return corrections
+
+    @staticmethod
+    @register_plugin_method('name_corrector')
+    def learn_corrections(pairs):
+        """
+        {잘못된 이름: 멤버 이름}을 학습 정정표에 추가하고 저장
+
+        Args:
+            pairs (dict): 추가할 정정 쌍
+        """
+        with NameCorrector._learned_lock:
+            learned = NameCorrector._load_learned_corrections()
+            learned.update(pairs)
+            path = NameCorrector._learned_path()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                json.dump(dict(sorted(learned.items())), file, ensure_ascii=False, indent=4)
+            os.replace(tmp_path, path)
+        logger.info(f"학습 정정표에 {len(pairs)}개 추가: {path}")
+
+    @classmethod
+    def _get_index(cls):
+        """현재 MemberStore의 활성 멤버 이름 색인 (members.json이 바뀌면 다시 생성)"""
+        store = MembersUtils.load_member_store()
+        index = cls._index
+        if index is not None and index.store is store:
+            return index
+        with cls._index_lock:
+            if cls._index is None or cls._index.store is not store:
+                cls._index = NameIndex(store.active_names, store)
+            return cls._index
+
+    @staticmethod
+    def _learned_path():
+        return os.environ.get(LEARNED_PATH_ENV_VAR) or DEFAULT_LEARNED_PATH
+
+    @staticmethod
+    def _load_learned_corrections(path=None):
+        path = path or NameCorrector._learned_path()
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            logger.error(f"학습 정정표 파싱 오류 ({path}): {e}")
+            return {}
+
+    @staticmethod
+    def _load_manual_corrections():
+        """name_corrections.py를 실행하지 않고 NAME_CORRECTIONS 값만 읽음 (data/는 패키지가 아님)"""
+        try:
+            with open(NAME_CORRECTIONS_PATH, 'r', encoding='utf-8') as file:
+                tree = ast.parse(file.read(), filename=NAME_CORRECTIONS_PATH)
+        except (OSError, SyntaxError) as e:
+            logger.error(f"정정표를 읽을 수 없습니다 ({NAME_CORRECTIONS_PATH}): {e}")
+            return {}
+
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and any(
+                    isinstance(target, ast.Name) and target.id == 'NAME_CORRECTIONS' for target in node.targets):
+                return dict(ast.literal_eval(node.value))
+        return {}
+
+
+class NameIndex:
+    """
+    이름을 자모로 분해한 뒤 편집 거리 기준 BK-tree로 색인합니다.
+
+    BK-tree는 삼각 부등식으로 대부분의 가지를 건너뛰므로 멤버 수가 늘어도 조회마다 전체 이름과 비교하지 않습니다.
+    """
+
+    def __init__(self, names, store=None):
+        self.store = store
+        self._names = frozenset(names)
+        self._root = None
+        for name in sorted(self._names):
+            self._add(name, decompose_jamo(name))
+
+    def __len__(self):
+        return len(self._names)
+
+    def contains(self, name):
+        return name in self._names
+
+    def _add(self, name, jamo):
+        node = (name, jamo, {})
+        if self._root is None:
+            self._root = node
+            return
+        current = self._root
+        while True:
+            distance = edit_distance(jamo, current[1])
+            child = current[2].get(distance)
+            if child is None:
+                current[2][distance] = node
+                return
+            current = child
+
+    def find(self, name, max_distance):
+        """
+        자모 편집 거리가 max_distance 이하인 가장 가까운 이름 (같은 거리의 후보가 여러 개면 None)
+        """
+        if self._root is None:
+            return None
+
+        jamo = decompose_jamo(name)
+        best_distance = max_distance + 1
+        best_names = []
+        stack = [self._root]
+        while stack:
+            node_name, node_jamo, children = stack.pop()
+            # 찾는 범위를 현재 최선 거리로 좁혀 탐색할 가지를 줄임
+            radius = min(best_distance, max_distance)
+            # 이 거리를 넘으면 이 노드도 자식 가지도 후보가 될 수 없으므로 계산을 중단
+            distance = edit_distance(jamo, node_jamo, limit=radius + max(children, default=0))
+            if distance > max_distance:
+                pass
+            elif distance < best_distance:
+                best_distance, best_names = distance, [node_name]
+            elif distance == best_distance:
+                best_names.append(node_name)
+            radius = min(best_distance, max_distance)
+            for child_distance, child in children.items():
+                if distance - radius <= child_distance <= distance + radius:
+                    stack.append(child)
+
+        if len(best_names) > 1:
+            logger.warning(f"'{name}'과 거리 {best_distance}인 후보가 여러 개입니다: {sorted(best_names)}")
+            return None
+        return best_names[0] if best_names else None
+
+
+def decompose_jamo(text):
+    """한글 음절을 초성/중성/종성 자모로 분해한 문자열 (한글이 아닌 문자는 그대로)"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            choseong, rest = divmod(offset, JUNGSEONG_COUNT * JONGSEONG_COUNT)
+            jungseong, jongseong = divmod(rest, JONGSEONG_COUNT)
+            result.append(chr(0x1100 + choseong))
+            result.append(chr(0x1161 + jungseong))
+            if jongseong:
+                result.append(chr(0x11A7 + jongseong))
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def edit_distance(a, b, limit=None):
+    """
+    두 문자열의 Levenshtein 편집 거리
+
+    Args:
+        a (str): 비교할 문자열
+        b (str): 비교할 문자열
+        limit (Optional[int]): 거리가 이 값을 넘는 것이 확실해지면 계산을 멈추고 limit + 1을 반환
+
+    Returns:
+        int: 편집 거리 (limit을 넘으면 limit + 1)
+    """
+    # 공통 접두사/접미사(예: '는 야옹')는 거리에 영향이 없으므로 잘라내고 계산
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        left = i
+        for j, char_b in enumerate(b, start=1):
+            # 대체/삽입/삭제 중 최소 비용 (min() 호출보다 빠른 비교로 계산)
+            value = previous[j - 1] + (char_a != char_b)
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if left + 1 < value:
+                value = left + 1
+            current.append(value)
+            left = value
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1] if limit is None else min(previous[-1], limit + 1)
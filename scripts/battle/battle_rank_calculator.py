@@ -1,14 +1,13 @@
 # scripts/battle/rank_calculator.py
 
 import glob
-import json
 import logging
 import os
 import sys
 
 import polars as pl
 
-from scripts.plugin_loader import PluginLoader
+from scripts.plugin_loader import get_loader
 
 # 현재 스크립트의 상위 두 경로를 추가하여 plugin_loader.py 파일을 불러옴
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -17,8 +16,20 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# PluginLoader 인스턴스 생성
-plugin_loader = PluginLoader()
+# 프로세스 전체에서 공유하는 PluginLoader 사용
+plugin_loader = get_loader()
+
+# 게임 파일 폴더 (실행 위치와 관계없이 이 파일 기준)
+BATTLES_RANK_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../data/battles_rank'))
+# 결과 파일 경로 (file_utils 기준 상대 경로)
+OUTPUT_FINAL_FILE_PATH = '../data/result_battles/grouped_rank_score.json'
+OUTPUT_INDIVIDUAL_FOLDER = '../data/result_battles/individual_games'
+
+# 최종 순위에 합산하는 최근 게임 수
+RECENT_GAMES = 15
+
+# 게임 파일에 반드시 있어야 하는 열 (rank는 score로 다시 계산)
+REQUIRED_GAME_COLUMNS = ('member_id', 'score')
 
 
 def ensure_column_exists(df, column_name, default_value):
@@ -101,18 +112,121 @@ def load_recent_json_files(folder_path, pattern, recent_n=3):
     return file_list[-recent_n:]
 
 
+def process_game(file_path, active_member_ids, active_members_df):
+    """
+    게임 파일 하나의 개별 결과(rank, score, rank_score, play_count)를 계산.
+    파일을 읽을 수 없거나 데이터가 없으면 None.
+    """
+    # 게임 파일을 Polars DataFrame으로 읽기 (JSON, Parquet, Arrow IPC)
+    # file_utils는 상대 경로를 helpers 폴더 기준으로 해석하므로 현재 위치 기준 절대 경로로 전달
+    try:
+        game_df = plugin_loader.file_utils.load_data_frame(os.path.abspath(file_path))
+        logger.info(f"Loaded data from '{file_path}'.")
+    except Exception as e:
+        logger.error(f"Failed to load data from '{file_path}': {e}", exc_info=True)
+        return None
+
+    if game_df.is_empty():
+        logger.warning(f"No data found in '{file_path}'. Skipping.")
+        return None
+
+    missing_columns = [column for column in REQUIRED_GAME_COLUMNS if column not in game_df.columns]
+    if missing_columns:
+        logger.warning(f"Missing required columns {missing_columns} in '{file_path}'. Skipping.")
+        return None
+
+    # play_count 열이 존재하지 않으면 기본 값 0으로 설정
+    game_df = ensure_column_exists(game_df, 'play_count', 0)
+
+    # active_member_ids 필터링
+    game_df = game_df.filter(pl.col('member_id').is_in(active_member_ids))
+
+    # rank_score 계산
+    game_df = calculate_rank_score(game_df)
+
+    # play_count 갱신
+    game_df = update_play_count(game_df)
+
+    # member_id 별로 그룹화하여 rank_score와 play_count의 합계 계산
+    grouped_game_df = group_by_member_id(game_df)
+
+    # 개별 게임 결과를 저장할 DataFrame 준비 (한 번에 join 수행)
+    final_game_df = active_members_df.join(
+        grouped_game_df.join(game_df.select(['member_id', 'rank', 'score']), on='member_id', how='left'),
+        on='member_id',
+        how='left'
+    )
+
+    # rank, score, rank_score, play_count가 없거나 NaN인 경우 기본값 설정
+    final_game_df = final_game_df.with_columns(
+        pl.col('rank').fill_null(51),        # 미참여자는 51위 고정
+        pl.col('score').fill_null(0),        # 미참여자는 0점
+        pl.col('play_count').fill_null(0),   # 기본 플레이 횟수 0
+        pl.col('rank_score').fill_null(0)    # 기본 랭킹 점수 0
+    )
+
+    # rank 기준으로 정렬
+    final_game_df = final_game_df.sort('rank')
+
+    logger.info(f"Sorted DataFrame by 'rank' for '{file_path}'.")
+    return final_game_df
+
+
+def build_final_ranking(individual_games, active_members_df):
+    """
+    개별 게임 결과 [(게임 번호, DataFrame)]를 합산하여 최종 순위 DataFrame을 생성.
+    """
+    # 모든 게임의 rank_score와 play_count를 합산
+    aggregated_df = pl.concat([game_df for _, game_df in individual_games]).group_by('member_id').agg([
+        pl.sum('play_count').alias('play_count'),
+        pl.sum('rank_score').alias('rank_score')
+    ])
+    logger.info("Aggregated 'play_count' and 'rank_score' across all games.")
+
+    # 최종 결과 DataFrame 생성
+    final_df = active_members_df.join(aggregated_df, on='member_id', how='left')
+    logger.info("Joined aggregated data with active members DataFrame for final results.")
+
+    # rank_score와 play_count가 없거나 NaN인 경우 0으로 설정
+    final_df = final_df.with_columns(
+        pl.col('play_count').fill_null(0),
+        pl.col('rank_score').fill_null(0)
+    )
+
+    # rank_score 기준으로 내림차순 정렬 및 rank 부여
+    final_df = final_df.sort(by='rank_score', descending=True).with_columns(
+        pl.col('rank_score')
+        .rank(method='min', descending=True)
+        .cast(pl.Int64)  # 순위를 정수형으로 변환
+        .alias('rank')
+    )
+
+    # 개별 게임별 rank_score를 최종 결과에 병합 (없거나 NaN인 경우 0으로 설정)
+    for idx, game_df in individual_games:
+        column_name = f'game_{idx}_rank_score'
+        game_rank_score_df = game_df.select(['member_id', 'rank_score']).rename({'rank_score': column_name})
+        final_df = final_df.join(game_rank_score_df, on='member_id', how='left').with_columns(
+            pl.col(column_name).fill_null(0)
+        )
+
+    return final_df
+
+
 def main():
     # 입력 폴더 및 출력 파일 경로 설정
-    folder_path = '../../data/battles_rank'
-    output_final_file_path = '../data/result_battles/grouped_rank_score.json'
-    output_individual_folder = '../data/result_battles/individual_games'
+    folder_path = BATTLES_RANK_DIR
+    output_final_file_path = OUTPUT_FINAL_FILE_PATH
+    output_individual_folder = OUTPUT_INDIVIDUAL_FOLDER
+
+    # 입력 파일 형식 (FILE_UTILS_INPUT_FORMAT), 결과 파일 형식은 FILE_UTILS_RESULT_FORMAT으로 설정
+    input_extension = plugin_loader.file_utils.get_input_extension()
 
     # 개별 게임 결과를 저장할 폴더가 없으면 생성
     os.makedirs(output_individual_folder, exist_ok=True)
 
     # TDDO: recent_n 수정 작업
     try:
-        recent_files = load_recent_json_files(folder_path, 'battle_*.json', recent_n=15)
+        recent_files = load_recent_json_files(folder_path, f'battle_*{input_extension}', recent_n=RECENT_GAMES)
         logger.info(f"Loaded {len(recent_files)} recent JSON files from '{folder_path}'.")
     except Exception as e:
         logger.error(f"Failed to load JSON files from '{folder_path}': {e}", exc_info=True)
@@ -130,140 +244,59 @@ def main():
         logger.error(f"Failed to load active member information: {e}", exc_info=True)
         return
 
-    # 개별 게임 결과를 저장할 리스트
-    individual_game_dfs = []
-    individual_game_rank_scores = []
+    # 이번 실행에서 쓴 파일과 내용이 같아 건너뛴 파일 수를 집계
+    plugin_loader.file_utils.reset_write_stats()
+
+    # 개별 게임 결과를 저장할 리스트 [(게임 번호, DataFrame)]
+    individual_games = []
+
+    # 개별 게임 결과 파일은 백그라운드에서 저장하여 다음 게임 계산과 겹치도록 함
+    individual_game_batch = plugin_loader.batch_writer.open_batch(skip_unchanged=True)
 
     # 각 게임별로 데이터 처리
     for idx, file_path in enumerate(recent_files, start=1):
-        # JSON 파일 읽기
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            logger.info(f"Loaded data from '{file_path}'.")
-        except Exception as e:
-            logger.error(f"Failed to load data from '{file_path}': {e}", exc_info=True)
-            continue
-
-        if not data:
-            logger.warning(f"No data found in '{file_path}'. Skipping.")
+        final_game_df = process_game(file_path, active_member_ids, active_members_df)
+        if final_game_df is None:
             continue
 
-        # 데이터를 Polars DataFrame으로 변환
-        game_df = pl.DataFrame(data)
-
-        # play_count 열이 존재하지 않으면 기본 값 0으로 설정
-        game_df = ensure_column_exists(game_df, 'play_count', 0)
-
-        # active_member_ids 필터링
-        game_df = game_df.filter(pl.col('member_id').is_in(active_member_ids))
-
-        # rank_score 계산
-        game_df = calculate_rank_score(game_df)
-
-        # play_count 갱신
-        game_df = update_play_count(game_df)
-
-        # member_id 별로 그룹화하여 rank_score와 play_count의 합계 계산
-        grouped_game_df = group_by_member_id(game_df)
+        # 결과를 설정된 형식으로 저장 예약 (개별 게임 결과, rank와 score 포함)
+        # 게임별 파일명 생성 (예: game_1_rank_score.json)
+        individual_game_file = os.path.join(output_individual_folder, f'game_{idx}_rank_score.json')
+        individual_game_batch.submit(individual_game_file, final_game_df)
+        logger.info(f"Queued individual game DataFrame with rank and score for '{individual_game_file}'.")
 
-        # 개별 게임 결과를 저장할 DataFrame 준비 (한 번에 join 수행)
-        final_game_df = active_members_df.join(
-            grouped_game_df.join(game_df.select(['member_id', 'rank', 'score']), on='member_id', how='left'),
-            on='member_id',
-            how='left'
-        )
-
-        # rank, score, rank_score, play_count가 없거나 NaN인 경우 기본값 설정
-        final_game_df = final_game_df.with_columns(
-            pl.col('rank').fill_null(51),        # 미참여자는 51위 고정
-            pl.col('score').fill_null(0),        # 미참여자는 0점
-            pl.col('play_count').fill_null(0),   # 기본 플레이 횟수 0
-            pl.col('rank_score').fill_null(0)    # 기본 랭킹 점수 0
-        )
-
-
-        # rank 기준으로 정렬
-        final_game_df = final_game_df.sort('rank')
-
-        logger.info(f"Sorted DataFrame by 'rank' for '{file_path}'.")
-
-        # 결과를 JSON 파일로 저장 (개별 게임 결과)
-        try:
-            # 게임별 파일명 생성 (예: game_1_rank_score.json)
-            individual_game_file = os.path.join(output_individual_folder, f'game_{idx}_rank_score.json')
-
-            # rank와 score도 포함하여 저장
-            plugin_loader.file_utils.save_to_json(individual_game_file, final_game_df)
-            logger.info(f"Saved individual game DataFrame with rank and score to '{individual_game_file}'.")
-        except Exception as e:
-            logger.error(f"Failed to save individual game DataFrame to '{individual_game_file}': {e}", exc_info=True)
-
-        # 개별 게임 DataFrame을 리스트에 추가
-        individual_game_dfs.append(final_game_df)
-
-        # 개별 게임의 rank_score를 저장할 데이터프레임 준비
-        game_rank_score_df = final_game_df.select(['member_id', 'rank_score']).rename({
-            'rank_score': f'game_{idx}_rank_score'
-        })
-        individual_game_rank_scores.append(game_rank_score_df)
-
-    if not individual_game_dfs:
-        logger.error("No individual game data processed. Exiting.")
-        return
+        individual_games.append((idx, final_game_df))
 
-    # 모든 개별 게임 DataFrame을 합산
+    # 개별 게임 결과 저장이 모두 끝날 때까지 대기 (실패한 파일은 한 번에 보고)
     try:
-        # 모든 게임의 rank_score와 play_count를 합산
-        aggregated_df = pl.concat(individual_game_dfs).group_by('member_id').agg([
-            pl.sum('play_count').alias('play_count'),
-            pl.sum('rank_score').alias('rank_score')
-        ])
-        logger.info("Aggregated 'play_count' and 'rank_score' across all games.")
+        individual_game_batch.flush()
+        logger.info(f"Saved individual game DataFrames to '{output_individual_folder}'.")
     except Exception as e:
-        logger.error(f"Failed to aggregate individual game data: {e}", exc_info=True)
+        logger.error(f"Failed to save individual game DataFrames: {e}")
+    finally:
+        individual_game_batch.close()
+
+    if not individual_games:
+        logger.error("No individual game data processed. Exiting.")
         return
 
-    # 최종 결과 DataFrame 생성
+    # 모든 개별 게임 DataFrame을 합산하여 최종 결과 생성
     try:
-        final_df = active_members_df.join(aggregated_df, on='member_id', how='left')
-        logger.info("Joined aggregated data with active members DataFrame for final results.")
+        final_df = build_final_ranking(individual_games, active_members_df)
     except Exception as e:
-        logger.error(f"Failed to join aggregated data with active members DataFrame: {e}", exc_info=True)
+        logger.error(f"Failed to build final ranking from individual game data: {e}", exc_info=True)
         return
 
-    # rank_score와 play_count가 없거나 NaN인 경우 0으로 설정
-    final_df = final_df.with_columns(
-        pl.col('play_count').fill_null(0),
-        pl.col('rank_score').fill_null(0)
-    )
-
-    # rank_score 기준으로 내림차순 정렬 및 rank 부여
-    final_df = final_df.sort(by='rank_score', descending=True).with_columns(
-        pl.col('rank_score')
-        .rank(method='min', descending=True)
-        .cast(pl.Int64)  # 순위를 정수형으로 변환
-        .alias('rank')
-    )
-
-    # 개별 게임별 rank_score를 최종 결과에 병합
-    for game_rank_score_df in individual_game_rank_scores:
-        final_df = final_df.join(game_rank_score_df, on='member_id', how='left')
-
-    # 개별 게임 rank_score가 없거나 NaN인 경우 0으로 설정
-    for idx in range(1, len(individual_game_rank_scores) + 1):
-        column_name = f'game_{idx}_rank_score'
-        final_df = final_df.with_columns(
-            pl.col(column_name).fill_null(0)
-        )
-
-    # 최종 결과를 JSON 파일로 저장
+    # 최종 결과를 설정된 형식으로 저장
     try:
-        plugin_loader.file_utils.save_to_json(output_final_file_path, final_df)
+        plugin_loader.file_utils.save_data_frame(output_final_file_path, final_df, skip_unchanged=True)
         logger.info(f"Saved final aggregated DataFrame to '{output_final_file_path}'.")
     except Exception as e:
         logger.error(f"Failed to save final aggregated DataFrame to '{output_final_file_path}': {e}", exc_info=True)
 
+    write_stats = plugin_loader.file_utils.get_write_stats()
+    logger.info(f"Result files written: {write_stats['written']}, unchanged and skipped: {write_stats['skipped']}.")
+
 
 if __name__ == "__main__":
     main()
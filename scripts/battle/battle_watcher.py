@@ -0,0 +1,186 @@
+# scripts/battle/battle_watcher.py
+
+import argparse
+import fnmatch
+import logging
+import os
+import sys
+import time
+
+from scripts.battle.battle_rank_calculator import (
+    BATTLES_RANK_DIR, OUTPUT_FINAL_FILE_PATH, OUTPUT_INDIVIDUAL_FOLDER, RECENT_GAMES, build_final_ranking, plugin_loader,
+    process_game
+)
+
+# 현재 스크립트의 상위 두 경로를 추가하여 plugin_loader.py 파일을 불러옴
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 폴더를 확인하는 기본 간격 (초)
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+class BattleWatcher:
+    """
+    battles_rank 폴더를 주기적으로 확인하여 새로 올라오거나 바뀐 게임 파일만 다시 계산하고 최종 순위를 갱신.
+
+    파일의 (mtime_ns, size)가 두 번 연속 같을 때만 업로드가 끝난 것으로 보고 처리합니다. 바뀌지 않은
+    게임은 이전에 계산한 결과를 그대로 사용하므로, 새 게임 하나가 들어오면 그 게임만 계산한 뒤 합산합니다.
+    """
+
+    def __init__(self, folder_path, output_final_file_path, output_individual_folder, recent_n=RECENT_GAMES):
+        # file_utils는 상대 경로를 helpers 폴더 기준으로 해석하므로 현재 위치 기준 절대 경로로 저장
+        self.folder_path = os.path.abspath(folder_path)
+        self.output_final_file_path = output_final_file_path
+        self.output_individual_folder = output_individual_folder
+        self.recent_n = recent_n
+        self.pattern = f'battle_*{plugin_loader.file_utils.get_input_extension()}'
+
+        # 파일 경로 -> (파일 서명, 계산에 사용한 활성 멤버 ID tuple, 개별 게임 DataFrame 또는 검증 실패 시 None)
+        self._games = {}
+        # 아직 안정되지 않은 파일의 마지막 서명
+        self._pending = {}
+        # 개별 게임 파일 번호 -> 마지막으로 저장한 (파일 경로, 파일 서명, 활성 멤버 ID tuple)
+        self._written = {}
+        self._published_state = None
+        self._active_member_ids = None
+
+    def poll(self):
+        """
+        폴더를 한 번 확인하고 필요한 경우 결과를 갱신
+
+        Returns:
+            bool: 최종 순위 파일을 다시 저장했으면 True
+        """
+        recent_files = self._scan_recent_files()
+        if not recent_files:
+            return False
+
+        active_member_ids = plugin_loader.members_utils.get_active_member_ids()
+        active_members_df = plugin_loader.members_utils.load_active_members_as_df()
+        roster = tuple(active_member_ids)
+        if self._active_member_ids is not None and roster != self._active_member_ids:
+            # 활성 멤버가 바뀌면 모든 게임 결과가 달라지므로 다시 계산
+            logger.info("활성 멤버 목록이 바뀌어 모든 게임을 다시 계산합니다.")
+        self._active_member_ids = roster
+
+        waiting = False
+        for file_path, signature in recent_files:
+            cached = self._games.get(file_path)
+            if cached is not None and cached[0] == signature:
+                if cached[1] == roster:
+                    continue
+                # 파일은 그대로이고 멤버만 바뀌었으므로 안정화를 기다리지 않고 바로 다시 계산
+            elif self._pending.get(file_path) != signature:
+                # 업로드 중일 수 있으므로 다음 확인에서 같은 서명일 때 처리
+                self._pending[file_path] = signature
+                waiting = True
+                continue
+            else:
+                del self._pending[file_path]
+                logger.info(f"게임 파일 변경 감지: '{file_path}'")
+            self._games[file_path] = (signature, roster, process_game(file_path, active_member_ids, active_members_df))
+
+        # 최근 게임 범위에서 빠진 파일은 잊음
+        recent_paths = {file_path for file_path, _ in recent_files}
+        for file_path in set(self._games) - recent_paths:
+            del self._games[file_path]
+        for file_path in set(self._pending) - recent_paths:
+            del self._pending[file_path]
+
+        if waiting:
+            return False
+
+        state = (roster, tuple(recent_files))
+        if state == self._published_state:
+            return False
+
+        individual_games = [
+            (idx, file_path, self._games[file_path][2])
+            for idx, (file_path, _) in enumerate(recent_files, start=1)
+            if self._games[file_path][2] is not None
+        ]
+        if not individual_games:
+            logger.error("처리할 수 있는 게임 데이터가 없습니다.")
+            self._published_state = state
+            return False
+
+        self._publish(individual_games, active_members_df)
+        self._published_state = state
+        return True
+
+    def run(self, interval=DEFAULT_POLL_INTERVAL):
+        """Ctrl+C로 중단할 때까지 interval초마다 poll()을 반복"""
+        logger.info(f"'{self.folder_path}' 감시 시작 (간격 {interval}초)")
+        try:
+            while True:
+                try:
+                    self.poll()
+                except Exception as e:
+                    logger.error(f"순위 갱신 실패: {e}", exc_info=True)
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            logger.info("감시를 종료합니다.")
+
+    def _scan_recent_files(self):
+        """패턴에 맞는 최근 recent_n개 게임 파일의 [(파일 경로, (mtime_ns, size))]를 번호 순으로 반환"""
+        files = []
+        try:
+            with os.scandir(self.folder_path) as entries:
+                for entry in entries:
+                    if not entry.is_file() or not fnmatch.fnmatch(entry.name, self.pattern):
+                        continue
+                    try:
+                        game_number = int(os.path.splitext(entry.name)[0].split('_')[-1])
+                        stat = entry.stat()
+                    except (ValueError, OSError):
+                        continue
+                    files.append((game_number, entry.path, (stat.st_mtime_ns, stat.st_size)))
+        except FileNotFoundError:
+            logger.warning(f"'{self.folder_path}' 폴더가 없습니다.")
+            return []
+
+        files.sort()
+        return [(file_path, signature) for _, file_path, signature in files[-self.recent_n:]]
+
+    def _publish(self, individual_games, active_members_df):
+        """바뀐 개별 게임 파일과 최종 순위 파일을 저장"""
+        submitted = {}
+        with plugin_loader.batch_writer.open_batch(skip_unchanged=True) as batch:
+            for idx, file_path, final_game_df in individual_games:
+                written_key = (file_path,) + self._games[file_path][:2]
+                if self._written.get(idx) == written_key:
+                    continue
+                batch.submit(os.path.join(self.output_individual_folder, f'game_{idx}_rank_score.json'), final_game_df)
+                submitted[idx] = written_key
+        # 저장이 모두 끝난 뒤에만 기록 (BatchWriteError가 나면 다음 확인에서 다시 저장)
+        self._written.update(submitted)
+
+        final_df = build_final_ranking(
+            [(idx, final_game_df) for idx, _, final_game_df in individual_games], active_members_df
+        )
+        plugin_loader.file_utils.save_data_frame(self.output_final_file_path, final_df, skip_unchanged=True)
+        logger.info(f"최종 순위 갱신: 게임 {len(individual_games)}개 -> '{self.output_final_file_path}'")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="battles_rank 폴더를 감시하여 배틀 순위를 자동으로 갱신")
+    parser.add_argument('--folder', default=BATTLES_RANK_DIR, help="감시할 게임 파일 폴더")
+    parser.add_argument('--interval', type=float, default=DEFAULT_POLL_INTERVAL, help="폴더 확인 간격 (초)")
+    parser.add_argument('--once', action='store_true', help="변경 사항을 한 번만 반영하고 종료")
+    args = parser.parse_args()
+
+    watcher = BattleWatcher(args.folder, OUTPUT_FINAL_FILE_PATH, OUTPUT_INDIVIDUAL_FOLDER)
+    if args.once:
+        # 첫 확인에서는 서명을 기록만 하므로 두 번 확인
+        watcher.poll()
+        watcher.poll()
+        return
+    watcher.run(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,13 @@
 # scripts/battle/rank_calculator.py
 
 import glob
-import json
 import logging
 import os
 import sys
 
 import polars as pl
 
-from scripts.plugin_loader import PluginLoader
+from scripts.plugin_loader import get_loader
 
 # 현재 스크립트의 상위 두 경로를 추가하여 plugin_loader.py 파일을 불러옴
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -17,8 +16,14 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# PluginLoader 인스턴스 생성
-plugin_loader = PluginLoader()
+# 프로세스 전체에서 공유하는 PluginLoader 사용
+plugin_loader = get_loader()
+
+# 게임 파일 폴더 (실행 위치와 관계없이 이 파일 기준)
+BATTLES_RANK_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../data/battles_rank'))
+# 결과 파일 경로 (file_utils 기준 상대 경로)
+OUTPUT_FINAL_FILE_PATH = '../data/result_battles/weekly_rank_score.json'
+OUTPUT_INDIVIDUAL_FOLDER = '../data/result_battles/individual_games'
 
 
 def ensure_column_exists(df, column_name, default_value):
@@ -103,16 +108,19 @@ def load_recent_json_files(folder_path, pattern, recent_n=3):
 
 def main():
     # 입력 폴더 및 출력 파일 경로 설정
-    folder_path = '../../data/battles_rank'
-    output_final_file_path = '../data/result_battles/weekly_rank_score.json'
-    output_individual_folder = '../data/result_battles/individual_games'
+    folder_path = BATTLES_RANK_DIR
+    output_final_file_path = OUTPUT_FINAL_FILE_PATH
+    output_individual_folder = OUTPUT_INDIVIDUAL_FOLDER
+
+    # 입력 파일 형식 (FILE_UTILS_INPUT_FORMAT), 결과 파일 형식은 FILE_UTILS_RESULT_FORMAT으로 설정
+    input_extension = plugin_loader.file_utils.get_input_extension()
 
     # 개별 게임 결과를 저장할 폴더가 없으면 생성
     os.makedirs(output_individual_folder, exist_ok=True)
 
     # TDDO: recent_n 수정 작업
     try:
-        recent_files = load_recent_json_files(folder_path, 'battle_*.json', recent_n=3)
+        recent_files = load_recent_json_files(folder_path, f'battle_*{input_extension}', recent_n=3)
         logger.info(f"Loaded {len(recent_files)} recent JSON files from '{folder_path}'.")
     except Exception as e:
         logger.error(f"Failed to load JSON files from '{folder_path}': {e}", exc_info=True)
@@ -136,21 +144,15 @@ def main():
 
     # 각 게임별로 데이터 처리
     for idx, file_path in enumerate(recent_files, start=1):
-        # JSON 파일 읽기
+        # 게임 파일을 Polars DataFrame으로 읽기 (JSON, Parquet, Arrow IPC)
+        # file_utils는 상대 경로를 helpers 폴더 기준으로 해석하므로 현재 위치 기준 절대 경로로 전달
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            game_df = plugin_loader.file_utils.load_data_frame(os.path.abspath(file_path))
             logger.info(f"Loaded data from '{file_path}'.")
         except Exception as e:
             logger.error(f"Failed to load data from '{file_path}': {e}", exc_info=True)
             continue
 
-        if not data:
-            logger.warning(f"No data found in '{file_path}'. Skipping.")
-            continue
-
-        # 데이터를 Polars DataFrame으로 변환
-        game_df = pl.DataFrame(data)
         if game_df.is_empty():
             logger.warning(f"Empty DataFrame for '{file_path}'. Skipping.")
             continue
@@ -190,7 +192,7 @@ def main():
         #     individual_game_file = os.path.join(output_individual_folder, f'game_{idx}_rank_score.json')
         #
         #     # rank와 score도 포함하여 저장
-        #     plugin_loader.file_utils.save_to_json(individual_game_file, final_game_df)
+        #     plugin_loader.file_utils.save_data_frame(individual_game_file, final_game_df)
         #     logger.info(f"Saved individual game DataFrame with rank and score to '{individual_game_file}'.")
         # except Exception as e:
         #     logger.error(f"Failed to save individual game DataFrame to '{individual_game_file}': {e}", exc_info=True)
@@ -253,9 +255,9 @@ def main():
             pl.col(column_name).fill_null(0)
         )
 
-    # 최종 결과를 JSON 파일로 저장
+    # 최종 결과를 설정된 형식으로 저장
     try:
-        plugin_loader.file_utils.save_to_json(output_final_file_path, final_df)
+        plugin_loader.file_utils.save_data_frame(output_final_file_path, final_df, skip_unchanged=True)
         logger.info(f"Saved final aggregated DataFrame to '{output_final_file_path}'.")
     except Exception as e:
         logger.error(f"Failed to save final aggregated DataFrame to '{output_final_file_path}': {e}", exc_info=True)
@@ -4,7 +4,7 @@ import logging
 import os
 import sys
 import polars as pl
-from scripts.plugin_loader import PluginLoader
+from scripts.plugin_loader import get_loader
 
 # 현재 스크립트의 상위 두 경로를 추가하여 plugin_loader.py 파일을 불러옴
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -13,14 +13,17 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# PluginLoader 인스턴스 생성
-plugin_loader = PluginLoader()
+# 프로세스 전체에서 공유하는 PluginLoader 사용
+plugin_loader = get_loader()
+
+# 폴더 내 JSON 파일을 동시에 읽을 스레드 수
+LOAD_WORKERS = 8
 
 
 def ensure_column_exists(df, column_name, default_value):
-    """DataFrame에 지정된 열이 없을 경우, 기본값으로 추가."""
-    if column_name not in df.columns:
-        return df.with_columns(pl.Series(column_name, [default_value] * df.height))
+    """DataFrame(또는 LazyFrame)에 지정된 열이 없을 경우, 기본값으로 추가."""
+    if column_name not in df.collect_schema().names():
+        return df.with_columns(pl.lit(default_value).alias(column_name))
     return df
 
 
@@ -50,25 +53,21 @@ def main():
     folder_path = '../data/battles'
     output_file_path = '../data/result/grouped_rank_score.json'
 
-    # JSON 파일 불러오기
+    # 배틀 데이터 불러오기 (LazyFrame)
     try:
-        all_data = plugin_loader.file_utils.load_json_files_from_folder(folder_path)
-        logger.info(f"Loaded JSON data from '{folder_path}'.")
+        battles_lf = plugin_loader.file_utils.load_battles(folder_path, max_workers=LOAD_WORKERS)
+        logger.info(f"Loaded battle data from '{folder_path}'.")
     except Exception as e:
-        logger.error(f"Failed to load JSON data from '{folder_path}': {e}", exc_info=True)
+        logger.error(f"Failed to load battle data from '{folder_path}': {e}", exc_info=True)
         return
 
-    if not all_data:
-        logger.error("No data loaded from the JSON files. Exiting.")
+    if battles_lf is None:
+        logger.error("No data loaded from the battle files. Exiting.")
         return
 
-    # 데이터를 Polars DataFrame으로 변환
-    combined_df = pl.DataFrame(all_data)
-    logger.info("Converted JSON data to Polars DataFrame.")
-
     # play_count 열이 존재하지 않으면 기본 값 0으로 설정
-    combined_df = ensure_column_exists(combined_df, 'play_count', 0)
-    logger.info("Ensured 'play_count' column exists in DataFrame.")
+    battles_lf = ensure_column_exists(battles_lf, 'play_count', 0)
+    logger.info("Ensured 'play_count' column exists in battle data.")
 
     # status가 1인 member_id 목록 필터링
     try:
@@ -79,16 +78,11 @@ def main():
         logger.error(f"Failed to load active member information: {e}", exc_info=True)
         return
 
-    combined_df = combined_df.filter(pl.col('member_id').is_in(active_member_ids))
-    logger.info("Filtered DataFrame to include only active members.")
-
-    # rank_score 계산 및 play_count 갱신
-    combined_df = calculate_rank_and_play_count(combined_df)
-    logger.info("Calculated 'rank_score' and updated 'play_count'.")
-
-    # member_id 별로 그룹화하여 rank_score와 play_count의 합계 계산
-    grouped_df = group_by_member_id(combined_df)
-    logger.info("Grouped DataFrame by 'member_id' and aggregated 'rank_score' and 'play_count'.")
+    # 활성 멤버 필터링, rank_score 계산, member_id 별 합계를 한 번에 실행
+    # (NDJSON 스캔이면 필터와 필요한 열 선택이 리더로 전달됨)
+    battles_lf = battles_lf.filter(pl.col('member_id').is_in(active_member_ids))
+    grouped_df = group_by_member_id(calculate_rank_and_play_count(battles_lf)).collect()
+    logger.info("Filtered active members and aggregated 'rank_score' and 'play_count' by 'member_id'.")
 
     # 랭킹 데이터와 활성 멤버 정보 join
     final_df = active_members_df.join(grouped_df, on='member_id', how='left')
@@ -107,9 +101,9 @@ def main():
     )
     logger.info("Sorted DataFrame by 'rank_score' and assigned ranks.")
 
-    # 결과를 JSON 파일로 저장
+    # 결과를 설정된 형식으로 저장 (FILE_UTILS_RESULT_FORMAT, 기본값: JSON)
     try:
-        plugin_loader.file_utils.save_to_json(output_file_path, final_df)
+        plugin_loader.file_utils.save_data_frame(output_file_path, final_df, skip_unchanged=True)
         logger.info(f"Saved final DataFrame to '{output_file_path}'.")
     except Exception as e:
         logger.error(f"Failed to save final DataFrame to '{output_file_path}': {e}", exc_info=True)
@@ -0,0 +1,66 @@
+# scripts/benchmark/json_codec_benchmark.py
+
+import argparse
+import glob
+import logging
+import os
+import sys
+import timeit
+
+# 현재 스크립트의 상위 두 경로를 추가하여 helpers 패키지를 불러옴
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from helpers.file_utils import JSON_CODECS  # noqa: E402
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../data/battles_rank'))
+
+
+def load_payloads(data_dir):
+    """벤치마크에 사용할 JSON 파일 내용을 bytes로 읽어 반환"""
+    payloads = []
+    for file_path in sorted(glob.glob(os.path.join(data_dir, '*.json'))):
+        with open(file_path, 'rb') as f:
+            payloads.append(f.read())
+    return payloads
+
+
+def benchmark_codec(codec, payloads, objects, repeat, number):
+    """디코딩, pretty 인코딩, compact 인코딩의 파일당 평균 시간(ms)을 반환"""
+    def best_per_file(func):
+        return min(timeit.repeat(func, repeat=repeat, number=number)) / number / len(payloads) * 1000
+
+    return {
+        'loads': best_per_file(lambda: [codec.loads(payload) for payload in payloads]),
+        'dumps_pretty': best_per_file(lambda: [codec.dumps(obj, pretty=True) for obj in objects]),
+        'dumps_compact': best_per_file(lambda: [codec.dumps(obj, pretty=False) for obj in objects]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="설치된 JSON 백엔드별 인코딩/디코딩 시간 비교")
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help="JSON 파일 폴더 (기본값: data/battles_rank)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.data_dir)
+    if not payloads:
+        logger.error(f"{args.data_dir}에 JSON 파일이 없습니다.")
+        return
+
+    objects = [JSON_CODECS['json'].loads(payload) for payload in payloads]
+    total_kb = sum(len(payload) for payload in payloads) / 1024
+    logger.info(f"{len(payloads)}개 파일 ({total_kb:.1f} KB), 파일당 평균 시간 (ms)")
+
+    print(f"{'backend':<10}{'loads':>12}{'dumps_pretty':>16}{'dumps_compact':>16}")
+    for name, codec in JSON_CODECS.items():
+        result = benchmark_codec(codec, payloads, objects, args.repeat, args.number)
+        print(f"{name:<10}{result['loads']:>12.4f}{result['dumps_pretty']:>16.4f}{result['dumps_compact']:>16.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,13 +7,13 @@ import os
 import sys
 import glob
 from datetime import datetime
-from scripts.plugin_loader import PluginLoader
+from scripts.plugin_loader import get_loader
 
 # 현재 스크립트의 상위 두 경로를 추가하여 plugin_loader.py 파일을 불러옴
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-# PluginLoader 인스턴스 생성
-plugin_loader = PluginLoader()
+# 프로세스 전체에서 공유하는 PluginLoader 사용
+plugin_loader = get_loader()
 
 
 def load_json_files(data_dir, file_pattern):
@@ -0,0 +1,54 @@
+# scripts/data/archive_battle_backups.py
+
+import argparse
+import glob
+import logging
+import os
+import sys
+
+from scripts.plugin_loader import get_loader
+
+# 현재 스크립트의 상위 두 경로를 추가하여 plugin_loader.py 파일을 불러옴
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 프로세스 전체에서 공유하는 PluginLoader 사용
+plugin_loader = get_loader()
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../data'))
+# 월별 백업 폴더 패턴 (battles_YYMM, YYYY_MM)
+BACKUP_FOLDER_PATTERNS = [
+    os.path.join(DATA_DIR, 'backup_battles', 'battles_[0-9][0-9][0-9][0-9]'),
+    os.path.join(DATA_DIR, 'result_battles', 'backup', '[0-9][0-9][0-9][0-9]_[0-9][0-9]'),
+]
+
+
+def main():
+    """월별 백업 폴더를 폴더 하나당 .zip 아카이브 하나로 옮기는 마이그레이션"""
+    parser = argparse.ArgumentParser(description="월별 배틀 백업 폴더를 압축 아카이브로 변환")
+    parser.add_argument('--compression', default='lzma', help="압축 방식: lzma, deflate (기본값: lzma)")
+    parser.add_argument('--remove-source', action='store_true', help="검증이 끝난 원본 폴더 삭제")
+    args = parser.parse_args()
+
+    folders = sorted(
+        folder for pattern in BACKUP_FOLDER_PATTERNS for folder in glob.glob(pattern) if os.path.isdir(folder)
+    )
+    if not folders:
+        logger.info("변환할 백업 폴더가 없습니다.")
+        return
+
+    for folder in folders:
+        try:
+            archive_path = plugin_loader.file_utils.archive_folder(
+                folder, compression=args.compression, remove_source=args.remove_source
+            )
+            logger.info(f"Archived '{folder}' -> '{archive_path}'")
+        except Exception as e:
+            logger.error(f"Failed to archive '{folder}': {e}", exc_info=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# scripts/data/convert_battle_format.py
+
+import argparse
+import glob
+import logging
+import os
+import sys
+
+from scripts.plugin_loader import get_loader
+
+# 현재 스크립트의 상위 두 경로를 추가하여 plugin_loader.py 파일을 불러옴
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 프로세스 전체에서 공유하는 PluginLoader 사용
+plugin_loader = get_loader()
+
+DEFAULT_BATTLES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../data/battles_rank'))
+
+
+def main():
+    """battles_rank의 JSON 게임 파일을 NDJSON, Parquet 또는 Arrow IPC로 변환 (FILE_UTILS_INPUT_FORMAT과 함께 사용)"""
+    parser = argparse.ArgumentParser(description="배틀 게임 JSON 파일을 열 단위 형식으로 변환")
+    parser.add_argument('--folder', default=DEFAULT_BATTLES_DIR, help="변환할 폴더 (기본값: data/battles_rank)")
+    parser.add_argument('--format', default='parquet', help="변환할 형식: ndjson, parquet, ipc (쉼표로 여러 개 가능)")
+    args = parser.parse_args()
+
+    folder_path = os.path.abspath(args.folder)
+    for file_path in sorted(glob.glob(os.path.join(folder_path, 'battle_*.json'))):
+        try:
+            game_df = plugin_loader.file_utils.load_data_frame(file_path)
+            saved_paths = plugin_loader.file_utils.save_data_frame(file_path, game_df, formats=args.format)
+            logger.info(f"Converted '{file_path}' -> {saved_paths}")
+        except Exception as e:
+            logger.error(f"Failed to convert '{file_path}': {e}", exc_info=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
+import argparse
 import logging
 import os
 import sys
 
-from scripts.plugin_loader import PluginLoader
+from scripts.plugin_loader import get_loader
 
 # 현재 스크립트의 상위 두 경로를 추가하여 plugin_loader.py 파일을 불러옴
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -11,11 +12,16 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# PluginLoader 인스턴스 생성
-plugin_loader = PluginLoader()
+# 프로세스 전체에서 공유하는 PluginLoader 사용
+plugin_loader = get_loader()
 
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="멤버 데이터의 이름을 정정하고 ID를 부여")
+    parser.add_argument('--learn', action='store_true',
+                        help="근사 검색으로 정정한 이름을 학습 정정표에 저장 (다음 실행부터 바로 적용되므로 검토 후 사용)")
+    args = parser.parse_args(argv)
+
     # 입력 폴더 및 출력 파일 경로 설정
     data_file = '../data/members/member_data.json'
     output_file_path = '../data/result/member_data_with_ids.json'
@@ -27,16 +33,18 @@ def main():
     - data_file (str): JSON 데이터를 읽어올 파일 경로
     - output_directory (str): 저장할 파일 디렉토리 경로
     """
-    # 멤버 기준 데이터 로드
-    members = plugin_loader.members_utils.get_all_members()
-
     # JSON 파일로부터 데이터를 로드
     data = plugin_loader.file_utils.load_single_json(data_file)
     if not data:  # 데이터가 없으면 실행 중단
         return
 
-    # 데이터에 id를 할당후 정렬
-    data_with_ids = plugin_loader.members_utils.assign_ids(data, members)
+    # OCR 오타를 정정표와 근사 검색으로 바로잡음
+    data, unresolved = plugin_loader.name_corrector.correct_records(data, learn=args.learn)
+    if unresolved:
+        logger.warning(f"정정하지 못한 이름: {unresolved}")
+
+    # members.json의 이름 색인으로 id를 할당후 정렬
+    data_with_ids = plugin_loader.members_utils.assign_ids(data)
     sorted_data = sorted(data_with_ids, key=lambda x: x.get('rank', float('inf')))
 
     # 결과를 JSON 파일로 저장
@@ -1,7 +1,9 @@
 import logging
 import os
 import sys
-from scripts.plugin_loader import PluginLoader
+from collections import Counter
+
+from scripts.plugin_loader import get_loader
 
 # 현재 스크립트의 상위 두 경로를 추가하여 plugin_loader.py 파일을 불러옴
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -10,8 +12,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# PluginLoader 인스턴스 생성
-plugin_loader = PluginLoader()
+# 프로세스 전체에서 공유하는 PluginLoader 사용
+plugin_loader = get_loader()
 
 def validate_members(data):
     """
@@ -26,18 +28,17 @@ def validate_members(data):
     - bool: 모든 멤버가 존재하면 True, 아니면 False.
     - list: 존재하지 않는 멤버 이름 목록.
     """
-    # 활성 멤버 목록 가져오기
-    active_members = plugin_loader.members_utils.get_active_members()
-    active_member_names = {info['name'] for info in active_members.values()}
+    # 활성 멤버 이름 색인 가져오기
+    active_member_names = plugin_loader.members_utils.get_member_store().active_names
+
+    # 데이터의 이름별 개수를 한 번만 계산하여 존재 여부와 중복 확인에 사용
+    name_counts = Counter(member['name'] for member in data)
 
     # 데이터에서 존재하지 않는 멤버 이름 찾기
-    missing_in_data = [name for name in active_member_names if name not in {member['name'] for member in data}]
+    missing_in_data = [name for name in active_member_names if name not in name_counts]
     missing_members = [member['name'] for member in data if member['name'] not in active_member_names]
 
     # 중복된 이름 확인
-    name_counts = {}
-    for member in data:
-        name_counts[member['name']] = name_counts.get(member['name'], 0) + 1
     duplicate_names = [name for name, count in name_counts.items() if count > 1]
 
     # 결과 반환
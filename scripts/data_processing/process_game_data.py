@@ -2,7 +2,10 @@ import logging
 import os
 import sys
 
-from scripts.plugin_loader import PluginLoader
+import polars as pl
+
+from helpers.members_utils import join_ids_by_name
+from scripts.plugin_loader import get_loader
 
 # 현재 스크립트의 상위 두 경로를 추가하여 plugin_loader.py 파일을 불러옴
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -11,62 +14,82 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# PluginLoader 인스턴스 생성
-plugin_loader = PluginLoader()
+# 프로세스 전체에서 공유하는 PluginLoader 사용
+plugin_loader = get_loader()
+
+
+# games 기준 데이터
+GAMES = {
+    1: {'name': '뚫어뚫어'},
+    2: {'name': '뿌려뿌려'},
+    3: {'name': '무찔무찔'},
+    4: {'name': '뛰어말어'},
+    5: {'name': '높이높이'},
+    6: {'name': '넘어넘어'},
+    7: {'name': '놓아놓아'},
+    8: {'name': '빙글빙글'},
+    9: {'name': '뿌셔뿌셔'},
+    10: {'name': '미끌미끌'},
+    11: {'name': '돌아돌아'},
+    12: {'name': '달려달려'},
+    13: {'name': '올라올라'},
+    14: {'name': '어푸어푸'},
+    15: {'name': '붙어붙어'},
+    16: {'name': '날아날아'},
+    17: {'name': '날려날려'},
+    18: {'name': '건너건너'},
+    19: {'name': '폴짝폴짝'},
+    20: {'name': '쏘아쏘아'},
+    21: {'name': '오락가락'},
+    22: {'name': '삼단정리'},
+    23: {'name': '니편내편'},
+    24: {'name': '가둬가둬'}
+}
+
+# 게임 이름 -> ID 조회용 (assign_ids, assign_ids_df에서 공유)
+GAME_NAME_TO_ID = {value['name']: key for key, value in GAMES.items()}
+GAMES_LOOKUP_DF = pl.DataFrame(
+    {'name': list(GAME_NAME_TO_ID.keys()), 'id': list(GAME_NAME_TO_ID.values())},
+    schema={'name': pl.String, 'id': pl.Int64},
+)
 
 
 def assign_ids(data):
-    # games 기준 데이터
-    games = {
-        1: {'name': '뚫어뚫어'},
-        2: {'name': '뿌려뿌려'},
-        3: {'name': '무찔무찔'},
-        4: {'name': '뛰어말어'},
-        5: {'name': '높이높이'},
-        6: {'name': '넘어넘어'},
-        7: {'name': '놓아놓아'},
-        8: {'name': '빙글빙글'},
-        9: {'name': '뿌셔뿌셔'},
-        10: {'name': '미끌미끌'},
-        11: {'name': '돌아돌아'},
-        12: {'name': '달려달려'},
-        13: {'name': '올라올라'},
-        14: {'name': '어푸어푸'},
-        15: {'name': '붙어붙어'},
-        16: {'name': '날아날아'},
-        17: {'name': '날려날려'},
-        18: {'name': '건너건너'},
-        19: {'name': '폴짝폴짝'},
-        20: {'name': '쏘아쏘아'},
-        21: {'name': '오락가락'},
-        22: {'name': '삼단정리'},
-        23: {'name': '니편내편'},
-        24: {'name': '가둬가둬'}
-    }
-
     """
     주어진 데이터에 게임 이름을 기준으로 ID를 부여하는 함수.
 
     Parameters:
     - data (list of dict): 플레이 정보가 담긴 데이터 리스트
-    - games (dict): 게임 이름과 ID가 포함된 기준 데이터
 
     Returns:
     - list of dict: ID가 부여된 데이터
     """
-    # name을 기준으로 id 맵핑
-    id_map = {value['name']: key for key, value in games.items()}
-
     # 데이터를 id를 기준으로 변환
     for game in data:
-        if game['name'] in id_map:
-            game['id'] = id_map[game['name']]  # name에 맞는 id를 부여
+        if game['name'] in GAME_NAME_TO_ID:
+            game['id'] = GAME_NAME_TO_ID[game['name']]  # name에 맞는 id를 부여
         else:
             print(f"Warning: '{game['name']}' is not in the games dictionary, skipping...")
 
     return data
 
 
+def assign_ids_df(df):
+    """
+    DataFrame의 게임 이름에 ID를 한 번의 join으로 부여 (assign_ids의 DataFrame 버전).
+
+    Parameters:
+    - df (pl.DataFrame): 'name' 열이 있는 플레이 데이터
+
+    Returns:
+    - Tuple[pl.DataFrame, pl.DataFrame]: (id가 부여된 행, games에 없는 이름의 행)
+    """
+    assigned_df, unmatched_df = join_ids_by_name(df, GAMES_LOOKUP_DF, 'id')
+    if not unmatched_df.is_empty():
+        logger.warning(f"games에 없는 게임 이름: {unmatched_df['name'].unique(maintain_order=True).to_list()}")
+    return assigned_df, unmatched_df
+
+
 def main():
     # 입력 폴더 및 출력 파일 경로 설정
     data_file = '../data/games/games_data.json'
@@ -77,7 +100,6 @@ def main():
 
     Parameters:
     - data_file (str): JSON 데이터를 읽어올 파일 경로
-    - games (dict): 게임 이름과 ID가 포함된 기준 데이터
     - output_directory (str): 저장할 파일 디렉토리 경로
     """
     # JSON 파일로부터 데이터를 로드
@@ -85,7 +107,7 @@ def main():
     if not data:  # 데이터가 없으면 실행 중단
         return
 
-    # 데이터에 id를 할당하고 id 기준으로 정렬
+    # 데이터에 id를 할당하고 id 기준으로 정렬 (원본 dict를 그대로 저장하므로 GAME_NAME_TO_ID 조회 사용)
     data_with_ids = assign_ids(data)
     sorted_data = sorted(data_with_ids, key=lambda x: x.get('id', float('inf')))
 
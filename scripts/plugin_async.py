@@ -0,0 +1,70 @@
+# scripts/plugin_async.py
+
+import asyncio
+import functools
+import inspect
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional
+
+from scripts.plugin_worker import ProcessPluginMethod
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPluginFacade:
+    """
+    asyncio facade over a PluginLoader.
+
+    `await facade.file_utils.load_single_json(path)` runs blocking plugin methods on a bounded
+    thread pool, awaits `async def` plugin methods directly and awaits process-mode plugin
+    methods through their worker Future, so many files can be loaded concurrently.
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(self, plugin_loader: Any, max_workers: Optional[int] = None):
+        self._plugin_loader = plugin_loader
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or self.DEFAULT_MAX_WORKERS, thread_name_prefix="plugin-async"
+        )
+        self._namespaces: Dict[str, SimpleNamespace] = {}
+
+    def __getattr__(self, plugin_name: str) -> SimpleNamespace:
+        if plugin_name.startswith('_'):
+            raise AttributeError(plugin_name)
+        namespace = self._namespaces.get(plugin_name)
+        if namespace is None:
+            plugin_namespace = getattr(self._plugin_loader, plugin_name)
+            namespace = SimpleNamespace(**{
+                method_name: self._to_async(method) for method_name, method in vars(plugin_namespace).items()
+            })
+            self._namespaces[plugin_name] = namespace
+        return namespace
+
+    def _to_async(self, method: Callable) -> Callable:
+        """플러그인 메서드를 await 가능한 함수로 변환"""
+        if inspect.iscoroutinefunction(method):
+            return method
+
+        if isinstance(method, ProcessPluginMethod):
+            @functools.wraps(method)
+            async def call_in_worker(*args, **kwargs):
+                return await asyncio.wrap_future(method.submit(*args, **kwargs))
+
+            return call_in_worker
+
+        @functools.wraps(method)
+        async def call_in_executor(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
+
+        return call_in_executor
+
+    def invalidate(self) -> None:
+        """플러그인 리로드 후 변환된 메서드를 다시 만들도록 캐시를 비움"""
+        self._namespaces.clear()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
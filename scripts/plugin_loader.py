@@ -3,11 +3,15 @@
 import importlib
 import os
 import sys
+import threading
 import logging
-from types import SimpleNamespace
+from types import ModuleType, SimpleNamespace
+from scripts.plugin_async import AsyncPluginFacade
 from scripts.plugin_manager import PluginManager
-from decorators.plugin_decorator import PLUGIN_METHODS
-from typing import Any
+from scripts.plugin_snapshot import PluginSnapshot
+from decorators.plugin_decorator import PluginRegistry, collect_plugin_methods, use_registry
+from decorators.plugin_stats import is_tracing_enabled
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 # 프로젝트 루트 디렉토리를 sys.path에 추가
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -20,48 +24,109 @@ logger = logging.getLogger(__name__)
 
 
 class PluginLoader:
+    """
+    helpers 폴더의 플러그인을 찾아 로드하고 `plugin_loader.<플러그인>.<메서드>`로 노출.
+
+    로더마다 플러그인 레지스트리, PluginManager, 플러그인 인스턴스를 따로 가집니다. 다만 플러그인 모듈은
+    프로세스에서 한 번만 임포트되므로, 클래스 속성에 저장된 상태(예: MembersUtils._members_cache,
+    NameCorrector._index)와 메모이즈된 메서드 결과는 모든 로더가 공유합니다.
+    """
+
     # Type hints for IDE support
-    test_plugin: Any = None
-    file_utils: Any = None
-    members_utils: Any = None
+    test_plugin: Any
+    file_utils: Any
+    members_utils: Any
+    batch_writer: Any
+    name_corrector: Any
+
+    PLUGINS_DIR = "../helpers"
+    PLUGINS_PACKAGE = "helpers"
 
-    def __init__(self):
+    def __init__(self, lazy: bool = False, use_snapshot: bool = True, snapshot_path: Optional[str] = None,
+                 plugins: Optional[Iterable[str]] = None):
+        """
+        Args:
+            lazy (bool): True이면 플러그인 모듈을 미리 임포트하지 않고,
+                `plugin_loader.members_utils`처럼 처음 접근할 때 로드합니다.
+            use_snapshot (bool): True이면 저장된 플러그인 레지스트리 스냅샷으로 탐색 과정을 건너뜁니다.
+                헬퍼 파일이 변경되면 스냅샷은 자동으로 다시 빌드됩니다.
+            snapshot_path (Optional[str]): 스냅샷 파일 경로 (기본값: helpers/__pycache__/plugin_registry.json)
+            plugins (Optional[Iterable[str]]): 이 로더에서 사용할 플러그인 이름 목록 (기본값: 전체).
+                로더마다 별도의 플러그인 레지스트리를 가지므로 서로 다른 플러그인 구성을 동시에 사용할 수 있습니다.
+        """
         self.plugin_manager = PluginManager()
-        self.register_and_load_plugins()
+        self.plugin_manager.dependency_resolver = self._resolve_dependency
+        self.registry = PluginRegistry()  # 이 로더 인스턴스에 등록된 플러그인 -> 메서드 목록
+        self.enabled_plugins: Optional[Set[str]] = set(plugins) if plugins is not None else None
+        self.lazy = lazy
+        self.use_snapshot = use_snapshot
+        self.snapshot_path = snapshot_path
+        self._lazy_plugins: Dict[str, Dict[str, Any]] = {}  # 아직 로드되지 않은 플러그인 이름 -> 플러그인 정보
+        self._aio: Optional[AsyncPluginFacade] = None
+        if lazy:
+            self.discover_plugins()
+        else:
+            self.register_and_load_plugins()
+        if is_tracing_enabled():
+            self.plugin_manager.dump_stats_at_exit()
         # self.print_plugin_status()
 
+    def __getattr__(self, name: str) -> Any:
+        # 인스턴스/클래스 속성에 없는 이름만 여기로 들어옴 (지연 로딩 대상 확인)
+        lazy_plugins = self.__dict__.get('_lazy_plugins', {})
+        if name in lazy_plugins:
+            return self._resolve_lazy_plugin(name)
+        raise AttributeError(f"'{type(self).__name__}' object has no plugin or attribute '{name}'")
+
+    @property
+    def aio(self) -> AsyncPluginFacade:
+        """
+        asyncio 파사드: `await plugin_loader.aio.file_utils.load_single_json(path)`.
+        블로킹 메서드는 제한된 스레드 풀에서 실행됩니다.
+        """
+        if self._aio is None:
+            self._aio = AsyncPluginFacade(self)
+        return self._aio
+
+    def discover_plugins(self) -> Dict[str, Dict[str, Any]]:
+        """플러그인 디렉토리에서 플러그인 모듈 파일만 찾아 지연 로딩 대상으로 기록 (임포트하지 않음)"""
+        plugins_dir = self._get_absolute_path(self.PLUGINS_DIR)
+        logger.info(f"플러그인 디렉토리: {plugins_dir}")
+
+        snapshot_plugins = self._load_snapshot_plugins(plugins_dir)
+        if snapshot_plugins is not None:
+            for plugin_name, info in snapshot_plugins.items():
+                if plugin_name not in self.plugin_manager.plugins and self._is_enabled(plugin_name):
+                    self._lazy_plugins[plugin_name] = info
+        else:
+            for filename in os.listdir(plugins_dir):
+                if filename.endswith(".py") and not filename.startswith("__"):
+                    plugin_name = filename[:-3]
+                    if plugin_name not in self.plugin_manager.plugins and self._is_enabled(plugin_name):
+                        self._lazy_plugins[plugin_name] = {'path': os.path.join(plugins_dir, filename)}
+
+        logger.debug(f"지연 로딩 플러그인 발견: {list(self._lazy_plugins)}")
+        return dict(self._lazy_plugins)
+
     def register_and_load_plugins(self):
         """디렉토리 내의 모든 플러그인 모듈을 자동으로 발견하여 등록하고 로드"""
         try:
-            plugins_dir = self._get_absolute_path("../helpers")
+            plugins_dir = self._get_absolute_path(self.PLUGINS_DIR)
             logger.info(f"플러그인 디렉토리: {plugins_dir}")
 
-            # 플러그인 디렉토리 내의 모든 .py 파일을 찾아 임포트
-            for filename in os.listdir(plugins_dir):
-                if filename.endswith(".py") and not filename.startswith("__"):
-                    module_name = filename[:-3]
-                    module_path = os.path.join(plugins_dir, filename)
-                    full_module_name = f"helpers.{module_name}"
-                    logger.debug(f"플러그인 모듈 발견: {module_name} ({module_path})")
-
-                    if full_module_name not in sys.modules:
-                        importlib.import_module(full_module_name)
-                        logger.info(f"플러그인 모듈 '{full_module_name}' 임포트 완료.")
-                    else:
-                        logger.info(f"플러그인 모듈 '{full_module_name}' 이미 임포트됨.")
-
-            logger.info(f"등록된 플러그인 메서드: {PLUGIN_METHODS}")  # 등록된 메서드 확인
-
-            for plugin_name, methods in PLUGIN_METHODS.items():
-                plugin_path = f"../helpers/{plugin_name}.py"
-                absolute_path = self._get_absolute_path(plugin_path)
-
-                if os.path.exists(absolute_path):
-                    logger.debug(f"'{plugin_name}' 플러그인의 경로: {absolute_path}")
-                    self.plugin_manager.add_plugin_info(plugin_name, absolute_path, methods)
-                    logger.info(f"'{plugin_name}' 플러그인이 등록되었습니다.")
-                else:
-                    logger.error(f"'{plugin_name}' 플러그인 경로를 찾을 수 없습니다: {absolute_path}")
+            snapshot_plugins = self._load_snapshot_plugins(plugins_dir)
+            if snapshot_plugins is not None:
+                # 스냅샷이 최신이면 디렉토리 탐색 및 모듈 스캔 없이 바로 등록
+                for plugin_name, info in snapshot_plugins.items():
+                    if not self._is_enabled(plugin_name):
+                        continue
+                    self.registry.merge({plugin_name: info['methods']})
+                    self.plugin_manager.add_plugin_info(
+                        plugin_name, info['path'], info['methods'],
+                        module_name=info['module'], class_name=info['class_name']
+                    )
+            else:
+                self._register_plugins_by_import(plugins_dir)
 
             # 모든 플러그인 로드
             self.plugin_manager.load_all_plugins()
@@ -73,30 +138,164 @@ class PluginLoader:
         except Exception as e:
             logger.error(f"플러그인 로드 중 오류 발생: {e}", exc_info=True)
 
+    def _load_snapshot_plugins(self, plugins_dir: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """플러그인 레지스트리 스냅샷을 읽어 플러그인 정보를 반환 (사용하지 않거나 실패하면 None)"""
+        if not self.use_snapshot:
+            return None
+        try:
+            snapshot = PluginSnapshot.load_or_build(plugins_dir, self.snapshot_path)
+        except Exception as e:
+            logger.warning(f"플러그인 스냅샷을 사용할 수 없어 디렉토리를 탐색합니다: {e}")
+            return None
+        return snapshot.plugins()
+
+    def _register_plugins_by_import(self, plugins_dir: str):
+        """플러그인 모듈을 모두 임포트하여 이 로더의 레지스트리 기준으로 플러그인 정보를 등록"""
+        # 플러그인 디렉토리 내의 모든 .py 파일을 찾아 임포트
+        for filename in os.listdir(plugins_dir):
+            if filename.endswith(".py") and not filename.startswith("__"):
+                module_name = filename[:-3]
+                if not self._is_enabled(module_name):
+                    continue
+                module_path = os.path.join(plugins_dir, filename)
+                logger.debug(f"플러그인 모듈 발견: {module_name} ({module_path})")
+                self._import_plugin_module(module_name)
+
+        logger.info(f"등록된 플러그인 메서드: {dict(self.registry)}")  # 등록된 메서드 확인
+
+        for plugin_name, methods in self.registry.items():
+            if not self._is_enabled(plugin_name):
+                continue
+            plugin_path = f"{self.PLUGINS_DIR}/{plugin_name}.py"
+            absolute_path = self._get_absolute_path(plugin_path)
+
+            if os.path.exists(absolute_path):
+                logger.debug(f"'{plugin_name}' 플러그인의 경로: {absolute_path}")
+                self.plugin_manager.add_plugin_info(
+                    plugin_name, absolute_path, methods, module_name=self._full_module_name(plugin_name)
+                )
+                logger.info(f"'{plugin_name}' 플러그인이 등록되었습니다.")
+            else:
+                logger.error(f"'{plugin_name}' 플러그인 경로를 찾을 수 없습니다: {absolute_path}")
+
+    def _resolve_lazy_plugin(self, plugin_name: str) -> SimpleNamespace:
+        """지연 로딩 대상 플러그인을 처음 접근 시 한 번만 임포트/로드하고 네임스페이스를 반환"""
+        info = self._lazy_plugins[plugin_name]
+        logger.info(f"'{plugin_name}' 플러그인 지연 로딩 시작")
+
+        if 'methods' in info:
+            methods = info['methods']
+        else:
+            self._import_plugin_module(plugin_name)
+            methods = self.registry.get(plugin_name, [])
+        self.plugin_manager.add_plugin_info(
+            plugin_name, info['path'], methods,
+            module_name=info.get('module') or self._full_module_name(plugin_name),
+            class_name=info.get('class_name')
+        )
+        self.plugin_manager.load_plugin(plugin_name)
+        self._assign_plugin_namespace(plugin_name, methods)
+
+        del self._lazy_plugins[plugin_name]
+        return self.__dict__[plugin_name]
+
+    def _resolve_dependency(self, plugin_name: str) -> SimpleNamespace:
+        """플러그인 매니저가 아직 로드되지 않은 의존 플러그인(DEPENDS_ON)을 요청하면 이 로더에서 지연 로딩"""
+        if plugin_name in self._lazy_plugins:
+            return self._resolve_lazy_plugin(plugin_name)
+        raise ValueError(f"의존 플러그인 '{plugin_name}'을(를) 찾을 수 없습니다 (존재하지 않거나 plugins 목록에서 제외됨).")
+
+    def _import_plugin_module(self, module_name: str) -> ModuleType:
+        """플러그인 모듈을 한 번만 임포트하고, 모듈에 선언된 플러그인 메서드를 이 로더의 레지스트리에 반영"""
+        full_module_name = self._full_module_name(module_name)
+        module = sys.modules.get(full_module_name)
+        if module is None:
+            with use_registry(self.registry):
+                module = importlib.import_module(full_module_name)
+            logger.info(f"플러그인 모듈 '{full_module_name}' 임포트 완료.")
+        else:
+            logger.info(f"플러그인 모듈 '{full_module_name}' 이미 임포트됨.")
+
+        # 재사용된 모듈은 데코레이터가 다시 실행되지 않으므로 표시된 메서드를 직접 수집
+        self.registry.merge(collect_plugin_methods(module))
+        return module
+
+    def _is_enabled(self, plugin_name: str) -> bool:
+        return self.enabled_plugins is None or plugin_name in self.enabled_plugins
+
+    def _full_module_name(self, module_name: str) -> str:
+        return f"{self.PLUGINS_PACKAGE}.{module_name}"
+
     def _assign_plugin_methods(self):
         """플러그인의 메서드를 네임스페이스 객체에 할당"""
-        for plugin_name, methods in PLUGIN_METHODS.items():
-            plugin_namespace = SimpleNamespace()
+        for plugin_name, info in self.plugin_manager.plugin_info.items():
+            self._assign_plugin_namespace(plugin_name, info[PluginManager.PLUGIN_METHODS_KEY])
+
+    def _assign_plugin_namespace(self, plugin_name: str, methods: List[str]):
+        """단일 플러그인의 메서드를 네임스페이스 객체에 할당"""
+        plugin_namespace = SimpleNamespace()
+        for method_name in methods:
+            try:
+                method = self.plugin_manager.get_plugin_method(plugin_name, method_name)
+                setattr(plugin_namespace, method_name, method)
+            except (AttributeError, ValueError) as e:
+                logger.error(f"Failed to load method '{method_name}' from plugin '{plugin_name}': {e}")
+
+        setattr(self, plugin_name, plugin_namespace)
+
+        # Debug: Check if methods are assigned correctly
+        for method_name in methods:
+            func = getattr(plugin_namespace, method_name, None)
+            if callable(func):
+                logger.debug(f"Method '{method_name}' correctly assigned to '{plugin_name}'.")
+            else:
+                logger.error(f"Method '{method_name}' not correctly assigned to '{plugin_name}'.")
+
+    def reload_changed(self) -> List[str]:
+        """
+        변경된 플러그인 모듈만 다시 실행하고, 해당 플러그인의 네임스페이스 속성을 다시 바인딩.
+        기존 SimpleNamespace 객체를 그대로 갱신하므로 다른 플러그인과 캐시는 유지됩니다.
+        """
+        reloaded = self.plugin_manager.reload_changed()
+        if reloaded and self._aio is not None:
+            self._aio.invalidate()
+        for plugin_name in reloaded:
+            methods = self.plugin_manager.list_plugin_methods(plugin_name)
+            plugin_namespace = self.__dict__.get(plugin_name)
+            if plugin_namespace is None:
+                self._assign_plugin_namespace(plugin_name, methods)
+                continue
+
+            for method_name in list(vars(plugin_namespace)):
+                if method_name not in methods:
+                    delattr(plugin_namespace, method_name)
             for method_name in methods:
                 try:
-                    method = self.plugin_manager.get_plugin_method(plugin_name, method_name)
-                    setattr(plugin_namespace, method_name, method)
+                    setattr(plugin_namespace, method_name,
+                            self.plugin_manager.get_plugin_method(plugin_name, method_name))
                 except AttributeError as e:
-                    logger.error(f"Failed to load method '{method_name}' from plugin '{plugin_name}': {e}")
+                    logger.error(f"Failed to rebind method '{method_name}' of plugin '{plugin_name}': {e}")
+            logger.info(f"'{plugin_name}' 플러그인이 다시 로드되었습니다.")
+        return reloaded
 
-            setattr(self, plugin_name, plugin_namespace)
+    def start_auto_reload(self, interval: float = 2.0) -> threading.Event:
+        """
+        백그라운드 스레드에서 interval초마다 reload_changed()를 호출 (mtime 폴링).
 
-            # Debug: Check if methods are assigned correctly
-            for method_name in methods:
-                method = getattr(self, plugin_name, None)
-                if method:
-                    func = getattr(method, method_name, None)
-                    if callable(func):
-                        logger.debug(f"Method '{method_name}' correctly assigned to '{plugin_name}'.")
-                    else:
-                        logger.error(f"Method '{method_name}' not correctly assigned to '{plugin_name}'.")
-                else:
-                    logger.error(f"Plugin namespace for '{plugin_name}' is missing.")
+        Returns:
+            threading.Event: set()하면 폴링을 중지합니다.
+        """
+        stop_event = threading.Event()
+
+        def poll():
+            while not stop_event.wait(interval):
+                try:
+                    self.reload_changed()
+                except Exception as e:
+                    logger.error(f"플러그인 자동 리로드 중 오류 발생: {e}", exc_info=True)
+
+        threading.Thread(target=poll, name="plugin-auto-reload", daemon=True).start()
+        return stop_event
 
     def get_plugin_method(self, plugin_name: str, method_name: str) -> Any:
         """Retrieve a specific plugin method. This might be redundant if already handled in PluginManager."""
@@ -116,3 +315,30 @@ class PluginLoader:
         for plugin_name in self.plugin_manager.list_plugins():
             methods = self.plugin_manager.list_plugin_methods(plugin_name)
             logger.info(f"'{plugin_name}' 모듈이 로드되었습니다. 메서드: {methods}")
+
+
+# 프로세스 전체에서 공유하는 PluginLoader (get_loader()로만 생성)
+_shared_loader: Optional[PluginLoader] = None
+_shared_loader_lock = threading.Lock()
+
+
+def get_loader() -> PluginLoader:
+    """
+    프로세스 전체에서 공유하는 PluginLoader를 반환.
+    최초 호출 시 한 번만 생성되므로 여러 스크립트를 한 프로세스에서 임포트해도
+    플러그인 탐색/로드/initialize() 비용은 한 번만 발생합니다.
+    테스트처럼 격리된 인스턴스가 필요하면 PluginLoader()를 직접 생성합니다.
+    """
+    global _shared_loader
+    if _shared_loader is None:
+        with _shared_loader_lock:
+            if _shared_loader is None:
+                _shared_loader = PluginLoader()
+    return _shared_loader
+
+
+def reset_loader() -> None:
+    """공유 PluginLoader를 제거하여 다음 get_loader() 호출 시 새로 생성되도록 함 (테스트용)"""
+    global _shared_loader
+    with _shared_loader_lock:
+        _shared_loader = None
@@ -1,10 +1,21 @@
 # scripts/plugin_manager.py
 
+import atexit
+import importlib
 import importlib.util
 import inspect
 import logging
 import os
-from typing import Any, Callable, Dict, List
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from graphlib import CycleError, TopologicalSorter
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from decorators.plugin_decorator import PLUGIN_NAME_ATTR, collect_plugin_methods
+from decorators.plugin_stats import PLUGIN_STATS
+from scripts.plugin_worker import EXECUTION_MODE_ATTR, PROCESS_EXECUTION, PluginProcessPool, ProcessPluginMethod
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -18,12 +29,32 @@ class PluginManager:
 
     PLUGIN_PATH_KEY = "path"
     PLUGIN_METHODS_KEY = "methods"
+    PLUGIN_MODULE_KEY = "module"
+    PLUGIN_CLASS_KEY = "class_name"
+    STATS_FILE_ENV_VAR = "PLUGIN_TRACE_FILE"
+    DEPENDS_ON_ATTR = "DEPENDS_ON"
+    DEFAULT_INIT_WORKERS = 4
+
+    _stats_dump_paths: List[Optional[str]] = []  # atexit에 등록된 통계 출력 경로
 
-    def __init__(self):
+    def __init__(self, process_workers: Optional[int] = None):
+        """
+        Args:
+            process_workers (Optional[int]): Worker process count for plugins declaring
+                EXECUTION_MODE = "process". Defaults to the CPU count.
+        """
+        self.process_workers = process_workers
+        self._process_pool: Optional[PluginProcessPool] = None
         self.plugins: Dict[str, Any] = {}
         self.plugin_info: Dict[str, Dict[str, Any]] = {}  # 플러그인 정보 관리
+        self._plugin_signatures: Dict[str, Optional[Tuple[int, int]]] = {}  # 로드 시점의 (mtime_ns, size)
+        self._plugin_modules: Dict[str, ModuleType] = {}
+        self.init_times: Dict[str, float] = {}  # 플러그인별 initialize()/warm_up() 소요 시간(초)
+        # plugin_info에 없는 의존 플러그인을 요청받았을 때 호출 (예: PluginLoader의 지연 로딩)
+        self.dependency_resolver: Optional[Callable[[str], Any]] = None
 
-    def add_plugin_info(self, plugin_name: str, plugin_path: str, methods: List[str]) -> None:
+    def add_plugin_info(self, plugin_name: str, plugin_path: str, methods: List[str],
+                        module_name: Optional[str] = None, class_name: Optional[str] = None) -> None:
         """
         Adds information about a plugin.
 
@@ -31,54 +62,246 @@ class PluginManager:
             plugin_name (str): The name of the plugin.
             plugin_path (str): The file path to the plugin module.
             methods (List[str]): List of method names to register from the plugin.
+            module_name (Optional[str]): The importable module name (e.g. 'helpers.file_utils').
+                When given, the module is imported once and reused from sys.modules.
+            class_name (Optional[str]): The plugin class to instantiate, if already known.
+                Skips scanning the module for classes.
         """
         if plugin_name in self.plugin_info:
             logger.warning(f"Plugin info for '{plugin_name}' already exists.")
         else:
             self.plugin_info[plugin_name] = {
                 self.PLUGIN_PATH_KEY: plugin_path,
-                self.PLUGIN_METHODS_KEY: methods
+                self.PLUGIN_METHODS_KEY: methods,
+                self.PLUGIN_MODULE_KEY: module_name,
+                self.PLUGIN_CLASS_KEY: class_name
             }
             logger.info(f"Plugin info for '{plugin_name}' added.")
 
-    def load_all_plugins(self) -> None:
+    def load_all_plugins(self, max_workers: Optional[int] = None) -> None:
         """
         Loads all plugins based on the stored plugin_info.
+
+        Modules are imported one after another, then the plugins are initialized in
+        dependency order on a thread pool (see initialize_plugins).
+
+        Args:
+            max_workers (Optional[int]): Maximum number of concurrent initializations.
         """
-        for plugin_name, info in self.plugin_info.items():
-            plugin_path = info.get(self.PLUGIN_PATH_KEY)
-            if not os.path.exists(plugin_path):
-                logger.error(f"Plugin '{plugin_name}' path does not exist: {plugin_path}")
+        loaded = []
+        for plugin_name in self.plugin_info:
+            if plugin_name in self.plugins:
                 continue
-
             try:
-                plugin = self._load_plugin(plugin_name, plugin_path)
-                self.plugins[plugin_name] = plugin
-                logger.info(f"Plugin '{plugin_name}' successfully loaded.")
-
-                self._initialize_plugin(plugin_name, plugin)
+                self._load_plugin_instance(plugin_name)
+                loaded.append(plugin_name)
             except Exception as e:
                 logger.error(f"Failed to load plugin '{plugin_name}': {e}")
                 # Continue loading other plugins instead of raising the exception
                 continue
 
-    def _load_plugin(self, plugin_name: str, plugin_path: str) -> Any:
+        self.initialize_plugins(loaded, max_workers)
+
+    def load_plugin(self, plugin_name: str) -> Any:
+        """
+        Loads and initializes a single plugin based on the stored plugin_info.
+
+        Args:
+            plugin_name (str): The name of the plugin.
+
+        Returns:
+            Any: The loaded plugin module or instance.
+
+        Raises:
+            ValueError: If no plugin info is registered for the plugin or one of its
+                DEPENDS_ON plugins can be neither found nor resolved.
+            FileNotFoundError: If the plugin path does not exist.
+        """
+        if plugin_name in self.plugins:
+            return self.plugins[plugin_name]
+
+        plugin = self._load_plugin_instance(plugin_name)
+
+        # 의존 플러그인을 먼저 로드/초기화 (등록되지 않았으면 dependency_resolver에 요청)
+        try:
+            for dependency in self.get_plugin_dependencies(plugin_name):
+                if dependency in self.plugins:
+                    continue
+                if dependency in self.plugin_info:
+                    self.load_plugin(dependency)
+                elif self.dependency_resolver is not None:
+                    self.dependency_resolver(dependency)
+                else:
+                    raise ValueError(f"Plugin '{plugin_name}' depends on unregistered plugin '{dependency}'.")
+        except Exception:
+            # 의존성을 채우지 못한 플러그인은 초기화하지 않은 채 남기지 않음
+            self.plugins.pop(plugin_name, None)
+            raise
+
+        self._initialize_plugin(plugin_name, plugin)
+        return plugin
+
+    def _load_plugin_instance(self, plugin_name: str) -> Any:
+        """
+        Imports and instantiates a single plugin without initializing it.
+        """
+        info = self.plugin_info.get(plugin_name)
+        if info is None:
+            raise ValueError(f"Plugin info for '{plugin_name}' is not registered.")
+
+        plugin_path = info.get(self.PLUGIN_PATH_KEY)
+        if not os.path.exists(plugin_path):
+            logger.error(f"Plugin '{plugin_name}' path does not exist: {plugin_path}")
+            raise FileNotFoundError(f"Plugin '{plugin_name}' path does not exist: {plugin_path}")
+
+        self._plugin_signatures[plugin_name] = self._file_signature(plugin_path)
+        plugin = self._load_plugin(
+            plugin_name, plugin_path, info.get(self.PLUGIN_MODULE_KEY), info.get(self.PLUGIN_CLASS_KEY)
+        )
+        self.plugins[plugin_name] = plugin
+        logger.info(f"Plugin '{plugin_name}' successfully loaded.")
+        return plugin
+
+    def get_plugin_dependencies(self, plugin_name: str) -> List[str]:
+        """
+        Returns the plugin names a loaded plugin declares in its DEPENDS_ON attribute.
+        """
+        return list(getattr(self.plugins.get(plugin_name), self.DEPENDS_ON_ATTR, None) or [])
+
+    def initialize_plugins(self, plugin_names: List[str], max_workers: Optional[int] = None) -> None:
+        """
+        Initializes loaded plugins on a thread pool in topological order of their dependencies.
+
+        A plugin starts initializing as soon as all of its dependencies among plugin_names are
+        done, so independent plugins do not add up their start-up costs. Per-plugin durations
+        are stored in self.init_times.
+
+        Args:
+            plugin_names (List[str]): Loaded plugins to initialize.
+            max_workers (Optional[int]): Maximum number of concurrent initializations.
+        """
+        if not plugin_names:
+            return
+
+        names = set(plugin_names)
+        graph = {}
+        for plugin_name in plugin_names:
+            dependencies = self.get_plugin_dependencies(plugin_name)
+            for dependency in dependencies:
+                if dependency not in names and dependency not in self.plugins:
+                    logger.warning(f"Plugin '{plugin_name}' depends on '{dependency}', which is not loaded.")
+            graph[plugin_name] = [dependency for dependency in dependencies if dependency in names]
+
+        sorter = TopologicalSorter(graph)
+        try:
+            sorter.prepare()
+        except CycleError as e:
+            logger.error(f"Circular plugin dependencies {e.args[1]}; initializing sequentially.")
+            for plugin_name in plugin_names:
+                self._initialize_plugin(plugin_name, self.plugins[plugin_name])
+            return
+
+        start = time.perf_counter()
+        workers = max_workers or min(self.DEFAULT_INIT_WORKERS, len(plugin_names))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="plugin-init") as executor:
+            pending = {}
+            while sorter.is_active():
+                for plugin_name in sorter.get_ready():
+                    future = executor.submit(self._initialize_plugin, plugin_name, self.plugins[plugin_name])
+                    pending[future] = plugin_name
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    sorter.done(pending.pop(future))
+
+        timings = {plugin_name: round(self.init_times.get(plugin_name, 0.0), 4) for plugin_name in plugin_names}
+        logger.info(f"Initialized {len(plugin_names)} plugins in {time.perf_counter() - start:.4f}s: {timings}")
+
+    def reload_changed(self) -> List[str]:
+        """
+        Re-executes only the loaded plugins whose module file changed on disk (mtime/size polling).
+
+        Other plugins, their instances and their caches are left untouched. A plugin that fails
+        to reload keeps its previous instance.
+
+        Returns:
+            List[str]: Names of the plugins that were reloaded.
+        """
+        reloaded = []
+        for plugin_name in list(self.plugins):
+            info = self.plugin_info[plugin_name]
+            plugin_path = info.get(self.PLUGIN_PATH_KEY)
+            signature = self._file_signature(plugin_path)
+            if signature is None or signature == self._plugin_signatures.get(plugin_name):
+                continue
+
+            # 실패해도 같은 변경으로 반복 재시도하지 않도록 서명을 먼저 갱신
+            self._plugin_signatures[plugin_name] = signature
+            try:
+                plugin = self._load_plugin(
+                    plugin_name, plugin_path, info.get(self.PLUGIN_MODULE_KEY), info.get(self.PLUGIN_CLASS_KEY),
+                    reload=True
+                )
+            except Exception as e:
+                logger.error(f"Failed to reload plugin '{plugin_name}', keeping the previous version: {e}")
+                continue
+
+            methods = collect_plugin_methods(self._plugin_modules[plugin_name]).get(plugin_name)
+            if methods is not None:
+                info[self.PLUGIN_METHODS_KEY] = methods
+
+            self.plugins[plugin_name] = plugin
+            self._initialize_plugin(plugin_name, plugin)
+            reloaded.append(plugin_name)
+            logger.info(f"Plugin '{plugin_name}' reloaded from '{plugin_path}'.")
+        return reloaded
+
+    @staticmethod
+    def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_plugin(self, plugin_name: str, plugin_path: str, module_name: Optional[str] = None,
+                     class_name: Optional[str] = None, reload: bool = False) -> Any:
         """
         Loads a plugin module from a given path.
 
         Args:
             plugin_name (str): The name of the plugin.
             plugin_path (str): The file path to the plugin module.
+            module_name (Optional[str]): The importable module name, if known.
+            class_name (Optional[str]): The plugin class to instantiate, if known.
+            reload (bool): Re-execute the module even if it is already imported.
 
         Returns:
             Any: The loaded plugin module or instance.
         """
-        spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Cannot find spec for plugin '{plugin_name}' at '{plugin_path}'")
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        logger.debug(f"Plugin '{plugin_name}' module loaded from '{plugin_path}'.")
+        if module_name:
+            # 이미 임포트된 모듈은 다시 실행하지 않고 sys.modules에서 재사용
+            module = sys.modules.get(module_name)
+            if module is None:
+                module = importlib.import_module(module_name)
+                logger.debug(f"Plugin '{plugin_name}' module '{module_name}' imported.")
+            elif reload:
+                module = importlib.reload(module)
+                logger.debug(f"Plugin '{plugin_name}' module '{module_name}' reloaded.")
+            else:
+                logger.debug(f"Plugin '{plugin_name}' module '{module_name}' reused from sys.modules.")
+        else:
+            spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot find spec for plugin '{plugin_name}' at '{plugin_path}'")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            logger.debug(f"Plugin '{plugin_name}' module loaded from '{plugin_path}'.")
+        self._plugin_modules[plugin_name] = module
+
+        if class_name and hasattr(module, class_name):
+            plugin_instance = getattr(module, class_name)()
+            logger.debug(f"Plugin '{plugin_name}' class '{class_name}' instantiated.")
+            return plugin_instance
 
         # Check if plugin has a class to instantiate
         classes = [
@@ -86,8 +309,13 @@ class PluginManager:
             if obj.__module__ == module.__name__
         ]
         if classes:
-            # Assume the first class is the plugin class
-            plugin_class = classes[0]
+            # Prefer the first class declaring plugin methods, so helper classes in the module are skipped
+            plugin_class = next(
+                (cls for cls in classes
+                 if any(hasattr(getattr(member, "__func__", member), PLUGIN_NAME_ATTR)
+                        for member in vars(cls).values())),
+                classes[0]
+            )
             plugin_instance = plugin_class()
             logger.debug(f"Plugin '{plugin_name}' class '{plugin_class.__name__}' instantiated.")
             return plugin_instance
@@ -104,6 +332,7 @@ class PluginManager:
             plugin (Any): The loaded plugin module or instance.
         """
         logger.info(f"Initializing plugin '{plugin_name}'.")
+        start = time.perf_counter()
 
         if hasattr(plugin, 'initialize') and callable(getattr(plugin, 'initialize')):
             try:
@@ -115,6 +344,16 @@ class PluginManager:
         else:
             logger.info(f"Plugin '{plugin_name}' does not have an 'initialize' method.")
 
+        # 선택적인 워밍업 단계 (멤버 데이터 미리 로드, 인덱스 생성 등)
+        if callable(getattr(plugin, 'warm_up', None)):
+            try:
+                plugin.warm_up()
+                logger.info(f"Plugin '{plugin_name}' warmed up.")
+            except Exception as e:
+                logger.error(f"Error during warm-up of plugin '{plugin_name}': {e}")
+
+        self.init_times[plugin_name] = time.perf_counter() - start
+
     def get_plugin_method(self, plugin_name: str, method_name: str) -> Callable:
         """
         Retrieves a specific method from a plugin.
@@ -143,12 +382,42 @@ class PluginManager:
         if hasattr(plugin, method_name):
             method = getattr(plugin, method_name)
             if callable(method):
+                if self.is_process_plugin(plugin_name):
+                    return self._process_plugin_method(plugin_name, method)
                 return method
             else:
                 raise AttributeError(f"Method '{method_name}' in plugin '{plugin_name}' is not callable.")
         else:
             raise AttributeError(f"Method '{method_name}' not found in plugin '{plugin_name}'.")
 
+    def is_process_plugin(self, plugin_name: str) -> bool:
+        """
+        Returns True if the plugin declares EXECUTION_MODE = "process" and runs in worker processes.
+        """
+        return getattr(self.plugins.get(plugin_name), EXECUTION_MODE_ATTR, None) == PROCESS_EXECUTION
+
+    def _process_plugin_method(self, plugin_name: str, method: Callable) -> ProcessPluginMethod:
+        """
+        Wraps a plugin method in a proxy that runs it in the shared worker pool.
+        """
+        if self._process_pool is None:
+            self._process_pool = PluginProcessPool(self.process_workers)
+        info = self.plugin_info[plugin_name]
+        plugin = self.plugins[plugin_name]
+        class_name = type(plugin).__name__ if not isinstance(plugin, ModuleType) else None
+        return ProcessPluginMethod(
+            self._process_pool, plugin_name, info.get(self.PLUGIN_MODULE_KEY),
+            info.get(self.PLUGIN_PATH_KEY), class_name, method
+        )
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes hosting process-mode plugins, if any were started.
+        """
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
     def list_plugins(self) -> List[str]:
         """
         Returns a list of loaded plugins.
@@ -174,3 +443,39 @@ class PluginManager:
         if plugin_name not in self.plugins:
             raise ValueError(f"Plugin '{plugin_name}' is not loaded.")
         return self.plugin_info.get(plugin_name, {}).get(self.PLUGIN_METHODS_KEY, [])
+
+    def dump_stats(self, output_path: Optional[str] = None) -> str:
+        """
+        Returns the plugin call statistics as JSON and optionally writes them to a file.
+
+        Statistics are only collected when tracing is enabled (PLUGIN_TRACE=1).
+
+        Args:
+            output_path (Optional[str]): File to write the JSON to.
+
+        Returns:
+            str: The statistics as a JSON string.
+        """
+        stats_json = PLUGIN_STATS.to_json()
+        if output_path:
+            os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(stats_json)
+            logger.info(f"Plugin call statistics written to '{output_path}'.")
+        else:
+            logger.info(f"Plugin call statistics: {stats_json}")
+        return stats_json
+
+    def dump_stats_at_exit(self, output_path: Optional[str] = None) -> None:
+        """
+        Registers dump_stats to run at process exit. Registering the same path twice is a no-op.
+
+        Args:
+            output_path (Optional[str]): File to write the JSON to. Defaults to the
+                PLUGIN_TRACE_FILE environment variable, or the log if that is unset.
+        """
+        output_path = output_path or os.environ.get(self.STATS_FILE_ENV_VAR)
+        if output_path in PluginManager._stats_dump_paths:
+            return
+        PluginManager._stats_dump_paths.append(output_path)
+        atexit.register(self.dump_stats, output_path)
@@ -0,0 +1,217 @@
+# scripts/plugin_snapshot.py
+
+import ast
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PluginSnapshot:
+    """
+    Persisted plugin registry built from the helper sources without importing them.
+
+    Each helper file is keyed by its path, mtime, size and content hash, and records the
+    plugin names, registered method names and the class PluginManager should instantiate.
+    """
+
+    VERSION = 2
+    DECORATOR_NAME = "register_plugin_method"
+    # 스냅샷 저장이 플러그인 디렉토리의 mtime을 바꾸지 않도록 __pycache__ 아래에 저장
+    DEFAULT_FILENAME = os.path.join("__pycache__", "plugin_registry.json")
+
+    MTIME_KEY = "mtime_ns"
+    SIZE_KEY = "size"
+    HASH_KEY = "sha256"
+    MODULE_KEY = "module"
+    CLASS_KEY = "class_name"
+    PLUGINS_KEY = "plugins"
+
+    def __init__(self, plugins_dir: str, snapshot_path: Optional[str] = None):
+        self.plugins_dir = os.path.abspath(plugins_dir)
+        self.snapshot_path = snapshot_path or os.path.join(self.plugins_dir, self.DEFAULT_FILENAME)
+        self.dir_mtime_ns: Optional[int] = None
+        self.modules: Dict[str, Dict[str, Any]] = {}  # 파일 이름 -> 모듈 정보
+
+    @classmethod
+    def load(cls, plugins_dir: str, snapshot_path: Optional[str] = None) -> 'PluginSnapshot':
+        """
+        Reads a persisted snapshot. A missing or unreadable file yields an empty snapshot.
+        """
+        snapshot = cls(plugins_dir, snapshot_path)
+        try:
+            with open(snapshot.snapshot_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            logger.debug(f"Plugin snapshot not found: {snapshot.snapshot_path}")
+            return snapshot
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable plugin snapshot '{snapshot.snapshot_path}': {e}")
+            return snapshot
+
+        if data.get("version") != cls.VERSION or data.get("plugins_dir") != snapshot.plugins_dir:
+            logger.debug(f"Plugin snapshot '{snapshot.snapshot_path}' is outdated and will be rebuilt.")
+            return snapshot
+
+        snapshot.dir_mtime_ns = data.get("dir_mtime_ns")
+        snapshot.modules = data.get("modules", {})
+        return snapshot
+
+    @classmethod
+    def load_or_build(cls, plugins_dir: str, snapshot_path: Optional[str] = None) -> 'PluginSnapshot':
+        """
+        Reads the persisted snapshot, refreshes changed helper files and saves it if needed.
+        """
+        snapshot = cls.load(plugins_dir, snapshot_path)
+        if snapshot.refresh():
+            snapshot.save()
+        return snapshot
+
+    def refresh(self) -> bool:
+        """
+        Brings the snapshot up to date with the plugin directory.
+
+        Only the helper files are stat'ed when nothing changed; the directory is listed only
+        when its mtime moved, and a file is re-parsed only when its content hash changed.
+
+        Returns:
+            bool: True if the snapshot was modified.
+        """
+        dir_mtime_ns = os.stat(self.plugins_dir).st_mtime_ns
+        changed = False
+
+        if dir_mtime_ns != self.dir_mtime_ns:
+            filenames = {
+                filename for filename in os.listdir(self.plugins_dir)
+                if filename.endswith(".py") and not filename.startswith("__")
+            }
+            for removed in set(self.modules) - filenames:
+                del self.modules[removed]
+                logger.debug(f"Plugin module '{removed}' removed from snapshot.")
+                changed = True
+            for added in filenames - set(self.modules):
+                self.modules[added] = {}
+            self.dir_mtime_ns = dir_mtime_ns
+            changed = True
+
+        for filename, entry in self.modules.items():
+            if self._refresh_entry(filename, entry):
+                changed = True
+
+        return changed
+
+    def _refresh_entry(self, filename: str, entry: Dict[str, Any]) -> bool:
+        """Updates a single module entry in place. Returns True if it changed."""
+        file_path = os.path.join(self.plugins_dir, filename)
+        stat = os.stat(file_path)
+        if entry.get(self.MTIME_KEY) == stat.st_mtime_ns and entry.get(self.SIZE_KEY) == stat.st_size:
+            return False
+
+        with open(file_path, 'rb') as f:
+            source = f.read()
+        digest = hashlib.sha256(source).hexdigest()
+
+        if entry.get(self.HASH_KEY) != digest:
+            module_name = f"{os.path.basename(self.plugins_dir)}.{filename[:-3]}"
+            entry.update(self._parse_module(source, file_path))
+            entry[self.MODULE_KEY] = module_name
+            entry[self.HASH_KEY] = digest
+            logger.info(f"Plugin module '{module_name}' indexed into snapshot.")
+
+        entry[self.MTIME_KEY] = stat.st_mtime_ns
+        entry[self.SIZE_KEY] = stat.st_size
+        return True
+
+    @classmethod
+    def _parse_module(cls, source: bytes, file_path: str) -> Dict[str, Any]:
+        """
+        Finds the plugin class and the decorated plugin methods in a module's source.
+
+        The class choice mirrors PluginManager._load_plugin, which instantiates the first
+        class in name order that declares plugin methods, or else the first class.
+        """
+        tree = ast.parse(source, filename=file_path)
+        class_names: List[str] = []
+        plugin_class_names: List[str] = []
+        plugins: Dict[str, List[str]] = {}
+
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            class_names.append(node.name)
+            for item in node.body:
+                if not isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    continue
+                for decorator in item.decorator_list:
+                    plugin_name = cls._plugin_name_from_decorator(decorator)
+                    if plugin_name is not None:
+                        if node.name not in plugin_class_names:
+                            plugin_class_names.append(node.name)
+                        methods = plugins.setdefault(plugin_name, [])
+                        if item.name not in methods:
+                            methods.append(item.name)
+
+        return {
+            cls.CLASS_KEY: min(plugin_class_names or class_names) if class_names else None,
+            cls.PLUGINS_KEY: plugins,
+        }
+
+    @classmethod
+    def _plugin_name_from_decorator(cls, decorator: ast.expr) -> Optional[str]:
+        if not isinstance(decorator, ast.Call) or not decorator.args:
+            return None
+        func = decorator.func
+        func_name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+        first_arg = decorator.args[0]
+        if func_name == cls.DECORATOR_NAME and isinstance(first_arg, ast.Constant) \
+                and isinstance(first_arg.value, str):
+            return first_arg.value
+        return None
+
+    def save(self) -> None:
+        """Writes the snapshot atomically. Failures are logged and otherwise ignored."""
+        data = {
+            "version": self.VERSION,
+            "plugins_dir": self.plugins_dir,
+            "dir_mtime_ns": self.dir_mtime_ns,
+            "modules": self.modules,
+        }
+        tmp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=4)
+            os.replace(tmp_path, self.snapshot_path)
+            logger.info(f"Plugin snapshot saved to '{self.snapshot_path}'.")
+        except OSError as e:
+            logger.warning(f"Failed to save plugin snapshot '{self.snapshot_path}': {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def plugins(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns:
+            Dict[str, Dict[str, Any]]: Plugin name mapped to its path, module, class name and methods.
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        for filename in sorted(self.modules):
+            entry = self.modules[filename]
+            for plugin_name, methods in entry.get(self.PLUGINS_KEY, {}).items():
+                result[plugin_name] = {
+                    "path": os.path.join(self.plugins_dir, filename),
+                    self.MODULE_KEY: entry.get(self.MODULE_KEY),
+                    self.CLASS_KEY: entry.get(self.CLASS_KEY),
+                    "methods": list(methods),
+                }
+        return result
+
+
+if __name__ == "__main__":
+    # 미리 스냅샷을 빌드: python -m scripts.plugin_snapshot
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    helpers_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'helpers'))
+    built = PluginSnapshot.load_or_build(helpers_dir)
+    logger.info(f"Snapshot plugins: {sorted(built.plugins())}")
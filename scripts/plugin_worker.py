@@ -0,0 +1,151 @@
+# scripts/plugin_worker.py
+
+import functools
+import importlib
+import importlib.util
+import io
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_MODE_ATTR = "EXECUTION_MODE"
+PROCESS_EXECUTION = "process"
+
+RESULT_ARROW = "arrow"
+RESULT_PICKLE = "pickle"
+
+# 워커 프로세스마다 한 번만 생성되는 플러그인 인스턴스 (module, class) -> instance
+_WORKER_PLUGINS: Dict[Tuple[str, Optional[str]], Any] = {}
+
+
+def _get_worker_plugin(module_name: Optional[str], plugin_path: str, class_name: Optional[str]) -> Any:
+    """워커 프로세스에서 플러그인 모듈을 임포트하고 인스턴스를 캐싱하여 반환"""
+    key = (module_name or plugin_path, class_name)
+    plugin = _WORKER_PLUGINS.get(key)
+    if plugin is not None:
+        return plugin
+
+    if module_name:
+        module = importlib.import_module(module_name)
+    else:
+        spec = importlib.util.spec_from_file_location(f"plugin_worker_{abs(hash(plugin_path))}", plugin_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+    plugin = getattr(module, class_name)() if class_name else module
+    if callable(getattr(plugin, 'initialize', None)):
+        plugin.initialize()
+    _WORKER_PLUGINS[key] = plugin
+    return plugin
+
+
+def run_plugin_method(module_name: Optional[str], plugin_path: str, class_name: Optional[str],
+                      method_name: str, args: tuple, kwargs: dict) -> Tuple[str, Any]:
+    """
+    Runs a plugin method inside a worker process and returns the encoded result.
+    """
+    plugin = _get_worker_plugin(module_name, plugin_path, class_name)
+    return encode_result(getattr(plugin, method_name)(*args, **kwargs))
+
+
+def encode_result(result: Any) -> Tuple[str, Any]:
+    """Polars DataFrame은 Arrow IPC 버퍼로, 그 외 결과는 pickle로 전달"""
+    if type(result).__module__.startswith('polars') and hasattr(result, 'write_ipc'):
+        buffer = io.BytesIO()
+        result.write_ipc(buffer)
+        return RESULT_ARROW, buffer.getvalue()
+    return RESULT_PICKLE, result
+
+
+def decode_result(encoded: Tuple[str, Any]) -> Any:
+    kind, payload = encoded
+    if kind == RESULT_ARROW:
+        import polars as pl
+        return pl.read_ipc(io.BytesIO(payload))
+    return payload
+
+
+class PluginProcessPool:
+    """
+    Hosts plugin method calls in a ProcessPoolExecutor and recreates it after a worker crash.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # fork는 스레드가 있는 프로세스에서 교착될 수 있고 Windows와 동작이 다르므로 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def submit(self, plugin_name: str, module_name: Optional[str], plugin_path: str, class_name: Optional[str],
+               method_name: str, args: tuple, kwargs: dict) -> Future:
+        """
+        Submits a plugin method call and returns a Future resolving to the decoded result.
+        A crashed worker surfaces as RuntimeError on the Future and the pool is recreated.
+        """
+        result_future: Future = Future()
+        try:
+            worker_future = self._get_executor().submit(
+                run_plugin_method, module_name, plugin_path, class_name, method_name, args, kwargs
+            )
+        except BrokenProcessPool as e:
+            self._reset()
+            result_future.set_exception(
+                RuntimeError(f"Worker pool for plugin '{plugin_name}' is broken: {e}")
+            )
+            return result_future
+
+        def on_done(future: Future) -> None:
+            try:
+                result_future.set_result(decode_result(future.result()))
+            except BrokenProcessPool as e:
+                logger.error(f"Worker process crashed while running '{plugin_name}.{method_name}': {e}")
+                self._reset()
+                result_future.set_exception(
+                    RuntimeError(f"Worker process crashed while running '{plugin_name}.{method_name}'")
+                )
+            except BaseException as e:
+                result_future.set_exception(e)
+
+        worker_future.add_done_callback(on_done)
+        return result_future
+
+    def _reset(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class ProcessPluginMethod:
+    """
+    Callable proxy for a plugin method hosted in a worker process.
+
+    Calling it blocks until the worker returns; submit() returns a Future so several calls
+    can run on different cores at once.
+    """
+
+    def __init__(self, pool: PluginProcessPool, plugin_name: str, module_name: Optional[str], plugin_path: str,
+                 class_name: Optional[str], method: Callable):
+        self._pool = pool
+        self._target = (plugin_name, module_name, plugin_path, class_name, method.__name__)
+        functools.update_wrapper(self, method)
+
+    def submit(self, *args, **kwargs) -> Future:
+        return self._pool.submit(*self._target, args, kwargs)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.submit(*args, **kwargs).result()
@@ -4,28 +4,51 @@ from unittest.mock import patch
 
 import pytest
 
+from decorators.plugin_cache import clear_plugin_caches
 from decorators.plugin_decorator import PLUGIN_METHODS
+from helpers.file_utils import PARSE_CACHE_DIR_ENV_VAR, PARSE_CACHE_MAX_BYTES_ENV_VAR
 from helpers.members_utils import MembersUtils
+from scripts.plugin_loader import reset_loader
 
 
 @pytest.fixture(scope="function", autouse=True)
-def reset_plugin_methods():
+def reset_members_cache():
     """
-    각 테스트가 실행되기 전에 PLUGIN_METHODS를 초기화합니다.
+    각 테스트가 실행되기 전에 MembersUtils의 캐시와 메모이즈된 플러그인 메서드 결과를 초기화합니다.
     """
-    PLUGIN_METHODS.clear()
+    MembersUtils._members_cache = None
+    clear_plugin_caches()
     yield
-    PLUGIN_METHODS.clear()
+    MembersUtils._members_cache = None
+    clear_plugin_caches()
 
 
 @pytest.fixture(scope="function", autouse=True)
-def reset_members_cache():
+def reset_shared_loader():
     """
-    각 테스트가 실행되기 전에 MembersUtils의 캐시를 초기화합니다.
+    각 테스트가 공유 PluginLoader를 새로 생성하도록 초기화합니다.
     """
-    MembersUtils._members_cache = None
+    reset_loader()
     yield
-    MembersUtils._members_cache = None
+    reset_loader()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolate_parse_cache(monkeypatch):
+    """
+    실행 환경에 설정된 FileUtils의 JSON 파싱 캐시를 끕니다. 캐시가 필요한 테스트는 직접 설정합니다.
+    """
+    monkeypatch.delenv(PARSE_CACHE_DIR_ENV_VAR, raising=False)
+    monkeypatch.delenv(PARSE_CACHE_MAX_BYTES_ENV_VAR, raising=False)
+
+
+@pytest.fixture
+def isolated_test_plugin_methods(monkeypatch):
+    """
+    테스트 안에서 register_plugin_method('test_plugin')로 등록한 메서드가 전역 PLUGIN_METHODS에 남지 않도록
+    test_plugin 항목을 복사본으로 바꾸고 테스트가 끝나면 되돌립니다.
+    """
+    monkeypatch.setitem(PLUGIN_METHODS, 'test_plugin', list(PLUGIN_METHODS.get('test_plugin', [])))
 
 
 @pytest.fixture
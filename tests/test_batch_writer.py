@@ -0,0 +1,50 @@
+# tests/test_batch_writer.py
+import os
+
+import polars as pl
+import pytest
+
+from helpers.batch_writer import BatchWriteError, BatchWriter
+
+
+def test_write_all_saves_every_frame_and_leaves_no_temp_files(tmp_path):
+    items = [
+        (str(tmp_path / 'individual_games' / f'game_{idx}_rank_score.json'), pl.DataFrame({'rank': [idx]}))
+        for idx in range(1, 6)
+    ]
+
+    saved = BatchWriter.write_all(items, max_workers=3, formats='json,parquet')
+
+    assert len(saved) == 10
+    assert saved[:2] == [items[0][0], items[0][0].replace('.json', '.parquet')]
+    assert pl.read_parquet(saved[-1])['rank'].to_list() == [5]
+    assert sorted(os.listdir(tmp_path / 'individual_games'))[0] == 'game_1_rank_score.json'
+    assert not [name for name in os.listdir(tmp_path / 'individual_games') if name.endswith('.tmp')]
+
+
+def test_batch_reports_all_failures_at_flush(tmp_path):
+    blocked = tmp_path / 'blocked'
+    blocked.write_text('not a folder', encoding='utf-8')
+
+    with pytest.raises(BatchWriteError) as exc_info:
+        with BatchWriter.open_batch(formats='json') as batch:
+            batch.submit(str(tmp_path / 'ok.json'), pl.DataFrame({'rank': [1]}))
+            batch.submit(str(blocked / 'game_1.json'), pl.DataFrame({'rank': [2]}))
+            batch.submit(str(blocked / 'game_2.json'), pl.DataFrame({'rank': [3]}))
+
+    assert sorted(exc_info.value.errors) == [str(blocked / 'game_1.json'), str(blocked / 'game_2.json')]
+    assert batch.saved_paths == [str(tmp_path / 'ok.json')]
+
+
+def test_batch_skips_unchanged_json_outputs(tmp_path):
+    from helpers.file_utils import FileUtils
+
+    items = [(str(tmp_path / f'game_{idx}_rank_score.json'), pl.DataFrame({'rank': [idx]})) for idx in (1, 2)]
+    BatchWriter.write_all(items, formats='json', skip_unchanged=True)
+    FileUtils.reset_write_stats()
+
+    changed = [items[0], (items[1][0], pl.DataFrame({'rank': [3]}))]
+    BatchWriter.write_all(changed, formats='json', skip_unchanged=True)
+
+    assert FileUtils.get_write_stats() == {'written': 1, 'skipped': 1}
+    assert pl.read_json(items[1][0])['rank'].to_list() == [3]
@@ -0,0 +1,28 @@
+# tests/test_battle_rank_calculator.py
+import glob
+import os
+
+import polars as pl
+import pytest
+
+from scripts.battle import battle_rank_calculator, battle_weekly_rank_calculator
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.mark.parametrize('module, recent_n', [(battle_rank_calculator, 15), (battle_weekly_rank_calculator, 3)])
+def test_main_reads_repository_battles_from_any_working_directory(tmp_path, monkeypatch, module, recent_n):
+    # 실제 data/battles_rank를 읽고, 결과만 임시 폴더에 저장
+    monkeypatch.delenv('FILE_UTILS_INPUT_FORMAT', raising=False)
+    monkeypatch.setenv('FILE_UTILS_RESULT_FORMAT', 'json')
+    monkeypatch.setattr(module, 'OUTPUT_FINAL_FILE_PATH', str(tmp_path / 'result' / 'rank_score.json'))
+    monkeypatch.setattr(module, 'OUTPUT_INDIVIDUAL_FOLDER', str(tmp_path / 'result' / 'individual_games'))
+    monkeypatch.chdir(os.path.join(PROJECT_ROOT, 'scripts', 'battle'))
+
+    module.main()
+
+    assert module.BATTLES_RANK_DIR == os.path.join(PROJECT_ROOT, 'data', 'battles_rank')
+    game_count = min(len(glob.glob(os.path.join(module.BATTLES_RANK_DIR, 'battle_*.json'))), recent_n)
+    final_df = pl.read_json(tmp_path / 'result' / 'rank_score.json')
+    assert f'game_{game_count}_rank_score' in final_df.columns
+    assert final_df['rank_score'].sum() > 0
@@ -0,0 +1,113 @@
+# tests/test_battle_watcher.py
+import json
+import os
+
+import polars as pl
+import pytest
+
+from scripts.battle import battle_watcher
+from scripts.battle.battle_watcher import BattleWatcher
+
+
+def write_game(folder, number, scores):
+    records = [{'rank': 0, 'name': f'm{member_id}', 'score': score, 'member_id': member_id}
+               for member_id, score in scores.items()]
+    path = folder / f'battle_game_{number}.json'
+    path.write_text(json.dumps(records), encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def watcher(tmp_path, monkeypatch):
+    members = battle_watcher.plugin_loader.members_utils
+    monkeypatch.setattr(members, 'get_active_member_ids', lambda: [1, 2, 3])
+    monkeypatch.setattr(members, 'load_active_members_as_df',
+                        lambda: pl.DataFrame({'member_id': [1, 2, 3], 'name': ['m1', 'm2', 'm3']}))
+    monkeypatch.delenv('FILE_UTILS_INPUT_FORMAT', raising=False)
+    monkeypatch.setenv('FILE_UTILS_RESULT_FORMAT', 'json')
+
+    (tmp_path / 'battles').mkdir()
+    return BattleWatcher(str(tmp_path / 'battles'), str(tmp_path / 'result' / 'grouped_rank_score.json'),
+                         str(tmp_path / 'result' / 'individual_games'), recent_n=2)
+
+
+def test_watcher_waits_for_stable_file_then_publishes(tmp_path, watcher):
+    write_game(tmp_path / 'battles', 1, {1: 300, 2: 200})
+
+    assert watcher.poll() is False
+    assert watcher.poll() is True
+    assert watcher.poll() is False
+
+    final_df = pl.read_json(tmp_path / 'result' / 'grouped_rank_score.json')
+    assert final_df.sort('member_id')['rank_score'].to_list() == [50, 49, 0]
+    assert os.path.exists(tmp_path / 'result' / 'individual_games' / 'game_1_rank_score.json')
+
+
+def test_watcher_recomputes_only_new_games_and_skips_invalid(tmp_path, watcher, monkeypatch):
+    processed = []
+    original_process_game = battle_watcher.process_game
+    monkeypatch.setattr(battle_watcher, 'process_game',
+                        lambda path, *args: processed.append(os.path.basename(path)) or original_process_game(path, *args))
+
+    write_game(tmp_path / 'battles', 1, {1: 300, 2: 200})
+    watcher.poll()
+    watcher.poll()
+
+    write_game(tmp_path / 'battles', 2, {2: 500, 3: 100})
+    (tmp_path / 'battles' / 'battle_game_3.json').write_text(json.dumps([{'name': 'm1'}]), encoding='utf-8')
+    watcher.poll()
+    assert watcher.poll() is True
+
+    # 최근 2개 게임만 합산하고, score가 없는 3번 게임은 검증에서 제외
+    assert processed == ['battle_game_1.json', 'battle_game_2.json', 'battle_game_3.json']
+    final_df = pl.read_json(tmp_path / 'result' / 'grouped_rank_score.json').sort('member_id')
+    assert final_df['rank_score'].to_list() == [0, 50, 49]
+    assert final_df['game_1_rank_score'].to_list() == [0, 50, 49]
+
+
+def test_watcher_republishes_when_roster_changes(tmp_path, watcher, monkeypatch):
+    write_game(tmp_path / 'battles', 1, {1: 300, 2: 200, 3: 100})
+    watcher.poll()
+    assert watcher.poll() is True
+
+    members = battle_watcher.plugin_loader.members_utils
+    monkeypatch.setattr(members, 'get_active_member_ids', lambda: [2, 3])
+    monkeypatch.setattr(members, 'load_active_members_as_df',
+                        lambda: pl.DataFrame({'member_id': [2, 3], 'name': ['m2', 'm3']}))
+
+    # 게임 파일은 그대로이므로 안정화 대기 없이 바로 다시 계산하고 저장
+    assert watcher.poll() is True
+    assert watcher.poll() is False
+
+    final_df = pl.read_json(tmp_path / 'result' / 'grouped_rank_score.json').sort('member_id')
+    assert final_df['member_id'].to_list() == [2, 3]
+    assert final_df['rank_score'].to_list() == [50, 49]
+    game_df = pl.read_json(tmp_path / 'result' / 'individual_games' / 'game_1_rank_score.json')
+    assert sorted(game_df['member_id'].to_list()) == [2, 3]
+
+
+def test_watcher_retries_individual_game_after_failed_batch(tmp_path, watcher, monkeypatch):
+    from helpers.batch_writer import BatchWriteError, ResultBatch
+
+    write_game(tmp_path / 'battles', 1, {1: 300, 2: 200})
+    watcher.poll()
+    original_write = ResultBatch._write_atomic
+    monkeypatch.setattr(ResultBatch, '_write_atomic', staticmethod(lambda *args, **kwargs: 1 / 0))
+    with pytest.raises(BatchWriteError):
+        watcher.poll()
+
+    monkeypatch.setattr(ResultBatch, '_write_atomic', staticmethod(original_write))
+    # 실패한 개별 게임 파일을 저장된 것으로 기록하지 않으므로 다음 확인에서 다시 저장
+    assert watcher.poll() is True
+    assert os.path.exists(tmp_path / 'result' / 'individual_games' / 'game_1_rank_score.json')
+    assert os.path.exists(tmp_path / 'result' / 'grouped_rank_score.json')
+
+
+def test_watcher_resolves_relative_folder_from_working_directory(tmp_path, watcher, monkeypatch):
+    write_game(tmp_path / 'battles', 1, {1: 300, 2: 200})
+    monkeypatch.chdir(tmp_path)
+    relative_watcher = BattleWatcher('battles', watcher.output_final_file_path, watcher.output_individual_folder)
+
+    relative_watcher.poll()
+    assert relative_watcher.poll() is True
+    assert relative_watcher.folder_path == str(tmp_path / 'battles')
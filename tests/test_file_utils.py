@@ -0,0 +1,304 @@
+# tests/test_file_utils.py
+import json
+import os
+
+import pytest
+
+from helpers.file_utils import (
+    DATA_FORMAT_EXTENSIONS, INPUT_FORMAT_ENV_VAR, JSON_BACKEND_ENV_VAR, JSON_CODECS, PARSE_CACHE_DIR_ENV_VAR,
+    RESULT_FORMAT_ENV_VAR, FileUtils, JsonParseCache, get_json_codec, get_parse_cache
+)
+
+
+@pytest.fixture
+def battles_dir(tmp_path):
+    folder = tmp_path / 'battles'
+    folder.mkdir()
+    # 파일 생성 순서와 관계없이 파일 이름 순서로 읽혀야 함
+    for index in (3, 1, 2):
+        records = [{'name': f'member_{index}_{rank}', 'rank': rank} for rank in (1, 2)]
+        (folder / f'battle_game_{index}.json').write_text(json.dumps(records), encoding='utf-8')
+    (folder / 'notes.txt').write_text('not json', encoding='utf-8')
+    return folder
+
+
+@pytest.mark.parametrize('max_workers', [None, 4])
+def test_load_json_files_from_folder_keeps_file_order(battles_dir, max_workers):
+    data = FileUtils.load_json_files_from_folder(str(battles_dir), max_workers=max_workers)
+
+    assert [row['name'] for row in data] == [
+        'member_1_1', 'member_1_2', 'member_2_1', 'member_2_2', 'member_3_1', 'member_3_2'
+    ]
+
+
+def test_load_json_files_from_folder_reports_errors_per_file(battles_dir):
+    broken_file = battles_dir / 'battle_game_0.json'
+    broken_file.write_text('[{"name": ', encoding='utf-8')
+    errors = {}
+
+    data = FileUtils.load_json_files_from_folder(str(battles_dir), max_workers=4, errors=errors)
+
+    assert len(data) == 6
+    assert list(errors) == [str(broken_file)]
+    assert '디코딩' in errors[str(broken_file)]
+
+
+def test_load_json_files_from_folders_parses_large_files_in_processes(battles_dir, tmp_path, monkeypatch):
+    other_dir = tmp_path / 'backup'
+    other_dir.mkdir()
+    (other_dir / 'battle_game_1.json').write_text(json.dumps([{'name': 'backup'}]), encoding='utf-8')
+    monkeypatch.setattr(FileUtils, 'PROCESS_PARSE_MIN_BYTES', 40)
+
+    data = FileUtils.load_json_files_from_folders(
+        [str(battles_dir), str(other_dir)], max_workers=2, use_processes=True
+    )
+
+    assert [row['name'] for row in data][-3:] == ['member_3_1', 'member_3_2', 'backup']
+    assert len(data) == 7
+
+
+@pytest.mark.parametrize('chunk_size', [7, 64 * 1024])
+def test_iter_json_records_matches_full_load(battles_dir, monkeypatch, chunk_size):
+    monkeypatch.setattr(FileUtils, 'STREAM_CHUNK_SIZE', chunk_size)
+    numbers_file = battles_dir / 'battle_game_4.json'
+    numbers_file.write_text(' [ 12345, -6.5e3 , "a,]b", [], {"k": [1, {"n": null}]} ] \n', encoding='utf-8')
+
+    assert list(FileUtils.iter_json_records(str(numbers_file))) == json.loads(numbers_file.read_text())
+    assert list(FileUtils.iter_json_records(str(battles_dir))) == \
+        FileUtils.load_json_files_from_folder(str(battles_dir))
+
+
+def test_iter_json_records_yields_batches(battles_dir):
+    batches = list(FileUtils.iter_json_records(str(battles_dir), batch_size=4))
+
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert batches[0][0]['name'] == 'member_1_1'
+
+
+def test_iter_json_records_reports_broken_file(battles_dir):
+    broken_file = battles_dir / 'battle_game_2.json'
+    broken_file.write_text('[{"name": "partial"}, {"name": ', encoding='utf-8')
+    errors = {}
+
+    names = [row['name'] for row in FileUtils.iter_json_records(str(battles_dir), errors=errors)]
+
+    assert names == ['member_1_1', 'member_1_2', 'partial', 'member_3_1', 'member_3_2']
+    assert list(errors) == [str(broken_file)]
+    with pytest.raises(json.JSONDecodeError):
+        list(FileUtils.iter_json_records(str(broken_file)))
+
+
+def test_iter_json_records_yields_non_array_document(tmp_path):
+    members_file = tmp_path / 'members.json'
+    members_file.write_text('{"1": {"name": "Alice", "status": 1}}', encoding='utf-8')
+
+    assert list(FileUtils.iter_json_records(str(members_file))) == [{'1': {'name': 'Alice', 'status': 1}}]
+
+
+@pytest.mark.parametrize('backend', list(JSON_CODECS))
+def test_save_single_json_pretty_output_matches_stdlib(tmp_path, monkeypatch, backend):
+    monkeypatch.setenv(JSON_BACKEND_ENV_VAR, backend)
+    data = [{'rank': 1, 'name': '핑퐁당', 'score': 1.5, 'member_id': None}]
+    pretty_file = tmp_path / 'pretty.json'
+    compact_file = tmp_path / 'compact.json'
+
+    FileUtils.save_single_json(str(pretty_file), data)
+    FileUtils.save_single_json(str(compact_file), data, pretty=False)
+
+    assert pretty_file.read_text(encoding='utf-8') == json.dumps(data, ensure_ascii=False, indent=4)
+    assert '\n' not in compact_file.read_text(encoding='utf-8')
+    assert FileUtils.load_single_json(str(compact_file)) == data
+
+
+def test_get_json_codec_rejects_unknown_backend(monkeypatch):
+    monkeypatch.setenv(JSON_BACKEND_ENV_VAR, 'json')
+    assert get_json_codec().name == 'json'
+
+    with pytest.raises(ValueError):
+        get_json_codec('simdjson')
+
+
+@pytest.mark.parametrize('data_format', ['parquet', 'ipc'])
+def test_save_data_frame_in_columnar_format_reads_selected_columns(tmp_path, data_format):
+    import polars as pl
+
+    df = pl.DataFrame({'member_id': [1, 2], 'name': ['Alice', 'Bob'], 'rank': [1, 2], 'score': [300, 200]})
+
+    saved = FileUtils.save_data_frame(str(tmp_path / 'grouped_rank_score.json'), df, formats=f'{data_format},json')
+
+    assert [os.path.basename(path) for path in saved] == [
+        f'grouped_rank_score{DATA_FORMAT_EXTENSIONS[data_format]}', 'grouped_rank_score.json'
+    ]
+    loaded = FileUtils.load_data_frame(saved[0], columns=['member_id', 'rank'])
+    assert loaded.columns == ['member_id', 'rank']
+    assert loaded.to_dicts() == [{'member_id': 1, 'rank': 1}, {'member_id': 2, 'rank': 2}]
+    assert FileUtils.load_data_frame(saved[1]).equals(df)
+
+
+@pytest.mark.parametrize('data_format', ['parquet', 'ipc'])
+def test_load_battles_reads_columnar_input_format(tmp_path, monkeypatch, data_format):
+    import polars as pl
+
+    for game in (2, 1):
+        FileUtils.save_data_frame(str(tmp_path / f'battle_game_{game}.json'),
+                                  pl.DataFrame({'rank': [game], 'member_id': [game * 10]}), formats=data_format)
+    (tmp_path / 'battle_game_3.json').write_text(json.dumps([{'rank': 3, 'member_id': 30}]), encoding='utf-8')
+    monkeypatch.setenv(INPUT_FORMAT_ENV_VAR, data_format)
+    monkeypatch.setattr(FileUtils, 'load_json_files_from_folder',
+                        staticmethod(lambda *args, **kwargs: pytest.fail('JSON 파일을 읽으면 안 됨')))
+
+    battles_df = FileUtils.load_battles(str(tmp_path)).collect()
+
+    # 입력 형식의 파일만 파일 이름 순서로 읽음
+    assert battles_df.rows() == [(1, 10), (2, 20)]
+
+
+def test_result_formats_follow_environment(monkeypatch):
+    monkeypatch.setenv(RESULT_FORMAT_ENV_VAR, 'parquet, json')
+    assert FileUtils.get_result_formats() == ['parquet', 'json']
+
+    monkeypatch.setenv(RESULT_FORMAT_ENV_VAR, 'csv')
+    with pytest.raises(ValueError):
+        FileUtils.get_result_formats()
+
+
+def test_load_data_frame_reuses_parse_cache_until_file_changes(tmp_path, monkeypatch):
+    import polars as pl
+
+    game_file = tmp_path / 'battle_game_1.json'
+    game_file.write_text(json.dumps([{'member_id': 1, 'rank': 1}, {'member_id': 2, 'rank': 2}]), encoding='utf-8')
+    # 환경 변수를 설정하지 않으면 캐시를 사용하지 않음
+    assert get_parse_cache() is None
+    monkeypatch.setenv(PARSE_CACHE_DIR_ENV_VAR, str(tmp_path / 'json_parse_cache'))
+    parse_cache = get_parse_cache()
+
+    first = FileUtils.load_data_frame(str(game_file))
+    # 내용이 같으면 mtime만 바뀌어도 캐시를 사용
+    os.utime(game_file, ns=(game_file.stat().st_atime_ns, game_file.stat().st_mtime_ns + 1_000_000_000))
+    second = FileUtils.load_data_frame(str(game_file), columns=['rank'])
+    assert (parse_cache.misses, parse_cache.hits) == (1, 1)
+    assert second.equals(first.select('rank'))
+
+    game_file.write_text(json.dumps([{'member_id': 3, 'rank': 1}]), encoding='utf-8')
+    assert FileUtils.load_data_frame(str(game_file)).equals(pl.DataFrame({'member_id': [3], 'rank': [1]}))
+    assert parse_cache.misses == 2
+
+
+def test_parse_cache_evicts_least_recently_used(tmp_path):
+    import polars as pl
+
+    cache_dir = tmp_path / 'cache'
+    cache = JsonParseCache(str(cache_dir))
+    paths = []
+    for index in range(3):
+        path = tmp_path / f'battle_game_{index}.json'
+        path.write_text(f'[{{"rank": {index}}}]', encoding='utf-8')
+        paths.append(str(path))
+
+    def load(index):
+        return cache.load_or_parse(paths[index], lambda: pl.DataFrame({'rank': [index]}))
+
+    load(0)
+    blob_size = os.path.getsize(cache_dir / JsonParseCache._blob_name(paths[0]))
+    cache.max_bytes = blob_size * 2
+    load(1)
+    load(0)  # 0번을 최근에 사용하여 1번이 가장 오래된 항목이 됨
+    load(2)
+
+    blobs = {name for name in os.listdir(cache_dir) if name.endswith(JsonParseCache.BLOB_EXTENSION)}
+    assert blobs == {JsonParseCache._blob_name(paths[0]), JsonParseCache._blob_name(paths[2])}
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_convert_to_ndjson_and_scan_battles_push_down_filters(tmp_path):
+    import polars as pl
+
+    battles_dir = tmp_path / 'battles_rank'
+    battles_dir.mkdir()
+    for game in (2, 1):
+        records = [{'rank': rank, 'name': f'member_{game}_{rank}', 'score': 1000 - rank, 'member_id': rank}
+                   for rank in (1, 2)]
+        (battles_dir / f'battle_game_{game}.json').write_text(json.dumps(records, indent=4), encoding='utf-8')
+    output_folder = tmp_path / 'ndjson'
+
+    saved = FileUtils.convert_to_ndjson(str(battles_dir), str(output_folder))
+
+    assert [os.path.basename(path) for path in saved] == ['battle_game_1.ndjson', 'battle_game_2.ndjson']
+    assert (output_folder / 'battle_game_1.ndjson').read_text(encoding='utf-8').count('\n') == 2
+
+    battles_lf = FileUtils.scan_battles(str(output_folder))
+    assert isinstance(battles_lf, pl.LazyFrame)
+    selected = battles_lf.filter(pl.col('member_id').is_in([1])).select('name').collect()
+    assert selected['name'].to_list() == ['member_1_1', 'member_2_1']
+    assert FileUtils.load_data_frame(saved[0], columns=['rank'])['rank'].to_list() == [1, 2]
+
+
+def test_save_with_skip_unchanged_keeps_mtime_and_counts_writes(tmp_path):
+    import polars as pl
+
+    FileUtils.reset_write_stats()
+    df = pl.DataFrame({'member_id': [1, 2], 'rank_score': [50, 49]})
+    result_file = tmp_path / 'grouped_rank_score.json'
+    members_file = tmp_path / 'members.json'
+
+    assert FileUtils.save_to_json(str(result_file), df, skip_unchanged=True) is True
+    assert FileUtils.save_single_json(str(members_file), {'1': {'name': 'Alice'}}, skip_unchanged=True) is True
+    os.utime(result_file, ns=(0, 0))
+
+    assert FileUtils.save_to_json(str(result_file), df, skip_unchanged=True) is False
+    assert FileUtils.save_single_json(str(members_file), {'1': {'name': 'Alice'}}, skip_unchanged=True) is False
+    assert result_file.stat().st_mtime_ns == 0
+
+    assert FileUtils.save_to_json(str(result_file), df.with_columns(pl.col('rank_score') + 1),
+                                  skip_unchanged=True) is True
+    assert FileUtils.get_write_stats() == {'written': 3, 'skipped': 2}
+
+
+def test_archive_folder_supports_random_access_and_folder_fallback(battles_dir):
+    expected = FileUtils.load_json_files_from_folder(str(battles_dir))
+    (battles_dir / 'notes.txt').unlink()
+
+    archive_path = FileUtils.archive_folder(str(battles_dir), remove_source=True)
+
+    assert archive_path == str(battles_dir) + '.zip'
+    assert not battles_dir.exists()
+    assert FileUtils.list_archive(archive_path) == [
+        'battle_game_1.json', 'battle_game_2.json', 'battle_game_3.json'
+    ]
+    assert FileUtils.load_json_from_archive(archive_path, 'battle_game_2.json')[0]['name'] == 'member_2_1'
+    # 폴더 대신 같은 이름의 아카이브에서 읽음
+    assert FileUtils.load_json_files_from_folder(str(battles_dir), max_workers=2) == expected
+
+
+@pytest.mark.parametrize('max_workers', [None, 4])
+def test_load_json_files_from_archives_opens_each_archive_once(battles_dir, tmp_path, monkeypatch, max_workers):
+    import zipfile
+
+    from helpers import file_utils
+
+    other_dir = tmp_path / 'other'
+    other_dir.mkdir()
+    (other_dir / 'battle_game_9.json').write_text(json.dumps([{'name': 'member_9_1', 'rank': 1}]), encoding='utf-8')
+    expected = FileUtils.load_json_files_from_folders([str(battles_dir), str(other_dir)])
+    (battles_dir / 'notes.txt').unlink()
+    FileUtils.archive_folder(str(battles_dir), remove_source=True)
+
+    opened = []
+
+    class CountingZipFile(zipfile.ZipFile):
+        def __init__(self, file, *args, **kwargs):
+            opened.append(file)
+            super().__init__(file, *args, **kwargs)
+
+    monkeypatch.setattr(file_utils.zipfile, 'ZipFile', CountingZipFile)
+    data = FileUtils.load_json_files_from_folders([str(battles_dir), str(other_dir)], max_workers=max_workers)
+
+    assert data == expected
+    # list_archive로 한 번, 아카이브 안의 파일 3개를 읽을 때 한 번
+    assert opened == [str(battles_dir) + '.zip'] * 2
+
+
+def test_archive_folder_rejects_unknown_compression(battles_dir):
+    with pytest.raises(ValueError):
+        FileUtils.archive_folder(str(battles_dir), compression='zstd')
+    assert not os.path.exists(str(battles_dir) + '.zip')
@@ -0,0 +1,150 @@
+# tests/test_members_utils.py
+import json
+import os
+from dataclasses import FrozenInstanceError
+from datetime import date, datetime
+
+import polars as pl
+import pytest
+
+from helpers import members_utils
+from helpers.members_utils import MembersUtils, MemberStore, join_ids_by_name
+
+
+def test_member_store_indexes_active_members(sample_members_data):
+    store = MemberStore.from_members(sample_members_data)
+
+    assert store.active_ids == {1, 3}
+    assert store.active_ids_sorted == (1, 3)
+    assert store.active_names == {'Alice', 'Charlie'}
+    assert store.get_id('Bob') == 2
+    assert store.get_id('Eve') is None
+    assert store.is_active(3) and not store.is_active(2)
+    with pytest.raises(FrozenInstanceError):
+        store.active_ids = frozenset()
+
+
+def test_member_store_prefers_active_member_for_duplicate_names():
+    store = MemberStore.from_members({
+        1: {'name': 'Alice', 'status': 1},
+        7: {'name': 'Alice', 'status': 0},
+    })
+
+    assert store.get_id('Alice') == 1
+
+
+def test_store_is_built_once_and_shared_by_lookups(sample_members_data, monkeypatch):
+    calls = []
+    monkeypatch.setattr(MembersUtils, '_load_members_from_file',
+                        staticmethod(lambda: calls.append(1) or sample_members_data))
+
+    assert MembersUtils.get_active_member_ids() == [1, 3]
+    assert MembersUtils.get_active_members() is MembersUtils.get_member_store().active_members
+    assert MembersUtils.get_member_id('Charlie') == 3
+    assert len(calls) == 1
+
+
+def test_assign_ids_uses_store_index(sample_members_data, sample_play_data, monkeypatch):
+    monkeypatch.setattr(MembersUtils, '_load_members_from_file', staticmethod(lambda: sample_members_data))
+
+    data = MembersUtils.assign_ids(sample_play_data)
+
+    assert [member.get('member_id') for member in data] == [1, 3, None]
+
+
+def write_members(path, members, mtime_offset_ns=0):
+    path.write_text(json.dumps(members, ensure_ascii=False), encoding='utf-8')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset_ns))
+
+
+def test_store_reloads_when_members_file_changes(tmp_path, monkeypatch):
+    members_file = tmp_path / 'members.json'
+    write_members(members_file, {'1': {'name': 'Alice', 'status': 1}})
+    monkeypatch.setattr(members_utils, 'JSON_FILE_PATH', str(members_file))
+    monkeypatch.setenv(members_utils.CHECK_INTERVAL_ENV_VAR, '0')
+
+    first = MembersUtils.get_member_store()
+    assert MembersUtils.get_active_member_ids() == [1]
+    assert MembersUtils.get_member_store() is first  # 파일이 그대로면 같은 객체
+
+    write_members(members_file, {'1': {'name': 'Alice', 'status': 0}, '2': {'name': 'Bob', 'status': 1}}, 1_000_000)
+    assert MembersUtils.get_active_member_ids() == [2]
+    assert MembersUtils.load_active_members_as_df()['name'].to_list() == ['Bob']
+
+    # 저장 도중의 잘못된 파일은 무시하고 기존 데이터를 유지
+    members_file.write_text('{"1": ', encoding='utf-8')
+    assert MembersUtils.get_active_member_ids() == [2]
+
+
+def test_store_check_is_throttled_by_interval(tmp_path, monkeypatch):
+    members_file = tmp_path / 'members.json'
+    write_members(members_file, {'1': {'name': 'Alice', 'status': 1}})
+    monkeypatch.setattr(members_utils, 'JSON_FILE_PATH', str(members_file))
+    monkeypatch.setenv(members_utils.CHECK_INTERVAL_ENV_VAR, '3600')
+
+    assert MembersUtils.get_active_member_ids() == [1]
+    write_members(members_file, {'2': {'name': 'Bob', 'status': 1}}, 1_000_000)
+    assert MembersUtils.get_active_member_ids() == [1]
+
+
+def test_assign_ids_df_splits_matched_and_unmatched_rows(sample_members_data, monkeypatch):
+    monkeypatch.setattr(MembersUtils, '_load_members_from_file', staticmethod(lambda: sample_members_data))
+    df = pl.DataFrame({'name': ['Charlie', 'Eve', 'Alice', 'Eve'], 'score': [150, 200, 100, 50]})
+
+    assigned_df, unmatched_df = MembersUtils.assign_ids_df(df)
+
+    assert assigned_df.select(['name', 'member_id']).rows() == [('Charlie', 3), ('Alice', 1)]
+    assert unmatched_df.columns == ['name', 'score']
+    assert unmatched_df['score'].to_list() == [200, 50]
+
+
+def test_join_ids_by_name_replaces_existing_id_column():
+    lookup_df = pl.DataFrame({'name': ['a', 'b'], 'id': [1, 2]})
+    df = pl.DataFrame({'game': ['b', 'x', 'a'], 'id': [9, 9, 9]})
+
+    assigned_df, unmatched_df = join_ids_by_name(df, lookup_df, 'id', name_column='game')
+
+    assert assigned_df.rows() == [('b', 2), ('a', 1)]
+    assert unmatched_df.rows() == [('x',)]
+
+
+def test_membership_index_answers_as_of_queries():
+    members = {
+        1: {'name': 'Alice', 'status': 1},
+        2: {'name': 'Bob', 'status': 0},
+        3: {'name': 'Charlie', 'status': 1},
+        4: {'name': 'Dave', 'status': 0},
+    }
+    history = {
+        '2': [[None, '2025-09-01']],
+        '3': [['2025-03-01', None]],
+        '4': [['2024-11-01', '2025-01-01'], ['2025-05-01', '2025-06-01']],
+    }
+    store = MemberStore.from_members(members, history)
+
+    assert store.membership.active_ids_as_of('2024-10-31') == (1, 2)
+    assert store.membership.active_ids_as_of(date(2024, 12, 31)) == (1, 2, 4)
+    assert store.membership.active_ids_as_of(datetime(2025, 5, 10, 12, 0)) == (1, 2, 3, 4)
+    assert store.membership.active_ids_as_of('2025-09-01') == (1, 3)
+    assert store.active_members_df_as_of('2025-08-31')['name'].to_list() == ['Alice', 'Bob', 'Charlie']
+
+
+def test_as_of_queries_use_history_file(tmp_path, monkeypatch):
+    members_file = tmp_path / 'members.json'
+    history_file = tmp_path / 'members_history.json'
+    write_members(members_file, {'1': {'name': 'Alice', 'status': 1}, '2': {'name': 'Bob', 'status': 0}})
+    history_file.write_text(json.dumps({'2': [[None, '2025-10-01']]}), encoding='utf-8')
+    monkeypatch.setattr(members_utils, 'JSON_FILE_PATH', str(members_file))
+    monkeypatch.setattr(members_utils, 'HISTORY_FILE_PATH', str(history_file))
+
+    assert MembersUtils.get_active_member_ids_as_of('2025-09-30') == [1, 2]
+    assert MembersUtils.get_active_member_ids_as_of('2025-10-01') == [1]
+    assert MembersUtils.get_active_member_ids() == [1]
+
+
+def test_member_lookups_are_not_memoized_separately_from_store():
+    # members.json 변경은 MemberStore 교체로만 반영되므로, 메서드별 메모가 이전 결과를 붙잡으면 안 됨
+    for method in (MembersUtils.get_active_member_ids, MembersUtils.get_active_members,
+                   MembersUtils.load_active_members_as_df, MembersUtils.get_member):
+        assert not hasattr(method, 'cache')
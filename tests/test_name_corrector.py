@@ -0,0 +1,126 @@
+# tests/test_name_corrector.py
+import json
+
+import pytest
+
+from helpers import name_corrector
+from helpers.members_utils import MembersUtils
+from helpers.name_corrector import LEARNED_PATH_ENV_VAR, NameCorrector, NameIndex, decompose_jamo, edit_distance
+
+
+@pytest.fixture(autouse=True)
+def korean_members(tmp_path, monkeypatch):
+    """활성 멤버 이름과 학습 정정표 위치를 테스트용으로 설정합니다."""
+    members = {
+        1: {'name': '졔타몽', 'status': 1},
+        2: {'name': '하눌', 'status': 1},
+        3: {'name': '무니는 야옹', 'status': 1},
+        4: {'name': '유디는 야옹', 'status': 1},
+        5: {'name': '주키니콩', 'status': 0},
+    }
+    monkeypatch.setattr(MembersUtils, '_load_members_from_file', staticmethod(lambda: members))
+    monkeypatch.setenv(LEARNED_PATH_ENV_VAR, str(tmp_path / 'learned_name_corrections.json'))
+    monkeypatch.setattr(NameCorrector, '_index', None)
+    return members
+
+
+def test_decompose_jamo_and_edit_distance():
+    assert decompose_jamo('하늘') == '\u1112\u1161\u1102\u1173\u11af'
+    assert decompose_jamo('a하') == 'a\u1112\u1161'
+    # 음절 단위로는 1글자 차이지만 자모 단위로는 모음 하나 차이
+    assert edit_distance(decompose_jamo('제타몽'), decompose_jamo('졔타몽')) == 1
+    assert edit_distance('kitten', 'sitting') == 3
+    assert edit_distance('kitten', 'sitting', limit=1) == 2
+
+
+def test_name_index_returns_unique_nearest_name():
+    index = NameIndex(['무니는 야옹', '유디는 야옹', '하눌'])
+
+    assert index.find('무니느 야옹', 2) == '무니는 야옹'
+    assert index.find('하늘', 2) == '하눌'
+    assert index.find('하늘', 0) is None
+    assert index.find('완전히 다른 이름', 2) is None
+    # 두 후보와 거리가 같으면 정정하지 않음
+    assert NameIndex(['가나', '가다']).find('가마', 2) is None
+
+
+def test_correct_records_uses_table_then_index_and_learns(tmp_path):
+    data = [{'name': '졔타몽'}, {'name': '제타몽'}, {'name': '무니느 야옹'}, {'name': '완전히 다른 이름'}]
+
+    corrected, unresolved = NameCorrector.correct_records(data, learn=True)
+
+    assert [record['name'] for record in corrected] == ['졔타몽', '졔타몽', '무니는 야옹', '완전히 다른 이름']
+    assert unresolved == ['완전히 다른 이름']
+    learned = json.loads((tmp_path / 'learned_name_corrections.json').read_text(encoding='utf-8'))
+    assert learned == {'무니느 야옹': '무니는 야옹'}
+    assert NameCorrector.get_corrections()['무니느 야옹'] == '무니는 야옹'
+
+
+def test_correct_name_without_learning_keeps_inactive_members(tmp_path):
+    assert NameCorrector.correct_name('주키니콩', learn=False) == '주키니콩'  # 비활성 멤버 이름은 그대로
+    assert NameCorrector.correct_name('하늘', max_distance=1, learn=False) == '하눌'
+    assert not (tmp_path / 'learned_name_corrections.json').exists()
+
+
+def test_inactive_and_short_names_are_not_corrected_to_other_members(korean_members, tmp_path):
+    korean_members[6] = {'name': '다곰', 'status': 0}
+    korean_members[7] = {'name': '다콩', 'status': 1}
+    korean_members[8] = {'name': '백현', 'status': 1}
+
+    # 비활성 멤버 이름은 활성 멤버와 가까워도 그대로 유지
+    assert NameCorrector.correct_name('다곰') == '다곰'
+    # 두 글자 이름은 자모 2개 차이면 다른 멤버로 보고 정정하지 않음
+    assert NameCorrector.correct_name('백호') is None
+    assert NameCorrector.correct_name('백호', max_distance=2, learn=False) == '백현'
+    assert not (tmp_path / 'learned_name_corrections.json').exists()
+
+
+def test_unreviewed_guess_is_not_saved_or_reused(korean_members, tmp_path):
+    assert NameCorrector.correct_name('무니느 야옹') == '무니는 야옹'
+    assert not (tmp_path / 'learned_name_corrections.json').exists()
+    assert '무니느 야옹' not in NameCorrector.get_corrections()
+
+    # 다음 실행에서는 이전 추측을 그대로 쓰지 않고 현재 활성 멤버로 다시 검색
+    korean_members[3] = {'name': '무니는 야옹', 'status': 0}
+    MembersUtils._members_cache = None
+    assert NameCorrector.correct_name('무니느 야옹') is None
+
+
+def test_member_data_script_learns_only_with_flag(korean_members, tmp_path, monkeypatch):
+    from scripts.data_processing import member_data
+
+    saved = []
+    file_utils = member_data.plugin_loader.file_utils
+    monkeypatch.setattr(file_utils, 'load_single_json', lambda path: [{'name': '무니느 야옹', 'rank': 1}])
+    monkeypatch.setattr(file_utils, 'save_single_json', lambda path, data: saved.append(data))
+    learned_file = tmp_path / 'learned_name_corrections.json'
+
+    member_data.main([])
+    assert saved[-1][0]['name'] == '무니는 야옹'
+    assert not learned_file.exists()
+
+    member_data.main(['--learn'])
+    assert json.loads(learned_file.read_text(encoding='utf-8')) == {'무니느 야옹': '무니는 야옹'}
+
+
+def test_corrections_are_memoized_until_a_correction_file_changes(tmp_path, monkeypatch):
+    manual_file = tmp_path / 'name_corrections.py'
+    manual_file.write_text("NAME_CORRECTIONS = {'졔타뭉': '졔타몽'}\n", encoding='utf-8')
+    monkeypatch.setattr(name_corrector, 'NAME_CORRECTIONS_PATH', str(manual_file))
+    cache = NameCorrector.get_corrections.cache
+    monkeypatch.setattr(cache, 'hits', 0)
+    monkeypatch.setattr(cache, 'misses', 0)
+
+    NameCorrector.correct_names(['졔타뭉'])
+    NameCorrector.correct_names(['하눌'])
+    assert (cache.misses, cache.hits) == (1, 1)
+
+    # 학습 정정표가 저장되면 다시 읽음
+    NameCorrector.learn_corrections({'무니느 야옹': '무니는 야옹'})
+    assert NameCorrector.correct_name('무니느 야옹') == '무니는 야옹'
+    assert cache.misses == 2
+
+    # 수동 정정표가 바뀌어도 다시 읽음
+    manual_file.write_text("NAME_CORRECTIONS = {'졔타뭉': '하눌', '하늘이': '하눌'}\n", encoding='utf-8')
+    assert NameCorrector.correct_names(['졔타뭉', '하늘이']) == {'졔타뭉': '하눌', '하늘이': '하눌'}
+    assert (cache.misses, cache.hits) == (3, 1)
@@ -0,0 +1,55 @@
+# tests/test_plugin_async.py
+import asyncio
+
+import pytest
+
+from decorators.plugin_decorator import register_plugin_method, PLUGIN_METHODS
+from decorators.plugin_stats import PLUGIN_STATS, TRACE_ENV_VAR
+from scripts.plugin_loader import PluginLoader
+
+BATTLE_FILES = [f'../data/battles_rank/battle_game_{idx}.json' for idx in range(1, 4)]
+
+
+def test_async_facade_loads_files_concurrently():
+    loader = PluginLoader()
+
+    async def load_all():
+        return await asyncio.gather(*(loader.aio.file_utils.load_single_json(path) for path in BATTLE_FILES))
+
+    results = asyncio.run(load_all())
+    loader.aio.close()
+
+    assert results == [loader.file_utils.load_single_json(path) for path in BATTLE_FILES]
+
+
+def test_async_facade_awaits_async_plugin_methods_directly():
+    loader = PluginLoader()
+
+    async def double(value):
+        await asyncio.sleep(0)
+        return value * 2
+
+    assert loader.aio._to_async(double) is double
+    assert asyncio.run(loader.aio.test_plugin.add(1, 2)) == 3
+
+
+@pytest.mark.usefixtures('isolated_test_plugin_methods')
+def test_register_async_plugin_method_with_tracing_and_cache(monkeypatch):
+    monkeypatch.setenv(TRACE_ENV_VAR, '1')
+    PLUGIN_STATS.reset()
+    calls = []
+
+    @register_plugin_method('test_plugin', cache_size=4)
+    async def fetch(value):
+        calls.append(value)
+        await asyncio.sleep(0)
+        return value + 1
+
+    async def run():
+        return [await fetch(1), await fetch(1), await fetch(2)]
+
+    assert asyncio.run(run()) == [2, 2, 3]
+    assert calls == [1, 2]
+    assert 'fetch' in PLUGIN_METHODS['test_plugin']
+    assert PLUGIN_STATS.snapshot()['test_plugin.fetch']['calls'] == 3
+    PLUGIN_STATS.reset()
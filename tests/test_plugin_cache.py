@@ -0,0 +1,68 @@
+# tests/test_plugin_cache.py
+import os
+
+import pytest
+
+from decorators.plugin_cache import clear_plugin_caches
+from decorators.plugin_decorator import register_plugin_method, PLUGIN_METHODS
+
+pytestmark = pytest.mark.usefixtures('isolated_test_plugin_methods')
+
+
+def test_cached_method_is_memoized_with_lru_eviction():
+    calls = []
+
+    @register_plugin_method('test_plugin', cache_size=2)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert [square(2), square(2), square(3), square(4), square(2)] == [4, 4, 9, 16, 4]
+    assert calls == [2, 3, 4, 2]  # 2는 LRU로 밀려난 뒤 다시 계산됨
+    assert 'square' in PLUGIN_METHODS['test_plugin']
+    assert len(square.cache) == 2
+
+
+def test_cached_method_is_invalidated_when_dependency_changes(tmp_path):
+    data_file = tmp_path / 'members.json'
+    data_file.write_text('{"1": "a"}', encoding='utf-8')
+    calls = []
+
+    @register_plugin_method('test_plugin', depends_on=[str(data_file)])
+    def read_members():
+        calls.append(1)
+        return data_file.read_text(encoding='utf-8')
+
+    assert read_members() == '{"1": "a"}'
+    assert read_members() == '{"1": "a"}'
+
+    data_file.write_text('{"1": "b", "2": "c"}', encoding='utf-8')
+    stat = data_file.stat()
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert read_members() == '{"1": "b", "2": "c"}'
+    assert len(calls) == 2
+
+
+def test_cached_method_with_ttl_and_unhashable_arguments():
+    calls = []
+
+    @register_plugin_method('test_plugin', cache_ttl=0)
+    def total(values):
+        calls.append(values)
+        return sum(values)
+
+    assert total((1, 2)) == 3
+    assert total([1, 2]) == 3  # 해시할 수 없는 인자는 캐시를 우회
+    assert total((1, 2)) == 3  # TTL 0이므로 다시 계산
+    assert len(calls) == 3
+
+
+def test_clear_plugin_caches():
+    @register_plugin_method('test_plugin', cache_size=4)
+    def identity(x):
+        return x
+
+    identity(1)
+    clear_plugin_caches()
+    assert len(identity.cache) == 0
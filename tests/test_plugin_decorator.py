@@ -1,5 +1,6 @@
 # tests/test_plugin_decorator.py
-from decorators.plugin_decorator import register_plugin_method, PLUGIN_METHODS
+from decorators.plugin_decorator import register_plugin_method, PLUGIN_METHODS, PluginRegistry, use_registry
+from decorators.plugin_stats import PLUGIN_STATS, TRACE_ENV_VAR
 
 
 def reset_plugin_methods():
@@ -16,3 +17,45 @@ def test_register_plugin_method():
 
     assert 'test_plugin' in PLUGIN_METHODS
     assert 'sample_method' in PLUGIN_METHODS['test_plugin']
+
+
+def test_register_plugin_method_without_tracing_returns_function(monkeypatch):
+    monkeypatch.delenv(TRACE_ENV_VAR, raising=False)
+
+    def sample_method():
+        pass
+
+    assert register_plugin_method('test_plugin')(sample_method) is sample_method
+
+
+def test_register_plugin_method_with_tracing_records_calls(monkeypatch, tmp_path):
+    monkeypatch.setenv(TRACE_ENV_VAR, '1')
+    PLUGIN_STATS.reset()
+    data_file = tmp_path / 'data.json'
+    data_file.write_text('[1, 2, 3]', encoding='utf-8')
+
+    @register_plugin_method('test_plugin', trace_io='read')
+    def read_size(path):
+        return len(open(path, encoding='utf-8').read())
+
+    assert read_size(str(data_file)) == 9
+    assert read_size(str(data_file)) == 9
+    assert 'read_size' in PLUGIN_METHODS['test_plugin']
+
+    stats = PLUGIN_STATS.snapshot()['test_plugin.read_size']
+    assert stats['calls'] == 2
+    assert stats['bytes_read'] == 18
+    assert stats['p99'] >= stats['p50'] >= 0
+    PLUGIN_STATS.reset()
+
+
+def test_register_plugin_method_writes_to_active_registry():
+    registry = PluginRegistry()
+
+    with use_registry(registry):
+        @register_plugin_method('scoped_plugin')
+        def scoped_method():
+            pass
+
+    assert registry == {'scoped_plugin': ['scoped_method']}
+    assert 'scoped_plugin' not in PLUGIN_METHODS
@@ -1,6 +1,13 @@
 # tests/test_plugin_loader.py
+import os
+import subprocess
+import sys
+
 import pytest
-from scripts.plugin_loader import PluginLoader
+from decorators.plugin_decorator import PLUGIN_METHODS
+from scripts.plugin_loader import PluginLoader, get_loader, reset_loader
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 
 
 @pytest.fixture
@@ -15,3 +22,150 @@ def test_get_plugin_method(plugin_loader):
     assert callable(method)
     assert method('Alice') == "Hello, Alice! This is TestPlugin."
     plugin_loader.test_plugin.greet('Alice')
+
+
+def test_lazy_loader_resolves_plugin_on_first_access():
+    loader = PluginLoader(lazy=True)
+
+    assert loader.plugin_manager.list_plugins() == []
+    assert loader.test_plugin.add(1, 2) == 3
+    assert loader.plugin_manager.list_plugins() == ['test_plugin']
+    # 두 번째 접근은 이미 할당된 네임스페이스를 그대로 사용
+    assert loader.test_plugin is loader.test_plugin
+
+
+def test_lazy_loader_reuses_imported_module():
+    import helpers.test_plugin
+
+    loader = PluginLoader(lazy=True)
+    loader.test_plugin.greet('Bob')
+
+    plugin = loader.plugin_manager.plugins['test_plugin']
+    assert isinstance(plugin, sys.modules['helpers.test_plugin'].TestPlugin)
+    assert sys.modules['helpers.test_plugin'] is helpers.test_plugin
+
+
+def test_lazy_loader_loads_declared_dependencies_first():
+    loader = PluginLoader(lazy=True)
+
+    assert callable(loader.batch_writer.open_batch)
+    # batch_writer의 DEPENDS_ON인 file_utils도 함께 로드/초기화되고 네임스페이스가 할당됨
+    assert sorted(loader.plugin_manager.list_plugins()) == ['batch_writer', 'file_utils']
+    assert 'file_utils' in loader.__dict__
+
+
+def test_lazy_loader_raises_when_dependency_is_excluded():
+    loader = PluginLoader(lazy=True, plugins=['batch_writer'])
+
+    with pytest.raises(ValueError, match='file_utils'):
+        loader.batch_writer
+    assert loader.plugin_manager.list_plugins() == []
+
+
+def test_lazy_loader_startup_imports_only_touched_plugin():
+    # 새 프로세스에서 test_plugin만 사용하면 다른 플러그인과 무거운 의존성은 임포트되지 않음
+    code = (
+        "import sys\n"
+        "from scripts.plugin_loader import PluginLoader\n"
+        "loader = PluginLoader(lazy=True)\n"
+        "loader.test_plugin.greet('Alice')\n"
+        "print('polars' in sys.modules, 'helpers.members_utils' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    polars_imported, members_imported = result.stdout.split()
+
+    assert polars_imported == 'False'
+    assert members_imported == 'False'
+
+
+def test_get_loader_returns_shared_instance():
+    loader = get_loader()
+
+    assert get_loader() is loader
+    assert PluginLoader() is not loader  # 직접 생성한 인스턴스는 격리됨
+    assert loader.test_plugin.add(1, 1) == 2
+
+
+def test_reset_loader_creates_new_shared_instance():
+    loader = get_loader()
+    reset_loader()
+
+    assert get_loader() is not loader
+
+
+@pytest.mark.parametrize('use_snapshot', [True, False])
+def test_loaders_keep_separate_plugin_registries(use_snapshot, tmp_path):
+    snapshot_path = str(tmp_path / 'registry.json')
+    global_methods = {plugin_name: list(methods) for plugin_name, methods in PLUGIN_METHODS.items()}
+    test_only = PluginLoader(use_snapshot=use_snapshot, snapshot_path=snapshot_path, plugins=['test_plugin'])
+    files_only = PluginLoader(use_snapshot=use_snapshot, snapshot_path=snapshot_path, plugins=['file_utils'])
+
+    assert list(test_only.registry) == ['test_plugin']
+    assert list(files_only.registry) == ['file_utils']
+    assert test_only.test_plugin.add(1, 2) == 3
+    assert callable(files_only.file_utils.load_single_json)
+    with pytest.raises(AttributeError):
+        files_only.test_plugin
+    # 로더가 전역 레지스트리를 건드리지 않음
+    assert PLUGIN_METHODS == global_methods
+
+
+def test_loaders_without_filter_do_not_share_registry_or_plugins():
+    first = PluginLoader()
+    second = PluginLoader()
+
+    assert first.registry is not second.registry
+    assert first.registry == second.registry
+    first.registry.register('test_plugin', 'only_in_first')
+    assert 'only_in_first' not in second.registry['test_plugin']
+    assert first.plugin_manager.plugins['test_plugin'] is not second.plugin_manager.plugins['test_plugin']
+    assert first.test_plugin is not second.test_plugin
+
+
+def _write_plugin(path, class_name, plugin_name, message):
+    path.write_text(
+        "from decorators.plugin_decorator import register_plugin_method\n\n\n"
+        f"class {class_name}:\n"
+        "    @staticmethod\n"
+        f"    @register_plugin_method('{plugin_name}')\n"
+        "    def message():\n"
+        f"        return {message!r}\n",
+        encoding='utf-8'
+    )
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def reload_plugins_dir(tmp_path, monkeypatch):
+    package_dir = tmp_path / 'reload_helpers'
+    package_dir.mkdir()
+    (package_dir / '__init__.py').write_text('', encoding='utf-8')
+    _write_plugin(package_dir / 'alpha_plugin.py', 'AlphaPlugin', 'alpha_plugin', 'alpha v1')
+    _write_plugin(package_dir / 'beta_plugin.py', 'BetaPlugin', 'beta_plugin', 'beta v1')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package_dir
+    for module_name in [name for name in sys.modules if name.startswith('reload_helpers')]:
+        del sys.modules[module_name]
+
+
+def test_reload_changed_rebinds_only_modified_plugin(reload_plugins_dir, tmp_path):
+    class TmpPluginLoader(PluginLoader):
+        PLUGINS_DIR = str(reload_plugins_dir)
+        PLUGINS_PACKAGE = 'reload_helpers'
+
+    loader = TmpPluginLoader(snapshot_path=str(tmp_path / 'registry.json'))
+    alpha_namespace = loader.alpha_plugin
+    beta_instance = loader.plugin_manager.plugins['beta_plugin']
+    assert alpha_namespace.message() == 'alpha v1'
+
+    assert loader.reload_changed() == []
+
+    _write_plugin(reload_plugins_dir / 'alpha_plugin.py', 'AlphaPlugin', 'alpha_plugin', 'alpha version 2')
+    assert loader.reload_changed() == ['alpha_plugin']
+
+    assert loader.alpha_plugin is alpha_namespace
+    assert alpha_namespace.message() == 'alpha version 2'
+    assert loader.plugin_manager.plugins['beta_plugin'] is beta_instance
@@ -1,6 +1,12 @@
 # tests/test_plugin_manager.py
-import pytest
+import json
 import os
+import sys
+import threading
+
+import pytest
+
+from decorators.plugin_stats import PLUGIN_STATS
 from scripts.plugin_manager import PluginManager
 
 
@@ -19,3 +25,135 @@ def test_add_plugin_info(plugin_manager):
     assert plugin_name in plugin_manager.plugin_info
     assert plugin_manager.plugin_info[plugin_name]['path'] == plugin_path
     assert plugin_manager.plugin_info[plugin_name]['methods'] == methods
+
+
+def test_dump_stats_writes_json(plugin_manager, tmp_path):
+    PLUGIN_STATS.reset()
+    PLUGIN_STATS.get('file_utils.load_single_json').record(0.01, bytes_read=128)
+    output_path = tmp_path / 'stats.json'
+
+    stats_json = plugin_manager.dump_stats(str(output_path))
+
+    stats = json.loads(output_path.read_text(encoding='utf-8'))
+    assert json.loads(stats_json) == stats
+    assert stats['file_utils.load_single_json']['calls'] == 1
+    assert stats['file_utils.load_single_json']['bytes_read'] == 128
+    PLUGIN_STATS.reset()
+
+
+class _RecordingPlugin:
+    DEPENDS_ON = []
+
+    def __init__(self, name, events, wait_for=None, signal=None):
+        self.name = name
+        self.events = events
+        self.wait_for = wait_for  # 초기화를 끝내기 전에 기다릴 Event
+        self.signal = signal  # 초기화를 시작하면 set할 Event
+
+    def initialize(self):
+        self.events.append(('start', self.name))
+        if self.signal is not None:
+            self.signal.set()
+        if self.wait_for is not None:
+            self.events.append(('waited', self.name, self.wait_for.wait(timeout=5)))
+        self.events.append(('end', self.name))
+
+
+def test_initialize_plugins_respects_dependencies(plugin_manager):
+    events = []
+    other_started = threading.Event()
+    # base는 other가 시작될 때까지 끝나지 않으므로, 두 초기화가 동시에 실행되어야만 통과
+    base = _RecordingPlugin('base', events, wait_for=other_started)
+    stats = _RecordingPlugin('stats', events)
+    stats.DEPENDS_ON = ['base']
+    other = _RecordingPlugin('other', events, signal=other_started)
+    plugin_manager.plugins.update({'base': base, 'stats': stats, 'other': other})
+
+    plugin_manager.initialize_plugins(['stats', 'base', 'other'])
+
+    assert events.index(('end', 'base')) < events.index(('start', 'stats'))
+    # 독립적인 플러그인은 base의 초기화를 기다리지 않음
+    assert ('waited', 'base', True) in events
+    assert events.index(('start', 'other')) < events.index(('end', 'base'))
+    assert set(plugin_manager.init_times) == {'base', 'stats', 'other'}
+
+
+def test_initialize_plugins_with_cycle_falls_back_to_sequential(plugin_manager):
+    events = []
+    first = _RecordingPlugin('first', events)
+    first.DEPENDS_ON = ['second']
+    second = _RecordingPlugin('second', events)
+    second.DEPENDS_ON = ['first']
+    plugin_manager.plugins.update({'first': first, 'second': second})
+
+    plugin_manager.initialize_plugins(['first', 'second'])
+
+    assert events == [('start', 'first'), ('end', 'first'), ('start', 'second'), ('end', 'second')]
+
+
+PROCESS_PLUGIN_SOURCE = '''
+import os
+import sys
+
+import polars as pl
+
+from decorators.plugin_decorator import register_plugin_method
+
+
+class WorkerPlugin:
+    EXECUTION_MODE = "process"
+
+    @staticmethod
+    @register_plugin_method('worker_plugin')
+    def pid():
+        return os.getpid()
+
+    @staticmethod
+    @register_plugin_method('worker_plugin')
+    def frame(n):
+        return pl.DataFrame({'member_id': list(range(n))})
+
+    @staticmethod
+    @register_plugin_method('worker_plugin')
+    def crash():
+        os._exit(1)
+'''
+
+
+@pytest.fixture
+def process_plugin_manager(tmp_path, monkeypatch):
+    package_dir = tmp_path / 'worker_helpers'
+    package_dir.mkdir()
+    (package_dir / '__init__.py').write_text('', encoding='utf-8')
+    plugin_path = package_dir / 'worker_plugin.py'
+    plugin_path.write_text(PROCESS_PLUGIN_SOURCE, encoding='utf-8')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    manager = PluginManager(process_workers=1)
+    manager.add_plugin_info('worker_plugin', str(plugin_path), ['pid', 'frame', 'crash'],
+                            module_name='worker_helpers.worker_plugin')
+    manager.load_all_plugins()
+    yield manager
+    manager.shutdown()
+    sys.modules.pop('worker_helpers.worker_plugin', None)
+    sys.modules.pop('worker_helpers', None)
+
+
+def test_process_plugin_runs_in_worker(process_plugin_manager):
+    assert process_plugin_manager.is_process_plugin('worker_plugin')
+
+    pid = process_plugin_manager.get_plugin_method('worker_plugin', 'pid')()
+    assert pid != os.getpid()
+
+    frame_method = process_plugin_manager.get_plugin_method('worker_plugin', 'frame')
+    futures = [frame_method.submit(n) for n in (2, 3)]
+    assert [future.result().height for future in futures] == [2, 3]
+    assert futures[0].result()['member_id'].to_list() == [0, 1]
+
+
+def test_process_plugin_crash_is_isolated(process_plugin_manager):
+    with pytest.raises(RuntimeError):
+        process_plugin_manager.get_plugin_method('worker_plugin', 'crash')()
+
+    # 풀이 다시 생성되어 이후 호출은 정상 동작
+    assert process_plugin_manager.get_plugin_method('worker_plugin', 'pid')() != os.getpid()
@@ -0,0 +1,89 @@
+# tests/test_plugin_snapshot.py
+import os
+from unittest.mock import patch
+
+import pytest
+
+from scripts.plugin_loader import PluginLoader
+from scripts.plugin_snapshot import PluginSnapshot
+
+PLUGIN_SOURCE = '''
+from decorators.plugin_decorator import register_plugin_method
+
+
+class SamplePlugin:
+    @staticmethod
+    @register_plugin_method('sample_plugin')
+    def hello():
+        return 'hello'
+
+    @staticmethod
+    def not_registered():
+        return None
+'''
+
+
+@pytest.fixture
+def plugins_dir(tmp_path):
+    plugin_dir = tmp_path / 'plugins'
+    plugin_dir.mkdir()
+    (plugin_dir / 'sample_plugin.py').write_text(PLUGIN_SOURCE, encoding='utf-8')
+    return plugin_dir
+
+
+def test_snapshot_indexes_plugins_without_import(plugins_dir, tmp_path):
+    snapshot_path = str(tmp_path / 'registry.json')
+    snapshot = PluginSnapshot.load_or_build(str(plugins_dir), snapshot_path)
+
+    plugins = snapshot.plugins()
+    assert plugins['sample_plugin']['methods'] == ['hello']
+    assert plugins['sample_plugin']['class_name'] == 'SamplePlugin'
+    assert plugins['sample_plugin']['module'] == 'plugins.sample_plugin'
+    assert os.path.exists(snapshot_path)
+
+
+def test_snapshot_skips_parsing_when_unchanged(plugins_dir, tmp_path):
+    snapshot_path = str(tmp_path / 'registry.json')
+    PluginSnapshot.load_or_build(str(plugins_dir), snapshot_path)
+
+    with patch.object(PluginSnapshot, '_parse_module') as mock_parse:
+        snapshot = PluginSnapshot.load(str(plugins_dir), snapshot_path)
+        assert snapshot.refresh() is False
+        mock_parse.assert_not_called()
+
+
+def test_snapshot_rebuilds_changed_helper(plugins_dir, tmp_path):
+    snapshot_path = str(tmp_path / 'registry.json')
+    PluginSnapshot.load_or_build(str(plugins_dir), snapshot_path)
+
+    plugin_file = plugins_dir / 'sample_plugin.py'
+    plugin_file.write_text(PLUGIN_SOURCE.replace('def not_registered', 'def unregistered_helper')
+                           + '''
+    @staticmethod
+    @register_plugin_method('sample_plugin')
+    def bye():
+        return 'bye'
+''', encoding='utf-8')
+    stat = plugin_file.stat()
+    os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    snapshot = PluginSnapshot.load_or_build(str(plugins_dir), snapshot_path)
+    assert snapshot.plugins()['sample_plugin']['methods'] == ['hello', 'bye']
+
+
+def test_plugin_loader_uses_snapshot(tmp_path):
+    snapshot_path = str(tmp_path / 'registry.json')
+    loader = PluginLoader(snapshot_path=snapshot_path)
+
+    assert os.path.exists(snapshot_path)
+    assert loader.plugin_manager.plugin_info['test_plugin']['class_name'] == 'TestPlugin'
+    assert loader.test_plugin.add(2, 3) == 5
+
+
+def test_snapshot_picks_class_declaring_plugin_methods(plugins_dir, tmp_path):
+    (plugins_dir / 'sample_plugin.py').write_text(
+        PLUGIN_SOURCE + '\n\nclass AaaHelper:\n    pass\n', encoding='utf-8'
+    )
+
+    snapshot = PluginSnapshot.load_or_build(str(plugins_dir), str(tmp_path / 'registry.json'))
+    assert snapshot.plugins()['sample_plugin']['class_name'] == 'SamplePlugin'
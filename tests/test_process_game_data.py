@@ -0,0 +1,34 @@
+# tests/test_process_game_data.py
+import polars as pl
+
+from scripts.data_processing import process_game_data
+from scripts.data_processing.process_game_data import assign_ids, assign_ids_df
+
+
+def test_assign_ids_df_matches_list_version():
+    data = [{'name': '빙글빙글', 'score': 3}, {'name': '없는게임', 'score': 2}, {'name': '뚫어뚫어', 'score': 1}]
+
+    assigned_df, unmatched_df = assign_ids_df(pl.DataFrame(data))
+
+    expected = [game for game in assign_ids([dict(game) for game in data]) if 'id' in game]
+    assert assigned_df.select(['name', 'score', 'id']).to_dicts() == expected
+    assert unmatched_df.to_dicts() == [{'name': '없는게임', 'score': 2}]
+
+
+def test_main_writes_original_records_with_ids(monkeypatch):
+    data = [
+        {'name': '빙글빙글', 'score': 3},
+        {'name': '없는게임', 'score': 2},
+        {'id': 99, 'name': '뚫어뚫어', 'extra': True},
+    ]
+    expected = sorted(assign_ids([dict(game) for game in data]), key=lambda x: x.get('id', float('inf')))
+    saved = []
+    file_utils = process_game_data.plugin_loader.file_utils
+    monkeypatch.setattr(file_utils, 'load_single_json', lambda path: data)
+    monkeypatch.setattr(file_utils, 'save_single_json', lambda path, output: saved.append(output))
+
+    process_game_data.main()
+
+    # 기존 dict의 키 순서를 유지하고, 없는 키를 null로 채우지 않음
+    assert saved == [expected]
+    assert [list(game) for game in saved[0]] == [['id', 'name', 'extra'], ['name', 'score', 'id'], ['name', 'score']]